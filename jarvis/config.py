@@ -178,6 +178,9 @@ class GitHubConfig:
     allowed_repos: list[str] = field(
         default_factory=lambda: _parse_csv_env("GITHUB_ALLOWED_REPOS")
     )
+    etag_cache: bool = field(
+        default_factory=lambda: os.getenv("GITHUB_ETAG_CACHE", "true").lower() != "false"
+    )
 
 
 @dataclass
@@ -202,6 +205,9 @@ class JarvisConfig:
     agent_name: str = "J.A.R.V.I.S"
     greeting: str = "At your service."
     idle_timeout: float = 30.0  # Seconds before returning to wake word listening
+    use_uvloop: bool = field(
+        default_factory=lambda: os.getenv("JARVIS_USE_UVLOOP", "false").lower() == "true"
+    )
 
     @classmethod
     def from_env(cls) -> "JarvisConfig":
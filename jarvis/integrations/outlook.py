@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import logging
+import time
+import weakref
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
@@ -14,12 +18,28 @@ except Exception:  # pragma: no cover
     msal = None
 
 from jarvis.config import config
+from jarvis.jsonutil import loads as json_loads
 from jarvis.storage import get_data_dir
+from jarvis.timeutil import format_utc_iso
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_SCOPES = ["Calendars.ReadWrite", "offline_access"]
 GRAPH_BASE_URL = "https://graph.microsoft.com/v1.0"
+# Graph rejects $batch payloads with more sub-requests than this
+GRAPH_BATCH_LIMIT = 20
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_http_client: Optional[httpx.AsyncClient] = None
+
+# Refresh cached access tokens this many seconds before they expire
+_TOKEN_REFRESH_MARGIN = 60.0
+# Scopes -> (access token, monotonic expiry)
+_token_cache: dict[tuple[str, ...], tuple[str, float]] = {}
+# asyncio.Lock binds to one event loop on Python 3.9, so keep one per loop
+_token_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+    weakref.WeakKeyDictionary()
+)
 
 
 def _get_cache_path() -> Path:
@@ -54,6 +74,23 @@ def _get_client_app() -> msal.PublicClientApplication:
     )
 
 
+def _cached_token(scopes: list[str]) -> Optional[str]:
+    cached = _token_cache.get(tuple(scopes))
+    if cached and cached[1] - _TOKEN_REFRESH_MARGIN > time.monotonic():
+        return cached[0]
+    return None
+
+
+def invalidate_access_token(token: Optional[str] = None) -> None:
+    """Drop cached access tokens (all of them, or only entries holding ``token``)."""
+    if token is None:
+        _token_cache.clear()
+        return
+    for scopes, (cached, _) in list(_token_cache.items()):
+        if cached == token:
+            del _token_cache[scopes]
+
+
 def acquire_access_token(scopes: Optional[list[str]] = None) -> tuple[Optional[str], str]:
     """Acquire an access token using device code flow."""
     if not config.outlook.client_id:
@@ -62,6 +99,10 @@ def acquire_access_token(scopes: Optional[list[str]] = None) -> tuple[Optional[s
         return None, "msal is not installed. Add 'msal' to dependencies."
 
     scopes = scopes or DEFAULT_SCOPES
+    token = _cached_token(scopes)
+    if token:
+        return token, ""
+
     app = _get_client_app()
     accounts = app.get_accounts()
     result = None
@@ -83,38 +124,91 @@ def acquire_access_token(scopes: Optional[list[str]] = None) -> tuple[Optional[s
         error = result.get("error_description") or result.get("error") or "Auth failed."
         return None, error
 
+    expires_in = float(result.get("expires_in") or 0)
+    _token_cache[tuple(scopes)] = (result["access_token"], time.monotonic() + expires_in)
     return result["access_token"], ""
 
 
-def _format_datetime(dt: datetime) -> str:
-    return dt.astimezone(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+async def acquire_access_token_async(
+    scopes: Optional[list[str]] = None,
+) -> tuple[Optional[str], str]:
+    """Acquire an access token without blocking the event loop.
+
+    Cached tokens are returned directly; otherwise a single MSAL call runs in a
+    worker thread while concurrent callers wait for its result.
+    """
+    token = _cached_token(scopes or DEFAULT_SCOPES)
+    if token:
+        return token, ""
+    loop = asyncio.get_running_loop()
+    lock = _token_locks.get(loop)
+    if lock is None:
+        lock = _token_locks[loop] = asyncio.Lock()
+    async with lock:
+        return await asyncio.to_thread(acquire_access_token, scopes)
 
 
 def default_window() -> tuple[str, str]:
     """Return default start/end window (now to 7 days)."""
     now = datetime.now(timezone.utc)
     end = now + timedelta(days=7)
-    return _format_datetime(now), _format_datetime(end)
+    return format_utc_iso(now), format_utc_iso(end)
+
+
+def _raise_for_status(response: httpx.Response, token: str) -> None:
+    if response.status_code == 401:
+        # Revoked or signed-out token: make the next call re-acquire
+        invalidate_access_token(token)
+    response.raise_for_status()
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(timeout=15.0, http2=_HTTP2_AVAILABLE)
+    return _http_client
 
 
 async def graph_get(url: str, token: str, params: Optional[dict] = None) -> dict:
     headers = {"Authorization": f"Bearer {token}"}
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response.json()
+    response = await _get_client().get(url, headers=headers, params=params)
+    _raise_for_status(response, token)
+    return json_loads(response.content)
 
 
 async def graph_post(url: str, token: str, payload: dict) -> dict:
     headers = {"Authorization": f"Bearer {token}"}
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.post(url, headers=headers, json=payload)
-        response.raise_for_status()
-        return response.json()
+    response = await _get_client().post(url, headers=headers, json=payload)
+    _raise_for_status(response, token)
+    return json_loads(response.content)
 
 
 async def graph_delete(url: str, token: str) -> None:
     headers = {"Authorization": f"Bearer {token}"}
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.delete(url, headers=headers)
-        response.raise_for_status()
+    response = await _get_client().delete(url, headers=headers)
+    _raise_for_status(response, token)
+
+
+async def graph_batch(token: str, requests: list[dict]) -> dict[str, dict]:
+    """Send Graph sub-requests through $batch and return their responses by id.
+
+    Each request needs a unique "id", a "method" and a "url" relative to
+    GRAPH_BASE_URL. Requests are split into chunks of GRAPH_BATCH_LIMIT, sent
+    concurrently; per-request failures are reported in each response's "status".
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async def send(chunk: list[dict]) -> list[dict]:
+        response = await _get_client().post(
+            f"{GRAPH_BASE_URL}/$batch", headers=headers, json={"requests": chunk}
+        )
+        _raise_for_status(response, token)
+        return json_loads(response.content).get("responses", [])
+
+    chunks = await asyncio.gather(
+        *(
+            send(requests[start:start + GRAPH_BATCH_LIMIT])
+            for start in range(0, len(requests), GRAPH_BATCH_LIMIT)
+        )
+    )
+    return {item["id"]: item for chunk in chunks for item in chunk}
@@ -0,0 +1,25 @@
+"""Event loop selection for J.A.R.V.I.S entry points."""
+
+from __future__ import annotations
+
+import logging
+
+from jarvis.config import config
+
+logger = logging.getLogger(__name__)
+
+
+def install_uvloop() -> bool:
+    """Install uvloop's event loop policy when enabled and available.
+
+    Call before asyncio.run(). Returns True when uvloop is active.
+    """
+    if not config.use_uvloop:
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("JARVIS_USE_UVLOOP is set but uvloop is not installed")
+        return False
+    uvloop.install()
+    return True
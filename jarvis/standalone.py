@@ -16,6 +16,7 @@ import sounddevice as sd
 
 from jarvis.config import config
 from jarvis.llm.text_client import clear_history, generate_reply
+from jarvis.runtime.eventloop import install_uvloop
 from jarvis.tts.elevenlabs_tts import synthesize_speech
 
 logger = logging.getLogger(__name__)
@@ -259,6 +260,7 @@ def main() -> None:
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%H:%M:%S",
     )
+    install_uvloop()
     try:
         asyncio.run(main_loop())
     except KeyboardInterrupt:
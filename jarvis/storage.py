@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 from pathlib import Path
 
 from jarvis.config import config
@@ -20,15 +21,53 @@ def get_db_path() -> Path:
     return get_data_dir() / "jarvis.db"
 
 
+# Database files whose schema was already created by this process; later
+# connections skip the DDL pass and its commit.
+_initialized_paths: set[Path] = set()
+_init_lock = threading.Lock()
+# Open connections per thread, keyed by database path. sqlite3 connections may only
+# be used on the thread that created them; reusing one keeps its prepared-statement
+# cache warm and skips the open/PRAGMA/migration round-trips on every tool call.
+_local = threading.local()
+_STATEMENT_CACHE_SIZE = 256
+
+
 def get_connection() -> sqlite3.Connection:
-    """Get a SQLite connection and initialize tables if needed."""
+    """Get this thread's SQLite connection, creating and initializing it if needed.
+
+    The connection is shared by later callers on the same thread, so use it as a
+    context manager (commit/rollback) and never close it.
+    """
     path = get_db_path()
-    conn = sqlite3.connect(path)
+    connections: dict[Path, sqlite3.Connection] = _local.__dict__.setdefault("connections", {})
+    conn = connections.get(path)
+    if conn is not None:
+        return conn
+
+    conn = sqlite3.connect(path, cached_statements=_STATEMENT_CACHE_SIZE)
     conn.row_factory = sqlite3.Row
-    _init_db(conn)
+    # Safe with WAL: a crash can lose the last commits but never corrupts the file
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    if path not in _initialized_paths:
+        with _init_lock:
+            if path not in _initialized_paths:
+                # Persistent in the file; lets readers run alongside a writer
+                conn.execute("PRAGMA journal_mode = WAL")
+                _init_db(conn)
+                _initialized_paths.add(path)
+    _migrate(conn)
+    connections[path] = conn
     return conn
 
 
+def close_connections() -> None:
+    """Close this thread's cached connections; the next get_connection reopens."""
+    connections = _local.__dict__.pop("connections", {})
+    for conn in connections.values():
+        conn.close()
+
+
 def _init_db(conn: sqlite3.Connection) -> None:
     """Initialize required tables if they do not exist."""
     cursor = conn.cursor()
@@ -43,6 +82,76 @@ def _init_db(conn: sqlite3.Connection) -> None:
         )
         """
     )
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS memory_tags (
+            memory_id INTEGER NOT NULL,
+            tag TEXT NOT NULL,
+            PRIMARY KEY (tag, memory_id)
+        ) WITHOUT ROWID
+        """
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_memory_tags_memory ON memory_tags(memory_id)"
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS memory_tags_ad AFTER DELETE ON memory BEGIN
+            DELETE FROM memory_tags WHERE memory_id = old.id;
+        END
+        """
+    )
+    # Materialized counts for memory_stats, maintained by triggers and seeded by a
+    # migration, so stats never scan memory or memory_tags
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS memory_counters (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            total INTEGER NOT NULL
+        )
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS memory_tag_counts (
+            tag TEXT PRIMARY KEY,
+            count INTEGER NOT NULL
+        ) WITHOUT ROWID
+        """
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_memory_tag_counts_count ON memory_tag_counts(count DESC)"
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS memory_counters_ai AFTER INSERT ON memory BEGIN
+            UPDATE memory_counters SET total = total + 1 WHERE id = 1;
+        END
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS memory_counters_ad AFTER DELETE ON memory BEGIN
+            UPDATE memory_counters SET total = total - 1 WHERE id = 1;
+        END
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS memory_tag_counts_ai AFTER INSERT ON memory_tags BEGIN
+            INSERT INTO memory_tag_counts (tag, count) VALUES (new.tag, 1)
+            ON CONFLICT(tag) DO UPDATE SET count = count + 1;
+        END
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS memory_tag_counts_ad AFTER DELETE ON memory_tags BEGIN
+            UPDATE memory_tag_counts SET count = count - 1 WHERE tag = old.tag;
+            DELETE FROM memory_tag_counts WHERE tag = old.tag AND count <= 0;
+        END
+        """
+    )
     cursor.execute(
         """
         CREATE TABLE IF NOT EXISTS notes (
@@ -114,4 +223,159 @@ def _init_db(conn: sqlite3.Connection) -> None:
         )
         """
     )
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS github_etags (
+            url TEXT PRIMARY KEY,
+            etag TEXT NOT NULL,
+            body TEXT NOT NULL,
+            fetched_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_start ON calendar_events(start_time)"
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_notes_created ON notes(created_at DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_memory_created ON memory(created_at)")
+    # NOCASE to match LIKE's default case-insensitivity, so prefix LIKEs can seek
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_memory_content_prefix
+        ON memory(content COLLATE NOCASE)
+        """
+    )
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_memory_rank
+        ON memory(importance DESC, created_at DESC)
+        """
+    )
+    # Serves every status filter (briefing's open tasks included), so the older
+    # partial open-tasks index is redundant write overhead
+    cursor.execute("DROP INDEX IF EXISTS idx_tasks_open")
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_tasks_status_created
+        ON tasks(status, created_at DESC)
+        """
+    )
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_routines_name_created
+        ON routines(name, created_at DESC)
+        """
+    )
+    _init_fts(cursor, "contacts", ("name",))
+    # Trigrams index every substring, so MATCH can stand in for content LIKE '%q%'
+    _init_fts(cursor, "memory", ("content",), tokenize="trigram")
     conn.commit()
+
+
+def _init_fts(
+    cursor: sqlite3.Cursor, table: str, columns: tuple[str, ...], tokenize: str = ""
+) -> None:
+    """Create an external-content FTS5 index over table, kept in sync by triggers.
+
+    Does nothing when SQLite was built without FTS5 (or the requested tokenizer);
+    callers fall back to LIKE.
+    """
+    fts = f"{table}_fts"
+    exists = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts,)
+    ).fetchone()
+    if exists:
+        return
+
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"new.{col}" for col in columns)
+    old_values = ", ".join(f"old.{col}" for col in columns)
+    options = f"content='{table}', content_rowid='id'"
+    if tokenize:
+        options += f", tokenize='{tokenize}'"
+    try:
+        cursor.executescript(
+            f"""
+            BEGIN;
+            CREATE VIRTUAL TABLE {fts} USING fts5({cols}, {options});
+            CREATE TRIGGER {table}_fts_ai AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_values});
+            END;
+            CREATE TRIGGER {table}_fts_ad AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_values});
+            END;
+            CREATE TRIGGER {table}_fts_au AFTER UPDATE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_values});
+                INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_values});
+            END;
+            INSERT INTO {fts}({fts}) VALUES ('rebuild');
+            COMMIT;
+            """
+        )
+    except sqlite3.OperationalError:
+        cursor.connection.rollback()
+
+
+def fts_prefix_query(text: str) -> str:
+    """Build an FTS5 MATCH expression requiring every word of text as a prefix."""
+    terms = text.replace('"', '""').split()
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def fts_phrase_query(text: str) -> str:
+    """Build an FTS5 MATCH expression for text as one quoted phrase."""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def split_tags(text: str) -> list[str]:
+    """Split a comma-separated tag string into unique, lowercased tags."""
+    return list(dict.fromkeys(filter(None, (tag.strip().lower() for tag in text.split(",")))))
+
+
+def _migrate_alarm_triggered_at(conn: sqlite3.Connection) -> None:
+    """Rewrite CURRENT_TIMESTAMP-style triggered_at values as ISO UTC with Z."""
+    conn.execute(
+        """
+        UPDATE alarms
+        SET triggered_at = replace(triggered_at, ' ', 'T') || 'Z'
+        WHERE triggered_at GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9] *'
+        """
+    )
+
+
+def _migrate_memory_tags(conn: sqlite3.Connection) -> None:
+    """Backfill memory_tags from the comma-separated memory.tags column."""
+    rows = conn.execute(
+        "SELECT id, tags FROM memory WHERE tags IS NOT NULL AND tags != ''"
+    ).fetchall()
+    conn.executemany(
+        "INSERT OR IGNORE INTO memory_tags (memory_id, tag) VALUES (?, ?)",
+        [(row[0], tag) for row in rows for tag in split_tags(row[1])],
+    )
+
+
+def _migrate_memory_counters(conn: sqlite3.Connection) -> None:
+    """Seed the memory_stats counter tables from the current rows."""
+    conn.execute(
+        "INSERT OR REPLACE INTO memory_counters (id, total) SELECT 1, COUNT(*) FROM memory"
+    )
+    conn.execute("DELETE FROM memory_tag_counts")
+    conn.execute(
+        """
+        INSERT INTO memory_tag_counts (tag, count)
+        SELECT tag, COUNT(*) FROM memory_tags GROUP BY tag
+        """
+    )
+
+
+# One-off data migrations, applied in order and tracked via PRAGMA user_version
+_MIGRATIONS = (_migrate_alarm_triggered_at, _migrate_memory_tags, _migrate_memory_counters)
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Apply pending migrations to the database."""
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    for target, migration in enumerate(_MIGRATIONS[version:], start=version + 1):
+        migration(conn)
+        conn.execute(f"PRAGMA user_version = {target}")
+        conn.commit()
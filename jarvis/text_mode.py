@@ -8,6 +8,7 @@ import inspect
 import shlex
 from typing import Any, Callable
 
+from jarvis.runtime.eventloop import install_uvloop
 from jarvis.tools import get_all_tools
 
 
@@ -116,6 +117,7 @@ def main() -> None:
     args = parser.parse_args()
 
     tool_map = _build_tool_map()
+    install_uvloop()
 
     if args.command:
         command = args.command.strip()
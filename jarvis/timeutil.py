@@ -0,0 +1,12 @@
+"""Timestamp helpers for J.A.R.V.I.S."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+UTC_ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def format_utc_iso(dt: datetime) -> str:
+    """Format an aware datetime as second-precision ISO 8601 UTC with a Z suffix."""
+    return dt.astimezone(timezone.utc).strftime(UTC_ISO_FORMAT)
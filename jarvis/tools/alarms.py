@@ -3,22 +3,34 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
 import re
-import uuid
+import secrets
+import sys
 from datetime import datetime, timedelta, timezone
-from typing import Awaitable, Callable, Dict, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from livekit.agents import llm
 
 from jarvis.storage import get_connection
+from jarvis.timeutil import format_utc_iso as _format_iso
 
 logger = logging.getLogger(__name__)
 
-# Active quick timers (in-memory, for short duration timers)
-_ACTIVE_TIMERS: Dict[str, asyncio.Task] = {}
+# Active quick timers (in-memory, for short duration timers): ID -> loop-time deadline.
+# A single runner task sleeps until the earliest deadline in _TIMER_HEAP; heap
+# entries whose ID is no longer active (cancelled) are skipped when popped.
+_ACTIVE_TIMERS: Dict[str, float] = {}
+_TIMER_HEAP: List[Tuple[float, str]] = []
+_timer_runner: Optional[asyncio.Task] = None
+_timer_wake: Optional[asyncio.Event] = None
 _TIMER_LABELS: Dict[str, str] = {}
+# Lowercased label -> timer IDs with that label, oldest first (dict as ordered set)
+_LABEL_TO_TIMERS: Dict[str, Dict[str, None]] = {}
 _timer_callback: Optional[Callable[[str], Awaitable[None]]] = None
+# Timer notifications in flight; held so they aren't garbage-collected mid-run
+_timer_fire_tasks: Set[asyncio.Task] = set()
 
 # Number words for natural language parsing
 _NUMBER_WORDS = {
@@ -30,6 +42,9 @@ _NUMBER_WORDS = {
     "a": 1, "an": 1, "half": 30,  # "half a minute" = 30 seconds
 }
 
+# datetime.fromisoformat() accepts a trailing "Z" from Python 3.11 onwards
+_FROMISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+
 _scheduler_task: Optional[asyncio.Task] = None
 _alarm_callback: Optional[Callable[[str], Awaitable[None]]] = None
 
@@ -142,8 +157,10 @@ def _parse_fire_time(value: str) -> Optional[datetime]:
             delta = timedelta(days=amount)
         return _utc_now() + delta
 
+    if not _FROMISO_ACCEPTS_Z and raw.endswith("Z"):
+        raw = raw[:-1] + "+00:00"
     try:
-        parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        parsed = datetime.fromisoformat(raw)
     except ValueError:
         return None
 
@@ -152,10 +169,6 @@ def _parse_fire_time(value: str) -> Optional[datetime]:
     return parsed.astimezone(timezone.utc)
 
 
-def _format_iso(dt: datetime) -> str:
-    return dt.astimezone(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
-
-
 @llm.function_tool
 async def add_alarm(title: str, fire_at: str, message: str = "") -> str:
     """Schedule an alarm using ISO time or 'in X minutes/hours/days'."""
@@ -180,31 +193,31 @@ async def add_alarm(title: str, fire_at: str, message: str = "") -> str:
     return f"Alarm set for {_format_iso(fire_time)}: {title}"
 
 
+# Fixed SQL text per query shape so sqlite3's statement cache can reuse it
+_LIST_ALARMS_SQL = {
+    status: "SELECT id, title, fire_at, status FROM alarms"
+    + ("" if status == "all" else f" WHERE status = '{status}'")
+    + " ORDER BY fire_at ASC LIMIT ?"
+    for status in ("pending", "triggered", "cancelled", "all")
+}
+
+
 @llm.function_tool
 async def list_alarms(status: str = "pending", limit: int = 10) -> str:
     """List alarms by status (pending, triggered, cancelled, all)."""
     status = status.strip().lower() or "pending"
-    if status not in {"pending", "triggered", "cancelled", "all"}:
-        status = "pending"
-
+    sql = _LIST_ALARMS_SQL.get(status, _LIST_ALARMS_SQL["pending"])
     limit = max(1, min(100, limit))
-    sql = "SELECT id, title, fire_at, status FROM alarms"
-    params: list[object] = []
-    if status != "all":
-        sql += " WHERE status = ?"
-        params.append(status)
-    sql += " ORDER BY fire_at ASC LIMIT ?"
-    params.append(limit)
 
     with get_connection() as conn:
-        rows = conn.execute(sql, params).fetchall()
+        rows = conn.execute(sql, (limit,)).fetchall()
 
     if not rows:
         return "No alarms found."
 
     lines = [
-        f"{row['id']}: {row['title']} at {row['fire_at']} [{row['status']}]"
-        for row in rows
+        f"{alarm_id}: {title} at {fire_at} [{alarm_status}]"
+        for alarm_id, title, fire_at, alarm_status in rows
     ]
     return "Alarms:\n" + "\n".join(lines)
 
@@ -232,21 +245,94 @@ async def cancel_alarm(alarm_id: int) -> str:
 def _format_duration(seconds: int) -> str:
     """Format seconds into human-readable duration."""
     if seconds < 60:
-        return f"{seconds} second{'s' if seconds != 1 else ''}"
-    elif seconds < 3600:
-        mins = seconds // 60
-        secs = seconds % 60
-        result = f"{mins} minute{'s' if mins != 1 else ''}"
+        return f"{seconds} second{'' if seconds == 1 else 's'}"
+
+    parts: list[str] = []
+    if seconds < 3600:
+        mins, secs = divmod(seconds, 60)
+        parts.append(f"{mins} minute{'' if mins == 1 else 's'}")
         if secs > 0:
-            result += f" {secs} second{'s' if secs != 1 else ''}"
-        return result
+            parts.append(f"{secs} second{'' if secs == 1 else 's'}")
     else:
         hours = seconds // 3600
         mins = (seconds % 3600) // 60
-        result = f"{hours} hour{'s' if hours != 1 else ''}"
+        parts.append(f"{hours} hour{'' if hours == 1 else 's'}")
         if mins > 0:
-            result += f" {mins} minute{'s' if mins != 1 else ''}"
-        return result
+            parts.append(f"{mins} minute{'' if mins == 1 else 's'}")
+    return " ".join(parts)
+
+
+def _forget_timer_label(timer_id: str) -> None:
+    """Drop a timer's label and its reverse-index entry."""
+    label = _TIMER_LABELS.pop(timer_id, None)
+    if not label:
+        return
+    key = label.lower()
+    timer_ids = _LABEL_TO_TIMERS.get(key)
+    if timer_ids is not None:
+        timer_ids.pop(timer_id, None)
+        if not timer_ids:
+            del _LABEL_TO_TIMERS[key]
+
+
+async def _fire_timer(label: str) -> None:
+    message = f"Timer{f' for {label}' if label else ''} finished!"
+
+    # Use callback if available (for voice notification)
+    if _timer_callback:
+        try:
+            await _timer_callback(message)
+        except Exception as e:
+            logger.error("Timer callback failed: %s", e)
+    else:
+        logger.info(message)
+
+
+async def _run_timers(wake: asyncio.Event) -> None:
+    """Fire quick timers in deadline order; exits once none remain."""
+    loop = asyncio.get_running_loop()
+    while True:
+        wake.clear()
+        while _TIMER_HEAP and _ACTIVE_TIMERS.get(_TIMER_HEAP[0][1]) != _TIMER_HEAP[0][0]:
+            heapq.heappop(_TIMER_HEAP)
+        if not _TIMER_HEAP:
+            return
+
+        deadline, timer_id = _TIMER_HEAP[0]
+        delay = deadline - loop.time()
+        if delay > 0:
+            try:
+                await asyncio.wait_for(wake.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            continue
+
+        heapq.heappop(_TIMER_HEAP)
+        del _ACTIVE_TIMERS[timer_id]
+        label = _TIMER_LABELS.get(timer_id, "")
+        _forget_timer_label(timer_id)
+        # A slow notification (e.g. speaking) must not hold back later timers
+        task = asyncio.create_task(_fire_timer(label))
+        _timer_fire_tasks.add(task)
+        task.add_done_callback(_timer_fire_tasks.discard)
+
+
+def _wake_timer_runner() -> None:
+    """Start the timer runner on this loop, or wake it to re-check the heap."""
+    global _timer_runner, _timer_wake
+    loop = asyncio.get_running_loop()
+    if (
+        _timer_runner is None
+        or _timer_runner.done()
+        or _timer_runner.get_loop() is not loop
+        or _timer_wake is None
+    ):
+        if not _TIMER_HEAP:
+            return
+        _timer_wake = asyncio.Event()
+        _timer_runner = asyncio.create_task(_run_timers(_timer_wake))
+    else:
+        _timer_wake.set()
 
 
 @llm.function_tool
@@ -268,31 +354,19 @@ async def set_timer(duration: str, label: str = "") -> str:
     if seconds is None or seconds <= 0:
         return "Could not parse duration. Try '5 minutes', '30 seconds', '2m30s', or 'five minutes'."
 
-    timer_id = str(uuid.uuid4())[:8]
+    timer_id = secrets.token_hex(4)
+    while timer_id in _ACTIVE_TIMERS:
+        timer_id = secrets.token_hex(4)
     label_text = f" ({label})" if label else ""
 
     if label:
         _TIMER_LABELS[timer_id] = label
+        _LABEL_TO_TIMERS.setdefault(label.lower(), {})[timer_id] = None
 
-    async def _timer_task(tid: str, secs: int, lbl: str):
-        try:
-            await asyncio.sleep(secs)
-            message = f"Timer{f' for {lbl}' if lbl else ''} finished!"
-
-            # Use callback if available (for voice notification)
-            if _timer_callback:
-                try:
-                    await _timer_callback(message)
-                except Exception as e:
-                    logger.error("Timer callback failed: %s", e)
-            else:
-                logger.info(message)
-        finally:
-            _ACTIVE_TIMERS.pop(tid, None)
-            _TIMER_LABELS.pop(tid, None)
-
-    task = asyncio.create_task(_timer_task(timer_id, seconds, label))
-    _ACTIVE_TIMERS[timer_id] = task
+    deadline = asyncio.get_running_loop().time() + seconds
+    _ACTIVE_TIMERS[timer_id] = deadline
+    heapq.heappush(_TIMER_HEAP, (deadline, timer_id))
+    _wake_timer_runner()
 
     return f"Timer set for {_format_duration(seconds)}{label_text}. Timer ID: {timer_id}"
 
@@ -311,17 +385,16 @@ async def cancel_timer(timer_id: str = "", label: str = "") -> str:
 
     # Resolve by label if no ID provided
     if label and not timer_id:
-        for tid, lab in list(_TIMER_LABELS.items()):
-            if lab and lab.lower() == label.lower():
-                timer_id = tid
-                break
+        # Most recently set timer with this label wins
+        timer_ids = _LABEL_TO_TIMERS.get(label.lower())
+        timer_id = next(reversed(timer_ids)) if timer_ids else ""
 
     if not timer_id or timer_id not in _ACTIVE_TIMERS:
         return "Timer not found. Use list_timers to see active timers."
 
-    task = _ACTIVE_TIMERS.pop(timer_id)
-    task.cancel()
-    _TIMER_LABELS.pop(timer_id, None)
+    del _ACTIVE_TIMERS[timer_id]
+    _forget_timer_label(timer_id)
+    _wake_timer_runner()
     return f"Timer {timer_id} cancelled."
 
 
@@ -351,6 +424,7 @@ def set_timer_callback(callback: Callable[[str], Awaitable[None]]) -> None:
 async def _alarm_scheduler() -> None:
     while True:
         due = []
+        # One timestamp per tick: used for the due check and as triggered_at.
         now = _format_iso(_utc_now())
         with get_connection() as conn:
             due = conn.execute(
@@ -367,16 +441,16 @@ async def _alarm_scheduler() -> None:
                 conn.executemany(
                     """
                     UPDATE alarms
-                    SET status = 'triggered', triggered_at = CURRENT_TIMESTAMP
+                    SET status = 'triggered', triggered_at = ?
                     WHERE id = ?
                     """,
-                    [(row["id"],) for row in due],
+                    [(now, row[0]) for row in due],
                 )
                 conn.commit()
 
         if due and _alarm_callback:
-            for row in due:
-                message = row["message"] or row["title"]
+            for _, title, message in due:
+                message = message or title
                 try:
                     await _alarm_callback(f"Alarm: {message}")
                 except Exception as exc:
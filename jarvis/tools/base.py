@@ -2,5 +2,124 @@
 
 from __future__ import annotations
 
-# This module is kept for potential future use
-# Tools are now directly decorated with @llm.function_tool
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import AbstractSet, Callable, Iterator, Optional, Sequence, TypeVar
+
+# Tools are directly decorated with @llm.function_tool; this module only holds
+# shared helpers for their blocking work.
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+IO_CHUNK_SIZE = 64
+
+# Bounded pool for blocking file I/O so large trees never block the event loop
+# or spawn an unbounded number of threads.
+IO_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix="jarvis-io",
+)
+
+
+def iter_files(root: str, skip: AbstractSet[str] = frozenset()) -> Iterator[str]:
+    """Yield paths of files under root, skipping entries whose name is in skip.
+
+    Uses os.scandir so file/dir checks come from the cached d_type instead of an
+    extra stat() per entry. Directory symlinks are not followed.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.name in skip:
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+
+
+async def map_chunks(
+    fn: Callable[[Sequence[T]], R],
+    items: Sequence[T],
+    chunk_size: int = IO_CHUNK_SIZE,
+    done: Optional[Callable[[R], bool]] = None,
+) -> list[R]:
+    """Run fn over slices of items on IO_EXECUTOR and return results in input order.
+
+    When done returns True for a result, later chunks that have not started yet are
+    cancelled and their results are not collected.
+    """
+    loop = asyncio.get_running_loop()
+    futures = [
+        loop.run_in_executor(IO_EXECUTOR, fn, items[start:start + chunk_size])
+        for start in range(0, len(items), chunk_size)
+    ]
+    results: list[R] = []
+    try:
+        for future in futures:
+            result = await future
+            results.append(result)
+            if done is not None and done(result):
+                break
+    finally:
+        for future in futures:
+            future.cancel()
+    return results
+
+
+async def kill_process(process: asyncio.subprocess.Process, timeout: float = 1.0) -> None:
+    """Kill a timed-out child and reap it so its pipes and PID are released."""
+    try:
+        process.kill()
+    except ProcessLookupError:
+        pass
+    try:
+        await asyncio.wait_for(process.wait(), timeout=timeout)
+    except Exception:
+        pass
+
+
+async def read_limited(stream: asyncio.StreamReader, limit: int) -> tuple[bytes, bool]:
+    """Read stream to EOF, stopping once more than limit bytes have arrived.
+
+    Returns (data, truncated); when truncated, data holds at most limit bytes and
+    the caller should stop the writer, since the rest is never read.
+    """
+    buffer = bytearray()
+    while True:
+        chunk = await stream.read(8192)
+        if not chunk:
+            return bytes(buffer), False
+        buffer += chunk
+        if len(buffer) > limit:
+            return bytes(buffer[:limit]), True
+
+
+async def run_command(
+    cmd: Sequence[str], timeout: float, input_data: Optional[bytes] = None
+) -> tuple[int, str]:
+    """Run cmd without a shell and return (returncode, output).
+
+    Output is stdout, or stderr when stdout is empty, decoded with replacement
+    characters. On timeout the child is killed and reaped before
+    asyncio.TimeoutError propagates; spawn errors propagate unchanged.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE if input_data is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(input_data), timeout=timeout)
+    except asyncio.TimeoutError:
+        await kill_process(process)
+        raise
+    output = (stdout or stderr).decode("utf-8", errors="replace").strip()
+    return process.returncode or 0, output
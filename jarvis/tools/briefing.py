@@ -2,19 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import sqlite3
 from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Optional
 
 from livekit.agents import llm
 
 from jarvis.config import config
 from jarvis.integrations.outlook import (
     GRAPH_BASE_URL,
-    acquire_access_token,
+    acquire_access_token_async,
     graph_get,
 )
 from jarvis.storage import get_connection
+from jarvis.timeutil import format_utc_iso as _format_iso
 from jarvis.tools.web import get_weather
 
+logger = logging.getLogger(__name__)
+
 
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
@@ -24,12 +31,8 @@ def _window_days() -> int:
     return max(1, min(30, config.briefing.brief_days))
 
 
-def _format_iso(dt: datetime) -> str:
-    return dt.isoformat(timespec="seconds").replace("+00:00", "Z")
-
-
 async def _fetch_outlook_events(limit: int = 5) -> list[str]:
-    token, error = acquire_access_token()
+    token, error = await acquire_access_token_async()
     if not token:
         return [f"Outlook: {error}"]
 
@@ -41,6 +44,7 @@ async def _fetch_outlook_events(limit: int = 5) -> list[str]:
         "endDateTime": _format_iso(end),
         "$top": str(limit),
         "$orderby": "start/dateTime",
+        "$select": "subject,start,end",
     }
 
     data = await graph_get(f"{GRAPH_BASE_URL}/me/calendarView", token, params=params)
@@ -57,48 +61,70 @@ async def _fetch_outlook_events(limit: int = 5) -> list[str]:
     return lines
 
 
-def _fetch_local_events(limit: int = 5) -> list[str]:
-    now = _utc_now().isoformat(timespec="seconds")
-    with get_connection() as conn:
-        rows = conn.execute(
-            """
-            SELECT title, start_time, end_time, location
-            FROM calendar_events
-            WHERE start_time >= ?
-            ORDER BY start_time ASC
-            LIMIT ?
-            """,
-            (now, limit),
-        ).fetchall()
+def _fetch_local_events(conn: sqlite3.Connection, limit: int = 5) -> list[str]:
+    now = _format_iso(_utc_now())
+    rows = conn.execute(
+        """
+        SELECT title, start_time, end_time, location
+        FROM calendar_events
+        WHERE start_time >= ?
+        ORDER BY start_time ASC
+        LIMIT ?
+        """,
+        (now, limit),
+    ).fetchall()
 
     lines = []
-    for row in rows:
-        end_time = f" - {row['end_time']}" if row["end_time"] else ""
-        location = f" @ {row['location']}" if row["location"] else ""
-        lines.append(f"{row['title']} ({row['start_time']}{end_time}){location}")
+    for title, start_time, end_time, location in rows:
+        end_text = f" - {end_time}" if end_time else ""
+        location_text = f" @ {location}" if location else ""
+        lines.append(f"{title} ({start_time}{end_text}){location_text}")
     return lines
 
 
-def _fetch_tasks(limit: int = 5) -> list[str]:
-    with get_connection() as conn:
-        rows = conn.execute(
-            """
-            SELECT content, due_date, priority
-            FROM tasks
-            WHERE status = 'open'
-            ORDER BY created_at DESC
-            LIMIT ?
-            """,
-            (limit,),
-        ).fetchall()
+def _fetch_tasks(conn: sqlite3.Connection, limit: int = 5) -> list[str]:
+    rows = conn.execute(
+        """
+        SELECT content, due_date, priority
+        FROM tasks
+        WHERE status = 'open'
+        ORDER BY created_at DESC
+        LIMIT ?
+        """,
+        (limit,),
+    ).fetchall()
 
     lines = []
-    for row in rows:
-        due = f" (due {row['due_date']})" if row["due_date"] else ""
-        lines.append(f"{row['content']} [{row['priority']}] {due}")
+    for content, due_date, priority in rows:
+        parts = [content, f"[{priority}]"]
+        if due_date:
+            parts.append(f"(due {due_date})")
+        lines.append(" ".join(parts))
     return lines
 
 
+def _fetch_local(include_tasks: bool, include_events: bool) -> dict[str, list[str]]:
+    """Read tasks and local events over a single connection."""
+    results = {}
+    with get_connection() as conn:
+        if include_tasks:
+            results["tasks"] = _fetch_tasks(conn)
+        if include_events:
+            results["events"] = _fetch_local_events(conn)
+    return results
+
+
+async def _pick(job: Awaitable[dict[str, list[str]]], key: str) -> list[str]:
+    return (await job)[key]
+
+
+async def _fetch_weather(city: str) -> str:
+    weather_city = city.strip() or config.briefing.weather_city
+    if not weather_city:
+        return "Weather: set JARVIS_WEATHER_CITY or pass a city."
+    return await get_weather(weather_city)
+
+
 @llm.function_tool
 async def daily_brief(
     city: str = "",
@@ -108,31 +134,39 @@ async def daily_brief(
     include_outlook: bool = True,
 ) -> str:
     """Get a daily briefing summary."""
-    lines = []
-
+    # Sources are independent, so fetch them concurrently. Tasks and local
+    # events share one worker-thread DB read that overlaps the HTTP calls.
+    # Each section is (title, text when empty, job).
+    sections: list[tuple[str, Optional[str], Awaitable[Any]]] = []
     if include_weather:
-        weather_city = city.strip() or config.briefing.weather_city
-        if weather_city:
-            lines.append(await get_weather(weather_city))
-        else:
-            lines.append("Weather: set JARVIS_WEATHER_CITY or pass a city.")
-
-    if include_tasks:
-        tasks = _fetch_tasks()
-        if tasks:
-            lines.append("Tasks: " + "; ".join(tasks))
-        else:
-            lines.append("Tasks: none due.")
-
-    if include_local_calendar:
-        events = _fetch_local_events()
-        if events:
-            lines.append("Local calendar: " + "; ".join(events))
-
+        sections.append(("Weather", None, _fetch_weather(city)))
+    if include_tasks or include_local_calendar:
+        local = asyncio.ensure_future(
+            asyncio.to_thread(_fetch_local, include_tasks, include_local_calendar)
+        )
+        if include_tasks:
+            sections.append(("Tasks", "Tasks: none due.", _pick(local, "tasks")))
+        if include_local_calendar:
+            sections.append(("Local calendar", None, _pick(local, "events")))
     if include_outlook:
-        outlook_events = await _fetch_outlook_events()
-        if outlook_events:
-            lines.append("Outlook: " + "; ".join(outlook_events))
+        sections.append(("Outlook", None, _fetch_outlook_events()))
+
+    results = await asyncio.gather(*(job for _, _, job in sections), return_exceptions=True)
+
+    lines = []
+    for (title, empty_text, _), result in zip(sections, results):
+        if isinstance(result, Exception):
+            logger.warning("Briefing %s fetch failed: %s", title, result)
+            lines.append(f"{title}: unavailable.")
+        elif isinstance(result, BaseException):
+            raise result
+        elif isinstance(result, str):
+            # Weather arrives as a ready-made line
+            lines.append(result)
+        elif result:
+            lines.append(f"{title}: " + "; ".join(result))
+        elif empty_text:
+            lines.append(empty_text)
 
     if not lines:
         return "Nothing on the radar yet."
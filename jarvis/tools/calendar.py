@@ -35,6 +35,18 @@ async def add_calendar_event(
     return f"Event added: {title} at {start_time}"
 
 
+_EVENTS_SELECT = "SELECT id, title, start_time, end_time, location FROM calendar_events"
+_EVENTS_ORDER = " ORDER BY start_time ASC LIMIT ?"
+
+# Fixed SQL text per (has start, has end) so sqlite3's statement cache can reuse it
+_LIST_EVENTS_SQL = {
+    (False, False): _EVENTS_SELECT + _EVENTS_ORDER,
+    (True, False): _EVENTS_SELECT + " WHERE start_time >= ?" + _EVENTS_ORDER,
+    (False, True): _EVENTS_SELECT + " WHERE start_time <= ?" + _EVENTS_ORDER,
+    (True, True): _EVENTS_SELECT + " WHERE start_time >= ? AND start_time <= ?" + _EVENTS_ORDER,
+}
+
+
 @llm.function_tool
 async def list_calendar_events(
     start_date: str = "",
@@ -46,36 +58,21 @@ async def list_calendar_events(
     start_date = start_date.strip()
     end_date = end_date.strip()
 
-    sql = "SELECT id, title, start_time, end_time, location FROM calendar_events"
-    params: list[object] = []
-    conditions = []
-
-    if start_date:
-        conditions.append("start_time >= ?")
-        params.append(start_date)
-    if end_date:
-        conditions.append("start_time <= ?")
-        params.append(end_date)
-
-    if conditions:
-        sql += " WHERE " + " AND ".join(conditions)
-
-    sql += " ORDER BY start_time ASC LIMIT ?"
+    params = [value for value in (start_date, end_date) if value]
     params.append(limit)
 
     with get_connection() as conn:
+        sql = _LIST_EVENTS_SQL[(bool(start_date), bool(end_date))]
         rows = conn.execute(sql, params).fetchall()
 
     if not rows:
         return "No events found."
 
     lines = []
-    for row in rows:
-        end_time = f" - {row['end_time']}" if row["end_time"] else ""
-        location = f" @ {row['location']}" if row["location"] else ""
-        lines.append(
-            f"{row['id']}: {row['title']} ({row['start_time']}{end_time}){location}"
-        )
+    for event_id, title, start_time, end_time, location in rows:
+        end_text = f" - {end_time}" if end_time else ""
+        location_text = f" @ {location}" if location else ""
+        lines.append(f"{event_id}: {title} ({start_time}{end_text}){location_text}")
 
     return "Events:\n" + "\n".join(lines)
 
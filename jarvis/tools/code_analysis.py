@@ -3,19 +3,27 @@
 from __future__ import annotations
 
 import ast
+import asyncio
 import difflib
+import functools
+import hashlib
+import itertools
 import os
 import re
 import subprocess
-from collections import Counter, defaultdict
+import threading
+import time
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional, Sequence
 
 from livekit.agents import llm
 
 from jarvis.config import config
 from jarvis.llm.text_client import generate_reply
+from jarvis.tools.base import iter_files, map_chunks
 from jarvis.tools.safety import check_path_safety
 
 
@@ -35,31 +43,77 @@ def _run_git(args: list[str], cwd: Path) -> tuple[int, str]:
         return 1, str(exc)
 
 
-def _list_repo_files(root: Path) -> list[Path]:
-    """List files respecting .gitignore when possible."""
-    code, _ = _run_git(["rev-parse", "--is-inside-work-tree"], root)
+# Git listings are reused while .git/index and .git/HEAD are unchanged. New untracked
+# files and working-tree deletions touch neither, so entries also expire after a short TTL.
+_REPO_FILES_CACHE_SIZE = 16
+_REPO_FILES_TTL = 30.0
+_repo_files_cache: OrderedDict[Path, tuple[tuple[int, int], float, list[Path]]] = OrderedDict()
+_repo_files_lock = threading.Lock()
+
+
+def _git_stamp(root: Path) -> Optional[tuple[int, int]]:
+    for directory in (root, *root.parents):
+        git_dir = directory / ".git"
+        if git_dir.is_dir():
+            try:
+                return (
+                    (git_dir / "index").stat().st_mtime_ns,
+                    (git_dir / "HEAD").stat().st_mtime_ns,
+                )
+            except OSError:
+                return None
+        if git_dir.exists():
+            # Worktrees and submodules use a .git file; don't cache those.
+            return None
+    return None
+
+
+def _iter_repo_files(root: Path) -> Iterator[Path]:
+    """Yield files respecting .gitignore when possible.
+
+    Only existing regular files are yielded (tracked files deleted from the working
+    tree are dropped), so callers need no is_file() check of their own. Outside git
+    the directory walk is lazy, so stopping early skips the rest of the tree.
+    """
+    stamp = _git_stamp(root)
+    cached_files: Optional[list[Path]] = None
+    if stamp is not None:
+        with _repo_files_lock:
+            cached = _repo_files_cache.get(root)
+            if cached is not None and cached[0] == stamp and cached[1] > time.monotonic():
+                _repo_files_cache.move_to_end(root)
+                cached_files = cached[2]
+    if cached_files is not None:
+        yield from cached_files
+        return
+
+    # One NUL-delimited listing covers tracked and untracked-but-not-ignored files,
+    # and keeps paths with spaces or non-ASCII names unquoted. With -t, tracked files
+    # missing from the working tree are listed a second time tagged "R".
+    code, output = _run_git(
+        ["ls-files", "-z", "-t", "--cached", "--others", "--deleted", "--exclude-standard"],
+        root,
+    )
     if code != 0:
-        files: list[Path] = []
-        for path in root.rglob("*"):
-            if ".git" in path.parts:
-                continue
-            if path.is_file():
-                files.append(path)
-        return files
-
-    tracked_code, tracked_out = _run_git(["ls-files"], root)
-    other_code, other_out = _run_git(["ls-files", "--others", "--exclude-standard"], root)
-    if tracked_code != 0:
-        return []
-
-    rel_files = []
-    for line in (tracked_out.splitlines() + other_out.splitlines()):
-        line = line.strip()
-        if not line:
-            continue
-        rel_files.append(Path(line))
+        for file_path in iter_files(str(root), skip={".git"}):
+            yield Path(file_path)
+        return
+
+    entries = [entry for entry in output.split("\0") if entry]
+    deleted = {entry[2:] for entry in entries if entry[0] == "R"}
+    files = [root / entry[2:] for entry in entries if entry[2:] not in deleted]
+    if stamp is not None:
+        with _repo_files_lock:
+            _repo_files_cache[root] = (stamp, time.monotonic() + _REPO_FILES_TTL, files)
+            _repo_files_cache.move_to_end(root)
+            if len(_repo_files_cache) > _REPO_FILES_CACHE_SIZE:
+                _repo_files_cache.popitem(last=False)
+    yield from files
 
-    return [root / rel for rel in rel_files]
+
+def _list_repo_files(root: Path) -> list[Path]:
+    """List files respecting .gitignore when possible (see _iter_repo_files)."""
+    return list(_iter_repo_files(root))
 
 
 @dataclass
@@ -69,70 +123,106 @@ class PythonSymbolIndex:
     imports: list[str]
 
 
-def _analyze_python_code(source: str) -> PythonSymbolIndex:
-    tree = ast.parse(source)
-    functions: list[str] = []
-    classes: list[str] = []
-    imports: list[str] = []
-
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            functions.append(node.name)
-        elif isinstance(node, ast.ClassDef):
-            classes.append(node.name)
-        elif isinstance(node, ast.Import):
-            for alias in node.names:
-                imports.append(alias.name)
-        elif isinstance(node, ast.ImportFrom):
-            module = node.module or ""
-            for alias in node.names:
-                imports.append(f"{module}:{alias.name}" if module else alias.name)
+class _SymbolVisitor(ast.NodeVisitor):
+    """Collect definitions and imports without descending into function bodies."""
+
+    _BODY_FIELDS = ("body", "orelse", "finalbody", "handlers")
+
+    def __init__(self) -> None:
+        self.functions: set[str] = set()
+        self.classes: set[str] = set()
+        self.imports: set[str] = set()
+
+    def generic_visit(self, node: ast.AST) -> None:
+        # Only follow statement lists (module, if/try/with/loop blocks); never expressions.
+        for field in self._BODY_FIELDS:
+            for child in getattr(node, field, ()):
+                self.visit(child)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.functions.add(node.name)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.classes.add(node.name)
+        self.generic_visit(node)
+
+    def visit_Import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            self.imports.add(alias.name)
 
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        module = node.module or ""
+        for alias in node.names:
+            self.imports.add(f"{module}:{alias.name}" if module else alias.name)
+
+
+def _analyze_python_code(source: str) -> PythonSymbolIndex:
+    visitor = _SymbolVisitor()
+    visitor.visit(ast.parse(source))
     return PythonSymbolIndex(
-        functions=sorted(set(functions)),
-        classes=sorted(set(classes)),
-        imports=sorted(set(imports)),
+        functions=sorted(visitor.functions),
+        classes=sorted(visitor.classes),
+        imports=sorted(visitor.imports),
     )
 
 
+# Best-effort extraction for non-Python sources: one pass over the whole file, with
+# the alternative that matched telling us the symbol kind. Whitespace is limited to
+# [ \t] so no match can span lines.
+_NON_PYTHON_RE = re.compile(
+    r"^[ \t]*(?:"
+    r"function[ \t]+(?P<function>[A-Za-z_][A-Za-z0-9_]*)[ \t]*\("
+    r"|def[ \t]+(?P<def>[A-Za-z_][A-Za-z0-9_]*)[ \t]*\("
+    r"|(?P<arrow>[A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*\([^)\n]*\)[ \t]*=>"
+    r"|class[ \t]+(?P<class>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|import[ \t]+(?P<import>[A-Za-z0-9_./-]+)"
+    r"|from[ \t]+(?P<from>[A-Za-z0-9_./-]+)[ \t]+import[ \t]"
+    r")",
+    re.MULTILINE,
+)
+_NON_PYTHON_KINDS = {
+    "function": "functions",
+    "def": "functions",
+    "arrow": "functions",
+    "class": "classes",
+    "import": "imports",
+    "from": "imports",
+}
+
+
 def _analyze_non_python_code(source: str) -> dict[str, list[str]]:
-    # Best-effort regex-based extraction.
-    function_patterns = [
-        r"^\s*function\s+([A-Za-z_][A-Za-z0-9_]*)\s*\(",
-        r"^\s*def\s+([A-Za-z_][A-Za-z0-9_]*)\s*\(",
-        r"^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*\([^)]*\)\s*=>",
-    ]
-    class_patterns = [
-        r"^\s*class\s+([A-Za-z_][A-Za-z0-9_]*)",
-    ]
-    import_patterns = [
-        r"^\s*import\s+([A-Za-z0-9_./-]+)",
-        r"^\s*from\s+([A-Za-z0-9_./-]+)\s+import\s+",
-    ]
+    found: dict[str, set[str]] = {"functions": set(), "classes": set(), "imports": set()}
+    for match in _NON_PYTHON_RE.finditer(source):
+        group = match.lastgroup
+        found[_NON_PYTHON_KINDS[group]].add(match.group(group))
+
+    return {kind: sorted(names) for kind, names in found.items()}
+
+
+_ANALYSIS_CACHE_SIZE = 256
+_analysis_cache: OrderedDict[tuple[bool, bytes], Any] = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+
+def _analyze_source(data: bytes, is_python: bool) -> Any:
+    """Analyze file bytes, reusing the result for content seen before."""
+    key = (is_python, hashlib.sha256(data).digest())
+    with _analysis_cache_lock:
+        cached = _analysis_cache.get(key)
+        if cached is not None:
+            _analysis_cache.move_to_end(key)
+            return cached
+
+    source = data.decode("utf-8", errors="replace")
+    result = _analyze_python_code(source) if is_python else _analyze_non_python_code(source)
 
-    functions: set[str] = set()
-    classes: set[str] = set()
-    imports: set[str] = set()
-
-    for line in source.splitlines():
-        for pattern in function_patterns:
-            match = re.match(pattern, line)
-            if match:
-                functions.add(match.group(1))
-        for pattern in class_patterns:
-            match = re.match(pattern, line)
-            if match:
-                classes.add(match.group(1))
-        for pattern in import_patterns:
-            match = re.match(pattern, line)
-            if match:
-                imports.add(match.group(1))
-
-    return {
-        "functions": sorted(functions),
-        "classes": sorted(classes),
-        "imports": sorted(imports),
-    }
+    with _analysis_cache_lock:
+        _analysis_cache[key] = result
+        if len(_analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+    return result
 
 
 @llm.function_tool
@@ -145,12 +235,12 @@ async def analyze_code(path: str, confirm: bool = False) -> str:
     if not resolved.exists() or resolved.is_dir():
         return f"File not found: {resolved}"
 
-    source = resolved.read_text(encoding="utf-8", errors="replace")
+    data = await asyncio.to_thread(resolved.read_bytes)
     suffix = resolved.suffix.lower()
 
     if suffix == ".py":
         try:
-            index = _analyze_python_code(source)
+            index = await asyncio.to_thread(_analyze_source, data, True)
         except SyntaxError as exc:
             return f"Python parse error: {exc}"
         return (
@@ -160,7 +250,7 @@ async def analyze_code(path: str, confirm: bool = False) -> str:
             f"Imports: {', '.join(index.imports[:50]) or 'none'}"
         )
 
-    data = _analyze_non_python_code(source)
+    data = await asyncio.to_thread(_analyze_source, data, False)
     return (
         f"File: {resolved.name}\n"
         f"Classes: {', '.join(data['classes']) or 'none'}\n"
@@ -180,33 +270,33 @@ async def get_project_structure(path: str = ".", limit: int = 500, confirm: bool
         return f"Invalid directory: {root}"
 
     limit = max(50, min(5000, limit))
-    files = _list_repo_files(root)
-    files = [f for f in files if f.is_file()]
-    files = files[:limit]
+    files = list(itertools.islice(_iter_repo_files(root), limit))
 
     if not files:
         return "No files found."
 
+    # Directories map to child dicts and files to None; the "/" suffix is added on render.
     tree: dict[str, Any] = {}
     for file_path in files:
-        rel = file_path.relative_to(root)
-        parts = rel.parts
+        *dirs, name = file_path.relative_to(root).parts
         cursor = tree
-        for part in parts[:-1]:
-            cursor = cursor.setdefault(part + "/", {})
-        cursor.setdefault(parts[-1], None)
+        for part in dirs:
+            cursor = cursor.setdefault(part, {})
+        cursor.setdefault(name, None)
 
     lines: list[str] = []
+    append = lines.append
 
     def walk(node: dict[str, Any], prefix: str = "") -> None:
-        entries = list(node.items())
-        entries.sort(key=lambda item: item[0])
+        entries = sorted(node.items(), key=itemgetter(0))
+        last = len(entries) - 1
         for i, (name, child) in enumerate(entries):
-            connector = "└── " if i == len(entries) - 1 else "├── "
-            lines.append(prefix + connector + name)
-            if isinstance(child, dict):
-                extension = "    " if i == len(entries) - 1 else "│   "
-                walk(child, prefix + extension)
+            connector = "└── " if i == last else "├── "
+            if child is None:
+                append(prefix + connector + name)
+            else:
+                append(prefix + connector + name + "/")
+                walk(child, prefix + ("    " if i == last else "│   "))
 
     walk(tree)
     header = f"Project structure ({root}):"
@@ -215,6 +305,19 @@ async def get_project_structure(path: str = ".", limit: int = 500, confirm: bool
     return header + "\n" + "\n".join(lines)
 
 
+def _count_lines_chunk(paths: Sequence[Path]) -> Counter[str]:
+    totals: Counter[str] = Counter()
+    for file_path in paths:
+        try:
+            data = file_path.read_bytes()
+        except Exception:
+            continue
+        ext = file_path.suffix.lower() or "<noext>"
+        # "\n" never occurs inside a multi-byte UTF-8 sequence, so no decode is needed.
+        totals[ext] += data.count(b"\n") + (1 if data and not data.endswith(b"\n") else 0)
+    return totals
+
+
 @llm.function_tool
 async def count_lines(path: str = ".", confirm: bool = False) -> str:
     """Count lines of code by file extension."""
@@ -225,21 +328,10 @@ async def count_lines(path: str = ".", confirm: bool = False) -> str:
     if not root.exists() or not root.is_dir():
         return f"Invalid directory: {root}"
 
-    files = _list_repo_files(root)
-    totals: dict[str, int] = defaultdict(int)
-    total_lines = 0
-
-    for file_path in files:
-        if not file_path.is_file():
-            continue
-        try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            continue
-        line_count = content.count("\n") + (1 if content else 0)
-        ext = file_path.suffix.lower() or "<noext>"
-        totals[ext] += line_count
-        total_lines += line_count
+    totals: Counter[str] = Counter()
+    for partial in await map_chunks(_count_lines_chunk, _list_repo_files(root)):
+        totals.update(partial)
+    total_lines = sum(totals.values())
 
     top = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:20]
     lines = [f"Total lines: {total_lines}"]
@@ -248,6 +340,37 @@ async def count_lines(path: str = ".", confirm: bool = False) -> str:
     return "\n".join(lines)
 
 
+_TODO_RE = re.compile(rb"\b(TODO|FIXME|HACK)\b", re.IGNORECASE)
+
+
+def _find_todos_chunk(paths: Sequence[Path], root: Path, limit: int) -> list[str]:
+    matches: list[str] = []
+    for file_path in paths:
+        try:
+            data = file_path.read_bytes()
+        except Exception:
+            continue
+        # Scan the raw bytes once; most files have no hits and are never decoded or split.
+        line_no = 1
+        counted_to = 0
+        line_end = -1
+        for match in _TODO_RE.finditer(data):
+            if match.start() <= line_end:
+                continue
+            line_start = data.rfind(b"\n", 0, match.start()) + 1
+            line_no += data.count(b"\n", counted_to, line_start)
+            counted_to = line_start
+            line_end = data.find(b"\n", match.start())
+            if line_end == -1:
+                line_end = len(data)
+            line = data[line_start:line_end].decode("utf-8", errors="ignore")
+            rel = file_path.relative_to(root)
+            matches.append(f"{rel}:{line_no}: {line.strip()}")
+            if len(matches) >= limit:
+                return matches
+    return matches
+
+
 @llm.function_tool
 async def find_todos(path: str = ".", limit: int = 50, confirm: bool = False) -> str:
     """Find TODO/FIXME/HACK comments in a codebase."""
@@ -259,24 +382,18 @@ async def find_todos(path: str = ".", limit: int = 50, confirm: bool = False) ->
         return f"Invalid directory: {root}"
 
     limit = max(1, min(200, limit))
-    pattern = re.compile(r"\b(TODO|FIXME|HACK)\b", re.IGNORECASE)
     matches: list[str] = []
 
-    for file_path in _list_repo_files(root):
-        if not file_path.is_file():
-            continue
-        try:
-            lines = file_path.read_text(encoding="utf-8", errors="ignore").splitlines()
-        except Exception:
-            continue
-        for idx, line in enumerate(lines, start=1):
-            if pattern.search(line):
-                rel = file_path.relative_to(root)
-                matches.append(f"{rel}:{idx}: {line.strip()}")
-                if len(matches) >= limit:
-                    break
-        if len(matches) >= limit:
-            break
+    def enough(partial: list[str]) -> bool:
+        matches.extend(partial)
+        return len(matches) >= limit
+
+    await map_chunks(
+        functools.partial(_find_todos_chunk, root=root, limit=limit),
+        _list_repo_files(root),
+        done=enough,
+    )
+    matches = matches[:limit]
 
     if not matches:
         return "No TODO/FIXME/HACK comments found."
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import sqlite3
+
 from livekit.agents import llm
 
-from jarvis.storage import get_connection
+from jarvis.storage import fts_prefix_query, get_connection
 
 
 @llm.function_tool
@@ -58,10 +60,24 @@ async def find_contact(query: str) -> str:
         return "Query is required."
 
     with get_connection() as conn:
-        rows = conn.execute(
-            "SELECT id, name, phone, email FROM contacts WHERE name LIKE ?",
-            (f"%{query}%",),
-        ).fetchall()
+        try:
+            rows = conn.execute(
+                """
+                SELECT c.id, c.name, c.phone, c.email
+                FROM contacts_fts f JOIN contacts c ON c.id = f.rowid
+                WHERE contacts_fts MATCH ?
+                """,
+                (fts_prefix_query(query),),
+            ).fetchall()
+        except sqlite3.OperationalError:
+            # No FTS5 in this SQLite build
+            rows = []
+        if not rows:
+            # Word-prefix search missed; fall back to substring matching (e.g. "ohn" -> "John")
+            rows = conn.execute(
+                "SELECT id, name, phone, email FROM contacts WHERE name LIKE ?",
+                (f"%{query}%",),
+            ).fetchall()
 
     if not rows:
         return "No matching contacts found."
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import mmap
 from pathlib import Path
+from typing import Sequence
 
 from livekit.agents import llm
 
+from jarvis.tools.base import IO_EXECUTOR, iter_files, map_chunks
 from jarvis.tools.safety import check_path_safety
 
 
@@ -56,7 +61,9 @@ async def read_file(path: str, max_chars: int = 4000, confirm: bool = False) ->
     if resolved.is_dir():
         return f"Path is a directory: {resolved}"
 
-    data = resolved.read_text(encoding="utf-8", errors="replace")
+    # Text-mode read(n) counts characters, so large files are never loaded whole.
+    with resolved.open(encoding="utf-8", errors="replace") as handle:
+        data = handle.read(max_chars + 1)
     if len(data) > max_chars:
         data = data[:max_chars] + "\n... [truncated]"
     return data
@@ -82,6 +89,34 @@ async def write_file(
     return f"Wrote {len(content)} characters to {resolved}"
 
 
+_BINARY_SNIFF_BYTES = 4096
+
+
+def _search_chunk(paths: Sequence[str], query: bytes, limit: int) -> list[str]:
+    matches: list[str] = []
+    for file_path in paths:
+        try:
+            with open(file_path, "rb") as handle:
+                head = handle.read(_BINARY_SNIFF_BYTES)
+                # Empty files cannot be mapped; a NUL byte up front means binary content.
+                if not head or b"\0" in head:
+                    continue
+                if query in head:
+                    found = True
+                elif len(head) < _BINARY_SNIFF_BYTES:
+                    found = False
+                else:
+                    with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        found = mapped.find(query) != -1
+        except (OSError, ValueError):
+            continue
+        if found:
+            matches.append(file_path)
+            if len(matches) >= limit:
+                break
+    return matches
+
+
 @llm.function_tool
 async def search_files(
     query: str,
@@ -89,7 +124,7 @@ async def search_files(
     limit: int = 20,
     confirm: bool = False,
 ) -> str:
-    """Search for a string in files under a path."""
+    """Search for a string in text files under a path."""
     allowed, message, resolved = check_path_safety(path, confirm)
     if not allowed:
         return message
@@ -98,18 +133,20 @@ async def search_files(
         return f"Invalid directory: {resolved}"
 
     limit = max(1, min(100, limit))
-    matches = []
-    for file_path in resolved.rglob("*"):
-        if file_path.is_dir():
-            continue
-        try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            continue
-        if query in content:
-            matches.append(str(file_path))
-            if len(matches) >= limit:
-                break
+    matches: list[str] = []
+
+    def enough(partial: list[str]) -> bool:
+        matches.extend(partial)
+        return len(matches) >= limit
+
+    loop = asyncio.get_running_loop()
+    paths = await loop.run_in_executor(IO_EXECUTOR, list, iter_files(str(resolved)))
+    await map_chunks(
+        functools.partial(_search_chunk, query=query.encode("utf-8"), limit=limit),
+        paths,
+        done=enough,
+    )
+    matches = matches[:limit]
 
     if not matches:
         return "No matches found."
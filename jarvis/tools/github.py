@@ -3,17 +3,29 @@
 from __future__ import annotations
 
 import base64
+import importlib.util
 import logging
 from typing import Optional
+from urllib.parse import urlencode
 
 import httpx
 from livekit.agents import llm
 
 from jarvis.audit import append_event
 from jarvis.config import config
+from jarvis.jsonutil import loads as json_loads
+from jarvis.storage import get_connection
 
 logger = logging.getLogger(__name__)
 
+# Shared client so sequential tool calls reuse the pooled TLS connection to GitHub.
+# HTTP/2 is only enabled when the optional h2 package is installed.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_http_client: Optional[httpx.AsyncClient] = None
+# Responses kept for ETag revalidation; older rows (by fetch time) are pruned on write so
+# file contents and search results don't pile up in the database forever
+_ETAG_CACHE_MAX_ROWS = 200
+
 
 def _is_allowed_repo(full_name: str, confirm: bool) -> tuple[bool, str]:
     full_name = full_name.strip()
@@ -55,11 +67,93 @@ def _headers(token: str) -> dict[str, str]:
     }
 
 
+def _get_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=20.0,
+            follow_redirects=True,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
+    return _http_client
+
+
+def _cache_key(url: str, params: Optional[dict]) -> str:
+    if not params:
+        return url
+    return f"{url}?{urlencode(sorted(params.items()))}"
+
+
+def _load_etag(key: str) -> Optional[tuple[str, str]]:
+    with get_connection() as conn:
+        row = conn.execute("SELECT etag, body FROM github_etags WHERE url = ?", (key,)).fetchone()
+    return (row[0], row[1]) if row else None
+
+
+def _store_etag(key: str, etag: str, body: str) -> None:
+    with get_connection() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO github_etags (url, etag, body) VALUES (?, ?, ?)",
+            (key, etag, body),
+        )
+        conn.execute(
+            """
+            DELETE FROM github_etags WHERE rowid NOT IN (
+                SELECT rowid FROM github_etags ORDER BY fetched_at DESC, rowid DESC LIMIT ?
+            )
+            """,
+            (_ETAG_CACHE_MAX_ROWS,),
+        )
+        conn.commit()
+
+
 async def _get(url: str, token: str, params: Optional[dict] = None) -> dict:
-    async with httpx.AsyncClient(timeout=20.0, follow_redirects=True) as client:
-        response = await client.get(url, headers=_headers(token), params=params)
-        response.raise_for_status()
-        return response.json()
+    headers = _headers(token)
+    key = _cache_key(url, params) if config.github.etag_cache else None
+    cached = _load_etag(key) if key else None
+    if cached:
+        # Conditional requests answered with 304 don't count against the rate limit.
+        headers["If-None-Match"] = cached[0]
+
+    response = await _get_client().get(url, headers=headers, params=params)
+    if response.status_code == 304 and cached:
+        return json_loads(cached[1])
+    response.raise_for_status()
+    etag = response.headers.get("ETag")
+    if key and etag:
+        _store_etag(key, etag, response.text)
+    return json_loads(response.content)
+
+
+async def _graphql(query: str, variables: dict, token: str) -> dict:
+    response = await _get_client().post(
+        "https://api.github.com/graphql",
+        headers=_headers(token),
+        json={"query": query, "variables": variables},
+    )
+    response.raise_for_status()
+    payload = json_loads(response.content)
+    if payload.get("errors"):
+        raise ValueError(payload["errors"][0].get("message", "GraphQL error"))
+    return payload["data"]
+
+
+# Only the three fields we render, instead of ~80 per repo from REST /user/repos.
+# Affiliations and ordering mirror the REST endpoint's defaults.
+_LIST_REPOS_QUERY = """
+query($n: Int!) {
+  viewer {
+    repositories(
+      first: $n
+      ownerAffiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER]
+      orderBy: {field: NAME, direction: ASC}
+    ) {
+      nodes { nameWithOwner isPrivate stargazerCount }
+    }
+  }
+}
+"""
 
 
 @llm.function_tool
@@ -72,15 +166,26 @@ async def github_list_repos(limit: int = 30) -> str:
     append_event({"type": "github", "action": "list_repos"})
 
     limit = max(1, min(100, limit))
-    data = await _get("https://api.github.com/user/repos", token, params={"per_page": str(limit)})
-    if not data:
+    try:
+        data = await _graphql(_LIST_REPOS_QUERY, {"n": limit}, token)
+        repos = [
+            (node["nameWithOwner"], node["isPrivate"], node["stargazerCount"])
+            for node in data["viewer"]["repositories"]["nodes"]
+        ]
+    except (httpx.HTTPError, KeyError, TypeError, ValueError) as exc:
+        logger.warning("GitHub GraphQL repo listing failed, using REST: %s", exc)
+        data = await _get(
+            "https://api.github.com/user/repos", token, params={"per_page": str(limit)}
+        )
+        repos = [
+            (repo.get("full_name", ""), repo.get("private", False), repo.get("stargazers_count", 0))
+            for repo in data or []
+        ]
+    if not repos:
         return "No repos found."
 
     lines = []
-    for repo in data:
-        full_name = repo.get("full_name", "")
-        private = repo.get("private", False)
-        stars = repo.get("stargazers_count", 0)
+    for full_name, private, stars in repos:
         lines.append(f"{full_name} ({'private' if private else 'public'}) ⭐ {stars}")
     return "Repos:\n" + "\n".join(lines)
 
@@ -177,9 +282,13 @@ async def github_read_file(
     if encoding != "base64":
         return "Unsupported file encoding from GitHub."
 
-    raw = base64.b64decode(content.encode("utf-8"))
+    # GitHub wraps base64 at 60 columns. Only decode the prefix that can hold max_chars
+    # characters (at most 4 UTF-8 bytes each) plus one spare base64 quantum.
+    content = content.replace("\n", "")
+    prefix_len = ((max_chars * 4 + 2) // 3 + 1) * 4
+    raw = base64.b64decode(content[:prefix_len])
     text = raw.decode("utf-8", errors="replace")
-    if len(text) > max_chars:
+    if len(text) > max_chars or len(content) > prefix_len:
         text = text[:max_chars] + "\n... [truncated]"
     return text
 
@@ -11,53 +11,97 @@ import logging
 import os
 import platform
 import re
-from typing import Optional
+import time
+from typing import Final, Optional
 
 from livekit.agents import llm
 
+from jarvis.tools.base import run_command
+
 logger = logging.getLogger(__name__)
 
+_IS_DARWIN: Final[bool] = platform.system() == "Darwin"
+
+_DIM_RE = re.compile(r"(\d+)%?")
+
 
 async def _run_command(cmd: list[str], timeout: float = 10.0) -> tuple[bool, str]:
     """Run a shell command and return success status and output."""
     try:
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
-        output = stdout.decode().strip() if stdout else stderr.decode().strip()
-        return process.returncode == 0, output
+        code, output = await run_command(cmd, timeout)
+        return code == 0, output
     except asyncio.TimeoutError:
         return False, "Command timed out"
     except Exception as e:
         return False, str(e)
 
 
-async def _run_shortcut(shortcut_name: str, input_text: str = "") -> tuple[bool, str]:
-    """Run a macOS Shortcut."""
-    if platform.system() != "Darwin":
+# Names from `shortcuts list`, refreshed every few minutes, so shortcuts the user
+# never created fail instantly instead of spawning a `shortcuts run` that errors.
+_SHORTCUTS_LIST_TTL = 300.0
+_available_shortcuts: Optional[tuple[float, frozenset[str]]] = None
+
+
+async def _load_available_shortcuts() -> Optional[frozenset[str]]:
+    """Return the user's shortcut names, or None if they can't be listed."""
+    global _available_shortcuts
+
+    if not _IS_DARWIN:
+        return None
+    if (
+        _available_shortcuts is not None
+        and time.monotonic() - _available_shortcuts[0] < _SHORTCUTS_LIST_TTL
+    ):
+        return _available_shortcuts[1]
+
+    success, output = await _run_command(["shortcuts", "list"])
+    names = frozenset(filter(None, map(str.strip, output.splitlines())))
+    if not success or not names:
+        # Unknown: let every run through rather than caching a bad listing
+        return None
+    _available_shortcuts = (time.monotonic(), names)
+    return names
+
+
+# Idempotent shortcut runs currently in flight, keyed by (name, input), so a
+# repeated request (e.g. a doubled transcription) awaits the same run.
+_inflight_shortcuts: dict[tuple[str, str], asyncio.Future] = {}
+
+
+async def _run_shortcut(
+    shortcut_name: str, input_text: str = "", dedup: bool = False
+) -> tuple[bool, str]:
+    """Run a macOS Shortcut.
+
+    With dedup, a call matching one already in flight shares its result instead of
+    spawning another run; only use it for idempotent shortcuts.
+    """
+    if not _IS_DARWIN:
         return False, "Shortcuts are only available on macOS"
 
+    available = await _load_available_shortcuts()
+    if available is not None and shortcut_name not in available:
+        return False, f"Shortcut not found: {shortcut_name}"
+
+    if not dedup:
+        return await _exec_shortcut(shortcut_name, input_text)
+
+    key = (shortcut_name, input_text)
+    future = _inflight_shortcuts.get(key)
+    if future is None:
+        future = asyncio.ensure_future(_exec_shortcut(shortcut_name, input_text))
+        _inflight_shortcuts[key] = future
+        future.add_done_callback(lambda _: _inflight_shortcuts.pop(key, None))
+    # Shielded so one caller being cancelled doesn't cancel the run for the others
+    return await asyncio.shield(future)
+
+
+async def _exec_shortcut(shortcut_name: str, input_text: str) -> tuple[bool, str]:
     try:
-        if input_text:
-            # Pipe input to shortcut
-            process = await asyncio.create_subprocess_shell(
-                f'echo "{input_text}" | shortcuts run "{shortcut_name}"',
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-        else:
-            process = await asyncio.create_subprocess_exec(
-                "shortcuts", "run", shortcut_name,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=10.0)
-        output = stdout.decode().strip() if stdout else stderr.decode().strip()
-        return process.returncode == 0, output
+        # Input is written to the CLI's stdin, as `echo ... |` did, without a shell
+        stdin_data = f"{input_text}\n".encode() if input_text else None
+        code, output = await run_command(["shortcuts", "run", shortcut_name], 10.0, stdin_data)
+        return code == 0, output
     except asyncio.TimeoutError:
         return False, "Shortcut timed out"
     except Exception as e:
@@ -66,22 +110,67 @@ async def _run_shortcut(shortcut_name: str, input_text: str = "") -> tuple[bool,
 
 async def _run_applescript(script: str, timeout: float = 5.0) -> tuple[bool, str]:
     """Execute AppleScript and return success status and output."""
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return False, "AppleScript only available on macOS"
 
-    try:
-        process = await asyncio.create_subprocess_exec(
-            "osascript", "-e", script,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
-        output = stdout.decode().strip() if stdout else stderr.decode().strip()
-        return process.returncode == 0, output
-    except asyncio.TimeoutError:
-        return False, "Command timed out"
-    except Exception as e:
-        return False, str(e)
+    return await _run_command(["osascript", "-e", script], timeout=timeout)
+
+
+async def _run_shortcuts_batch(names: list[str]) -> list[tuple[bool, str]]:
+    """Run several Shortcuts in order from one osascript process.
+
+    Returns a (success, output) pair per shortcut, in the order given.
+    """
+    available = await _load_available_shortcuts()
+    if available is not None and not all(name in available for name in names):
+        present = [name for name in names if name in available]
+        ran = iter(await _run_shortcuts_batch(present) if present else [])
+        return [
+            next(ran) if name in available else (False, f"Shortcut not found: {name}")
+            for name in names
+        ]
+
+    # One status per line, so multi-line error messages are flattened before joining
+    lines = [
+        "on oneLine(msg)",
+        "set AppleScript's text item delimiters to {linefeed, return}",
+        "set parts to text items of (msg as text)",
+        'set AppleScript\'s text item delimiters to " "',
+        "set msg to parts as text",
+        'set AppleScript\'s text item delimiters to ""',
+        "return msg",
+        "end oneLine",
+        "set results to {}",
+        'tell application "Shortcuts Events"',
+    ]
+    for name in names:
+        escaped = name.replace("\\", "\\\\").replace('"', '\\"')
+        lines.extend([
+            "try",
+            f'run shortcut "{escaped}"',
+            'set end of results to "ok"',
+            "on error errMsg",
+            'set end of results to "error: " & my oneLine(errMsg)',
+            "end try",
+        ])
+    lines.extend([
+        "end tell",
+        "set AppleScript's text item delimiters to linefeed",
+        "return results as text",
+    ])
+
+    success, output = await _run_applescript("\n".join(lines), timeout=10.0 * len(names))
+    if not success:
+        # osascript itself failed (e.g. Automation permission for Shortcuts Events
+        # denied); the shortcuts CLI doesn't need it, and the runs are independent.
+        logger.debug("Batched shortcuts failed, running individually: %s", output)
+        return list(await asyncio.gather(*(_run_shortcut(name) for name in names)))
+    statuses = output.splitlines()
+    if len(statuses) != len(names):
+        # Can't tell which status belongs to which shortcut; never report a guess
+        logger.warning("Batched shortcuts returned %d statuses for %d", len(statuses), len(names))
+        return [(False, "error: unknown result")] * len(names)
+    return [(status == "ok", status) for status in statuses]
 
 
 # Scene mappings
@@ -113,19 +202,19 @@ async def home_scene(scene: str) -> str:
     Args:
         scene: Scene name (morning, night, movie, work, away, home)
     """
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return "Home scenes are only available on macOS"
 
     scene_lower = scene.lower().strip()
     actual_scene = SCENE_MAPPINGS.get(scene_lower, scene)
 
     # Try Shortcuts first (most reliable)
-    success, output = await _run_shortcut(f"Set Scene {actual_scene}")
+    success, output = await _run_shortcut(f"Set Scene {actual_scene}", dedup=True)
     if success:
         return f"Activated scene: {actual_scene}"
 
     # Try generic scene shortcut
-    success, output = await _run_shortcut("Home Scene", actual_scene)
+    success, output = await _run_shortcut("Home Scene", actual_scene, dedup=True)
     if success:
         return f"Activated scene: {actual_scene}"
 
@@ -149,19 +238,28 @@ async def home_lights(action: str, location: str = "all") -> str:
         action: on, off, or dim (with percentage like 'dim 50%')
         location: Room name or 'all'
     """
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return "Light controls are only available on macOS"
 
     action_lower = action.lower().strip()
     location_lower = location.lower().strip()
 
-    # Check for simple mappings first
+    # Check for simple mappings first: an exact phrase is a dict hit, anything else
+    # falls back to the looser substring match
     command = f"{action_lower} {location_lower}".strip()
-    for key, shortcut in SHORTCUT_MAPPINGS.items():
-        if key in command or command in key:
-            success, output = await _run_shortcut(shortcut)
-            if success:
-                return f"Lights turned {action_lower}"
+    shortcut = SHORTCUT_MAPPINGS.get(command)
+    if shortcut:
+        candidates = [shortcut]
+    else:
+        candidates = [
+            shortcut
+            for key, shortcut in SHORTCUT_MAPPINGS.items()
+            if key in command or command in key
+        ]
+    for shortcut in candidates:
+        success, output = await _run_shortcut(shortcut)
+        if success:
+            return f"Lights turned {action_lower}"
 
     # Handle specific actions
     if action_lower in ["on", "turn on"]:
@@ -192,7 +290,7 @@ async def home_lights(action: str, location: str = "all") -> str:
 
     elif "dim" in action_lower:
         # Extract percentage
-        match = re.search(r'(\d+)%?', action)
+        match = _DIM_RE.search(action)
         if match:
             level = int(match.group(1))
             success, output = await _run_shortcut(f"Set {location.title()} Lights", f"{level}%")
@@ -213,7 +311,7 @@ async def home_temperature(temperature: int, mode: str = "") -> str:
         temperature: Target temperature in degrees (60-85)
         mode: heating, cooling, or auto (optional)
     """
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return "Thermostat control is only available on macOS"
 
     # Clamp temperature to reasonable range
@@ -243,7 +341,7 @@ async def home_lock(action: str = "lock", door: str = "all") -> str:
         action: lock or unlock
         door: front, back, or all
     """
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return "Lock control is only available on macOS"
 
     action_lower = action.lower().strip()
@@ -255,8 +353,9 @@ async def home_lock(action: str = "lock", door: str = "all") -> str:
             if success:
                 return "All doors locked"
             # Try individual doors
-            await _run_shortcut("Lock Front Door")
-            await _run_shortcut("Lock Back Door")
+            results = await _run_shortcuts_batch(["Lock Front Door", "Lock Back Door"])
+            if all(ok for ok, _ in results):
+                return "All doors locked"
             return "Attempted to lock all doors"
         else:
             success, output = await _run_shortcut(f"Lock {door.title()} Door")
@@ -282,11 +381,11 @@ async def home_lock(action: str = "lock", door: str = "all") -> str:
 @llm.function_tool
 async def home_status() -> str:
     """Get status of home devices via HomeKit."""
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return "Home status is only available on macOS"
 
     # Try to get status via Shortcut
-    success, output = await _run_shortcut("Home Status")
+    success, output = await _run_shortcut("Home Status", dedup=True)
 
     if success and output:
         return output
@@ -335,17 +434,20 @@ async def lights_off(room: str = "all") -> str:
     return await home_lights("off", room)
 
 
-def get_home_macos_tools() -> list:
+_HOME_MACOS_TOOLS: Final[tuple] = (
+    home_scene,
+    home_lights,
+    home_temperature,
+    home_lock,
+    home_status,
+    good_morning,
+    good_night,
+    movie_time,
+    lights_on,
+    lights_off,
+)
+
+
+def get_home_macos_tools() -> tuple:
     """Get macOS HomeKit/Shortcuts-based home automation tools."""
-    return [
-        home_scene,
-        home_lights,
-        home_temperature,
-        home_lock,
-        home_status,
-        good_morning,
-        good_night,
-        movie_time,
-        lights_on,
-        lights_off,
-    ]
+    return _HOME_MACOS_TOOLS
@@ -5,27 +5,25 @@ from __future__ import annotations
 import asyncio
 import logging
 import platform
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Final, Optional, Tuple
 
 from livekit.agents import llm
 
+from jarvis.tools.base import run_command
 from jarvis.tools.safety import check_path_safety
 
 logger = logging.getLogger(__name__)
 
+_IS_DARWIN: Final[bool] = platform.system() == "Darwin"
+
 
 async def _run_command(cmd: list[str], timeout: float = 10.0) -> Tuple[str, int]:
     try:
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
-        output = stdout.decode() if stdout else stderr.decode()
-        return output.strip(), process.returncode or 0
+        code, output = await run_command(cmd, timeout)
+        return output, code
     except asyncio.TimeoutError:
         return "Command timed out", -1
     except Exception as exc:
@@ -36,31 +34,67 @@ async def _osascript(script: str, timeout: float = 10.0) -> Tuple[str, int]:
     return await _run_command(["osascript", "-e", script], timeout=timeout)
 
 
-async def _is_app_running(app_name: str) -> bool:
-    script = (
-        'tell application "System Events" to '
-        f'(name of processes) contains "{app_name}"'
-    )
-    output, code = await _osascript(script)
-    if code != 0:
-        return False
-    return output.strip().lower() == "true"
-
-
-async def _ensure_app_running(app_name: str) -> bool:
-    if await _is_app_running(app_name):
-        return True
-    output, code = await _run_command(["open", "-a", app_name])
-    if code != 0:
-        logger.warning("Could not open app %s: %s", app_name, output)
-        return False
-    # Music.app can be slow to start, wait longer
-    await asyncio.sleep(1.5)
-    return await _is_app_running(app_name)
+# Back-to-back music commands probe the same app; reuse answers for a moment.
+_APP_RUNNING_TTL = 2.0
+_app_running_cache: dict[str, tuple[float, bool]] = {}
 
 
-def _local_tz() -> timezone:
-    return datetime.now().astimezone().tzinfo or timezone.utc
+async def _is_app_running(app_name: str) -> bool:
+    cached = _app_running_cache.get(app_name)
+    if cached is not None and time.monotonic() - cached[0] < _APP_RUNNING_TTL:
+        return cached[1]
+
+    # pgrep is a single cheap exec; exit 1 just means no match. Anything else (no
+    # pgrep, bad pattern) falls back to asking System Events.
+    output, code = await _run_command(["pgrep", "-x", app_name])
+    if code in (0, 1):
+        running = code == 0 and bool(output)
+    else:
+        script = (
+            'tell application "System Events" to '
+            f'(name of processes) contains "{app_name}"'
+        )
+        output, code = await _osascript(script)
+        if code != 0:
+            return False
+        running = output.strip().lower() == "true"
+    _app_running_cache[app_name] = (time.monotonic(), running)
+    return running
+
+
+async def _open_app(app_name: str) -> Tuple[str, int]:
+    _app_running_cache.pop(app_name, None)
+    return await _run_command(["open", "-a", app_name])
+
+
+async def _wait_for_app(app_name: str, timeout: float = 2.0, interval: float = 0.1) -> bool:
+    """Poll until app_name is running, returning as soon as it is seen."""
+    deadline = time.monotonic() + timeout
+    while True:
+        # Skip the TTL cache: a "not running" answer from before launch is stale
+        _app_running_cache.pop(app_name, None)
+        if await _is_app_running(app_name):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        await asyncio.sleep(interval)
+
+
+# AppleScript month constants; strftime("%B") would follow the process locale.
+_MONTH_NAMES: Final[tuple[str, ...]] = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
 
 
 def _escape_applescript(text: str) -> str:
@@ -75,44 +109,30 @@ def _parse_datetime(value: str) -> Optional[datetime]:
         parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
     except ValueError:
         return None
-    if parsed.tzinfo is None:
-        return parsed.replace(tzinfo=_local_tz())
-    return parsed.astimezone(_local_tz())
+    # astimezone() with no argument resolves the local offset for that instant
+    # (naive values are taken as local time), so DST is handled per date
+    return parsed.astimezone()
 
 
 def _applescript_date(var_name: str, dt: datetime) -> str:
-    local = dt.astimezone(_local_tz())
-    month_names = [
-        "January",
-        "February",
-        "March",
-        "April",
-        "May",
-        "June",
-        "July",
-        "August",
-        "September",
-        "October",
-        "November",
-        "December",
-    ]
-    month_name = month_names[local.month - 1]
-    return "\n".join(
-        [
-            f"set {var_name} to (current date)",
-            f"set year of {var_name} to {local.year}",
-            f"set month of {var_name} to {month_name}",
-            f"set day of {var_name} to {local.day}",
-            f"set time of {var_name} to "
-            f"{(local.hour * 3600) + (local.minute * 60) + local.second}",
-        ]
+    local = dt.astimezone()
+    month_name = _MONTH_NAMES[local.month - 1]
+    seconds = (local.hour * 3600) + (local.minute * 60) + local.second
+    # A date literal would be parsed with the user's locale, so set the fields in
+    # one multiple assignment instead. Day goes to 1 first so a month change can
+    # never overflow (e.g. from the 31st into a 30-day month).
+    return (
+        f"set {var_name} to (current date)\n"
+        f"set {{day of {var_name}, year of {var_name}, month of {var_name}, "
+        f"day of {var_name}, time of {var_name}}} to "
+        f"{{1, {local.year}, {month_name}, {local.day}, {seconds}}}"
     )
 
 
 @llm.function_tool
 async def get_battery_status() -> str:
     """Get battery status (macOS only)."""
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return "Battery status is only available on macOS."
 
     output, code = await _run_command(["pmset", "-g", "batt"])
@@ -125,7 +145,7 @@ async def get_battery_status() -> str:
 @llm.function_tool
 async def get_active_app() -> str:
     """Get the currently active application (macOS only)."""
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return "Active app lookup is only available on macOS."
 
     script = (
@@ -141,7 +161,7 @@ async def get_active_app() -> str:
 @llm.function_tool
 async def reveal_in_finder(path: str, confirm: bool = False) -> str:
     """Reveal a file or directory in Finder."""
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return "Finder integration is only available on macOS."
 
     allowed, message, resolved = check_path_safety(path, confirm)
@@ -160,7 +180,7 @@ async def reveal_in_finder(path: str, confirm: bool = False) -> str:
 @llm.function_tool
 async def send_notification(title: str, message: str, sound: str = "") -> str:
     """Show a macOS notification."""
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return "Notifications are only available on macOS."
 
     title = _escape_applescript(title.strip() or "J.A.R.V.I.S")
@@ -188,8 +208,19 @@ def _resolve_music_app(app: str) -> list[str]:
     return ["Music", "Spotify"]
 
 
+# Music.app keyboard shortcut sent via System Events; %s is the keystroke line.
+_MUSIC_KEY_SCRIPT: Final[str] = '''
+tell application "Music" to activate
+delay 0.3
+tell application "System Events"
+    tell process "Music"
+        %s
+    end tell
+end tell'''
+
+
 async def _music_command(command: str, app: str) -> str:
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return "Music controls are only available on macOS."
 
     targets = _resolve_music_app(app)
@@ -204,10 +235,10 @@ async def _music_command(command: str, app: str) -> str:
     # If no app running, try to open the first one
     if not target_app:
         target_app = targets[0]
-        output, code = await _run_command(["open", "-a", target_app])
+        output, code = await _open_app(target_app)
         if code != 0:
             return f"Could not open {target_app}: {output}"
-        await asyncio.sleep(2.0)  # Wait for app to start
+        await _wait_for_app(target_app)
 
     # Handle Spotify separately - it has its own URL scheme
     if target_app == "Spotify":
@@ -229,19 +260,9 @@ async def _music_command(command: str, app: str) -> str:
 
     # For Music.app - use UI scripting as it's most reliable
     if command in {"play", "pause", "playpause"}:
-        # Activate Music first
-        await _run_command(["open", "-a", "Music"])
-        await asyncio.sleep(0.5)
-
-        # Use keyboard shortcut via System Events - most reliable method
-        script = '''
-tell application "Music" to activate
-delay 0.3
-tell application "System Events"
-    tell process "Music"
-        keystroke space
-    end tell
-end tell'''
+        # Use keyboard shortcut via System Events - most reliable method. The script
+        # activates Music itself, and a cold start was already handled above.
+        script = _MUSIC_KEY_SCRIPT % "keystroke space"
         output, code = await _osascript(script, timeout=5.0)
         if code == 0:
             return f"{command.title()} command sent to Music"
@@ -249,27 +270,13 @@ end tell'''
 
     elif command == "next track":
         # Cmd+Right = next track in Music
-        script = '''
-tell application "Music" to activate
-delay 0.3
-tell application "System Events"
-    tell process "Music"
-        key code 124 using command down
-    end tell
-end tell'''
+        script = _MUSIC_KEY_SCRIPT % "key code 124 using command down"
         output, code = await _osascript(script, timeout=5.0)
         return "Next track (Music)" if code == 0 else f"Could not skip: {output}"
 
     elif command == "previous track":
         # Cmd+Left = previous track in Music
-        script = '''
-tell application "Music" to activate
-delay 0.3
-tell application "System Events"
-    tell process "Music"
-        key code 123 using command down
-    end tell
-end tell'''
+        script = _MUSIC_KEY_SCRIPT % "key code 123 using command down"
         output, code = await _osascript(script, timeout=5.0)
         return "Previous track (Music)" if code == 0 else f"Could not go back: {output}"
 
@@ -303,11 +310,13 @@ async def previous_track(app: str = "auto") -> str:
 @llm.function_tool
 async def now_playing(app: str = "auto") -> str:
     """Get current track info from Spotify or Apple Music."""
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return "Now playing is only available on macOS."
 
+    # Only query apps that are already running: launching one just to report that
+    # nothing is playing costs an `open -a` plus a startup wait.
     for target in _resolve_music_app(app):
-        if await _ensure_app_running(target):
+        if await _is_app_running(target):
             script = (
                 f'tell application "{target}" to '
                 'if player state is playing then '
@@ -324,7 +333,7 @@ async def now_playing(app: str = "auto") -> str:
 @llm.function_tool
 async def list_apple_calendars() -> str:
     """List available calendars from macOS Calendar."""
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return "Calendar tools are only available on macOS."
 
     script = (
@@ -334,7 +343,7 @@ async def list_apple_calendars() -> str:
     output, code = await _osascript(script, timeout=15.0)
     if code != 0:
         return f"Failed to list calendars: {output}"
-    calendars = [item.strip() for item in output.split(",") if item.strip()]
+    calendars = list(filter(None, map(str.strip, output.split(","))))
     if not calendars:
         return "No calendars found."
     return "Calendars:\n" + "\n".join(calendars)
@@ -348,7 +357,7 @@ async def create_apple_calendar_event(
     calendar_name: str = "",
 ) -> str:
     """Create a calendar event in the macOS Calendar app."""
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return "Calendar tools are only available on macOS."
 
     title = _escape_applescript(title.strip())
@@ -395,7 +404,7 @@ async def create_apple_reminder(
     notes: str = "",
 ) -> str:
     """Create a reminder in the macOS Reminders app."""
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return "Reminders are only available on macOS."
 
     title = _escape_applescript(title.strip())
@@ -431,19 +440,22 @@ async def create_apple_reminder(
     return f"Created reminder: {title}"
 
 
-def get_macos_tools() -> list:
+_MACOS_TOOLS: Final[tuple] = (
+    get_battery_status,
+    get_active_app,
+    reveal_in_finder,
+    send_notification,
+    play_music,
+    pause_music,
+    next_track,
+    previous_track,
+    now_playing,
+    list_apple_calendars,
+    create_apple_calendar_event,
+    create_apple_reminder,
+)
+
+
+def get_macos_tools() -> tuple:
     """Get macOS tools."""
-    return [
-        get_battery_status,
-        get_active_app,
-        reveal_in_finder,
-        send_notification,
-        play_music,
-        pause_music,
-        next_track,
-        previous_track,
-        now_playing,
-        list_apple_calendars,
-        create_apple_calendar_event,
-        create_apple_reminder,
-    ]
+    return _MACOS_TOOLS
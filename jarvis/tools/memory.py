@@ -2,9 +2,58 @@
 
 from __future__ import annotations
 
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
 from livekit.agents import llm
 
-from jarvis.storage import get_connection
+from jarvis.storage import fts_phrase_query, get_connection, split_tags
+
+# Trigram FTS can only match queries of at least three characters
+_FTS_MIN_QUERY = 3
+
+_SQL_INSERT = "INSERT INTO memory (content, tags, importance) VALUES (?, ?, ?)"
+_SQL_INSERT_TAG = "INSERT OR IGNORE INTO memory_tags (memory_id, tag) VALUES (?, ?)"
+_SQL_DELETE = "DELETE FROM memory WHERE id = ?"
+_SQL_DELETE_BY_TAG = (
+    "DELETE FROM memory WHERE id IN (SELECT memory_id FROM memory_tags WHERE tag = ?)"
+)
+# Old memories are deleted in chunks, committing after each, so a large purge never
+# holds the write lock (or builds one huge FTS/trigger transaction) for long
+_DELETE_CHUNK = 1000
+_SQL_DELETE_BEFORE = (
+    "DELETE FROM memory WHERE id IN (SELECT id FROM memory WHERE created_at < ? LIMIT ?)"
+)
+_SQL_COUNT = "SELECT total FROM memory_counters WHERE id = 1"
+_SQL_TOP_TAGS = "SELECT tag, count FROM memory_tag_counts ORDER BY count DESC LIMIT ?"
+
+# Recall statements for each (content match, tag filter) shape, built once so every
+# call sends SQLite identical text. Tags are bound as one JSON array.
+_RECALL_MATCH = {
+    "fts": " JOIN memory_fts f ON f.rowid = m.id WHERE memory_fts MATCH ?",
+    "like": " WHERE m.content LIKE ?",
+    # Same text as "like" but bound as "q%", which can seek idx_memory_content_prefix
+    "prefix": " WHERE m.content LIKE ?",
+    # No query and no tags: plain recent-memories scan along idx_memory_rank
+    "all": "",
+}
+_SQL_RECALL = {
+    (match, tagged): (
+        "SELECT m.id, m.content, m.tags, m.importance, m.created_at FROM memory m"
+        + where
+        + (
+            (" AND" if where else " WHERE")
+            + " m.id IN (SELECT memory_id FROM memory_tags"
+            " WHERE tag IN (SELECT value FROM json_each(?)))"
+            if tagged
+            else ""
+        )
+        + " ORDER BY m.importance DESC, m.created_at DESC LIMIT ?"
+    )
+    for match, where in _RECALL_MATCH.items()
+    for tagged in (False, True)
+}
 
 
 @llm.function_tool
@@ -13,54 +62,74 @@ async def remember(content: str, tags: str = "", importance: int = 1) -> str:
     importance = max(1, min(5, importance))
 
     with get_connection() as conn:
-        conn.execute(
-            "INSERT INTO memory (content, tags, importance) VALUES (?, ?, ?)",
-            (content.strip(), tags.strip(), importance),
-        )
+        cur = conn.execute(_SQL_INSERT, (content.strip(), tags.strip(), importance))
+        conn.executemany(_SQL_INSERT_TAG, [(cur.lastrowid, tag) for tag in split_tags(tags)])
         conn.commit()
 
     return "Saved that to memory."
 
 
-@llm.function_tool
-async def recall_memory(query: str = "", tags: str = "", limit: int = 5) -> str:
-    """Recall memories that match a query or tags."""
-    limit = max(1, min(20, limit))
-    query = query.strip()
-    tags = tags.strip()
-
-    sql = "SELECT id, content, tags, importance, created_at FROM memory WHERE 1=1"
+def _recall(
+    conn: sqlite3.Connection, match: str, query: str, tags: list[str], limit: int
+) -> list[sqlite3.Row]:
     params: list[object] = []
-
-    if query:
-        sql += " AND content LIKE ?"
+    if match == "fts":
+        params.append(fts_phrase_query(query))
+    elif match == "like":
         params.append(f"%{query}%")
+    elif match == "prefix":
+        params.append(f"{query}%")
     if tags:
-        sql += " AND tags LIKE ?"
-        params.append(f"%{tags}%")
-
-    sql += " ORDER BY importance DESC, created_at DESC LIMIT ?"
+        params.append(json.dumps(tags))
     params.append(limit)
+    return conn.execute(_SQL_RECALL[match, bool(tags)], params).fetchall()
+
+
+@llm.function_tool
+async def recall_memory(
+    query: str = "", tags: str = "", limit: int = 5, prefix: bool = False
+) -> str:
+    """Recall memories that match a query or any of the given comma-separated tags.
+
+    The query matches anywhere in a memory, or only at its start when prefix is set.
+    Tags must match exactly (case-insensitive), not as substrings.
+    """
+    limit = max(1, min(20, limit))
+    query = query.strip()
+    tag_list = split_tags(tags)
+    if query and prefix:
+        match = "prefix"
+    elif len(query) >= _FTS_MIN_QUERY:
+        match = "fts"
+    else:
+        match = "like" if query else "all"
 
     with get_connection() as conn:
-        rows = conn.execute(sql, params).fetchall()
+        try:
+            rows = _recall(conn, match, query, tag_list, limit)
+        except sqlite3.OperationalError:
+            if match != "fts":
+                raise
+            # No FTS5 trigram index in this SQLite build
+            rows = _recall(conn, "like", query, tag_list, limit)
 
     if not rows:
         return "No matching memories found."
 
-    lines = []
+    # Header goes in the list so the reply is built by one join, not join + concat
+    lines = ["Memories:"]
     for row in rows:
         tag_text = f" (tags: {row['tags']})" if row["tags"] else ""
         lines.append(f"{row['id']}: {row['content']}{tag_text}")
 
-    return "Memories:\n" + "\n".join(lines)
+    return "\n".join(lines)
 
 
 @llm.function_tool
 async def forget_memory(memory_id: int) -> str:
     """Delete a memory by ID."""
     with get_connection() as conn:
-        cur = conn.execute("DELETE FROM memory WHERE id = ?", (memory_id,))
+        cur = conn.execute(_SQL_DELETE, (memory_id,))
         conn.commit()
 
     if cur.rowcount:
@@ -70,13 +139,13 @@ async def forget_memory(memory_id: int) -> str:
 
 @llm.function_tool
 async def forget_memory_by_tag(tag: str) -> str:
-    """Delete memories matching a tag."""
+    """Delete memories with a tag."""
     tag = tag.strip()
     if not tag:
         return "Tag is required."
 
     with get_connection() as conn:
-        cur = conn.execute("DELETE FROM memory WHERE tags LIKE ?", (f"%{tag}%",))
+        cur = conn.execute(_SQL_DELETE_BY_TAG, (tag.lower(),))
         conn.commit()
 
     if cur.rowcount:
@@ -88,15 +157,19 @@ async def forget_memory_by_tag(tag: str) -> str:
 async def forget_memory_before(days: int = 30) -> str:
     """Delete memories older than N days."""
     days = max(1, min(3650, days))
+    # Same "YYYY-MM-DD HH:MM:SS" UTC text as the CURRENT_TIMESTAMP column default
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
+    deleted = 0
     with get_connection() as conn:
-        cur = conn.execute(
-            "DELETE FROM memory WHERE created_at < datetime('now', ?)",
-            (f"-{days} days",),
-        )
-        conn.commit()
-
-    if cur.rowcount:
-        return f"Deleted {cur.rowcount} memories older than {days} days."
+        while True:
+            cur = conn.execute(_SQL_DELETE_BEFORE, (cutoff, _DELETE_CHUNK))
+            conn.commit()
+            deleted += cur.rowcount
+            if cur.rowcount < _DELETE_CHUNK:
+                break
+
+    if deleted:
+        return f"Deleted {deleted} memories older than {days} days."
     return f"No memories older than {days} days."
 
 
@@ -105,25 +178,16 @@ async def memory_stats(limit: int = 5) -> str:
     """Get memory stats and top tags."""
     limit = max(1, min(20, limit))
     with get_connection() as conn:
-        total = conn.execute("SELECT COUNT(*) AS count FROM memory").fetchone()["count"]
-        rows = conn.execute(
-            """
-            SELECT tags, COUNT(*) AS count
-            FROM memory
-            WHERE tags IS NOT NULL AND tags != ''
-            GROUP BY tags
-            ORDER BY count DESC
-            LIMIT ?
-            """,
-            (limit,),
-        ).fetchall()
+        row = conn.execute(_SQL_COUNT).fetchone()
+        total = row["total"] if row else 0
+        rows = conn.execute(_SQL_TOP_TAGS, (limit,)).fetchall()
 
     if total == 0:
         return "No memories stored yet."
 
     tag_lines = []
     for row in rows:
-        tag_lines.append(f"{row['tags']}: {row['count']}")
+        tag_lines.append(f"{row['tag']}: {row['count']}")
 
     summary = [f"Total memories: {total}"]
     if tag_lines:
@@ -7,17 +7,27 @@ Based on proven implementation with better timeout handling.
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import logging
 import os
 import platform
 import re
-from typing import Optional
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Final, Optional
 
 import httpx
 from livekit.agents import llm
 
+from jarvis.tools.base import run_command
+
 logger = logging.getLogger(__name__)
 
+_SYSTEM: Final[str] = platform.system()
+_IS_DARWIN: Final[bool] = _SYSTEM == "Darwin"
+
 # Optional YouTube Music support
 try:
     from ytmusicapi import YTMusic
@@ -27,9 +37,34 @@ except ImportError:
     YTMusic = None
 
 
+# music_play query parsing
+_PLAYLIST_RE = re.compile(r"playlist[:\s]+(.+)", re.IGNORECASE)
+_ARTIST_RE = re.compile(r"(?:artist|by|songs by)[:\s]+(.+)", re.IGNORECASE)
+_ALBUM_RE = re.compile(r"album[:\s]+(.+)", re.IGNORECASE)
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_http_client: Optional[httpx.AsyncClient] = None
+
+# iTunes Search API answers keyed by (normalized query, entity). The lookup is
+# idempotent, so results (including "not found") are kept for an hour.
+_CATALOG_CACHE_SIZE = 512
+_CATALOG_CACHE_TTL = 3600.0
+_catalog_cache: OrderedDict[tuple[str, str], tuple[float, tuple[Optional[dict], Optional[str]]]] = (
+    OrderedDict()
+)
+_catalog_inflight: dict[tuple[str, str], asyncio.Future] = {}
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(timeout=6.0, http2=_HTTP2_AVAILABLE)
+    return _http_client
+
+
 async def _run_applescript(script: str, timeout: float = 15.0) -> tuple[bool, str]:
     """Execute AppleScript and return success status and output."""
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return False, "Music control only available on macOS"
 
     try:
@@ -54,11 +89,13 @@ async def _run_applescript(script: str, timeout: float = 15.0) -> tuple[bool, st
 
 async def _ensure_music_running() -> bool:
     """Ensure Music.app is running, launch if needed."""
-    # Check if Music is running
-    check_script = 'tell application "System Events" to (name of processes) contains "Music"'
-    success, output = await _run_applescript(check_script, timeout=5.0)
-
-    if success and output.lower() == "true":
+    # Check if Music is running; pgrep is a single cheap exec, where asking System
+    # Events costs a whole osascript startup on every music_play
+    try:
+        code, _ = await run_command(["pgrep", "-x", "Music"], timeout=5.0)
+    except (OSError, asyncio.TimeoutError):
+        code = -1
+    if code == 0:
         return True
 
     # Launch Music
@@ -77,23 +114,20 @@ async def _ensure_music_running() -> bool:
 
 async def _open_media_link(url: str, app: str | None = None) -> tuple[bool, str]:
     """Open a URL in the appropriate media player/browser."""
-    system = platform.system()
-
-    if system == "Windows":
+    if _SYSTEM == "Windows":
         try:
             await asyncio.to_thread(os.startfile, url)  # type: ignore[attr-defined]
             return True, ""
         except OSError as exc:
             return False, str(exc)
 
-    if system == "Darwin":
+    if _IS_DARWIN:
         cmd = ["open"]
         if app:
             cmd.extend(["-a", app])
         cmd.append(url)
     else:
-        opener = "xdg-open"
-        cmd = [opener, url]
+        cmd = ["xdg-open", url]
 
     try:
         process = await asyncio.create_subprocess_exec(
@@ -119,7 +153,7 @@ async def _open_media_link(url: str, app: str | None = None) -> tuple[bool, str]
 
 async def _open_in_music_app(url: str) -> tuple[bool, str]:
     """Open an Apple Music URL directly in Music.app and start playback."""
-    if platform.system() != "Darwin":
+    if not _IS_DARWIN:
         return False, "Apple Music playback is only available on macOS."
 
     escaped = url.replace('"', '\\"')
@@ -139,71 +173,85 @@ async def _open_in_music_app(url: str) -> tuple[bool, str]:
     return await _run_applescript(script, timeout=15.0)
 
 
+# Fixed AppleScript sources, built once instead of on every transport command.
+# osascript -e takes the script as an argument, so these stay str rather than bytes.
+_SCRIPT_PLAY: Final[str] = 'tell application "Music" to play'
+_SCRIPT_PAUSE: Final[str] = 'tell application "Music" to pause'
+_SCRIPT_STOP: Final[str] = 'tell application "Music" to stop'
+_SCRIPT_NEXT: Final[str] = 'tell application "Music" to next track'
+_SCRIPT_PREVIOUS: Final[str] = 'tell application "Music" to previous track'
+_SCRIPT_GET_VOLUME: Final[str] = 'tell application "Music" to get sound volume'
+_SCRIPT_CURRENT_TRACK: Final[str] = '''
+tell application "Music"
+    if player state is playing then
+        set track_name to name of current track
+        set artist_name to artist of current track
+        set album_name to album of current track
+        return track_name & " by " & artist_name & " from " & album_name
+    else if player state is paused then
+        set track_name to name of current track
+        set artist_name to artist of current track
+        return track_name & " by " & artist_name & " (paused)"
+    else
+        return "Nothing is playing"
+    end if
+end tell
+'''
+# Parameterized scripts have few enough shapes to precompute, indexed by clamped value
+_VOL_SCRIPTS: Final[tuple[str, ...]] = tuple(
+    f'tell application "Music" to set sound volume to {level}' for level in range(101)
+)
+_SHUFFLE_SCRIPTS: Final[dict[bool, str]] = {
+    enabled: f'tell application "Music" to set shuffle enabled to {str(enabled).lower()}'
+    for enabled in (True, False)
+}
+_REPEAT_SCRIPTS: Final[dict[str, str]] = {
+    mode: f'tell application "Music" to set song repeat to {mode}' for mode in ("off", "one", "all")
+}
+
+
 class AppleMusicController:
     """Control Apple Music via AppleScript on macOS."""
 
     async def play(self) -> str:
         """Resume playback."""
-        script = 'tell application "Music" to play'
-        success, output = await _run_applescript(script)
+        success, output = await _run_applescript(_SCRIPT_PLAY)
         return "Resuming playback" if success else f"Failed to resume: {output}"
 
     async def pause(self) -> str:
         """Pause playback."""
-        script = 'tell application "Music" to pause'
-        success, output = await _run_applescript(script)
+        success, output = await _run_applescript(_SCRIPT_PAUSE)
         return "Paused" if success else f"Failed to pause: {output}"
 
     async def stop(self) -> str:
         """Stop playback."""
-        script = 'tell application "Music" to stop'
-        success, output = await _run_applescript(script)
+        success, output = await _run_applescript(_SCRIPT_STOP)
         return "Stopped" if success else f"Failed to stop: {output}"
 
     async def next_track(self) -> str:
         """Skip to next track."""
-        script = 'tell application "Music" to next track'
-        success, output = await _run_applescript(script)
+        success, output = await _run_applescript(_SCRIPT_NEXT)
         return "Skipping to next track" if success else f"Failed to skip: {output}"
 
     async def previous_track(self) -> str:
         """Go to previous track."""
-        script = 'tell application "Music" to previous track'
-        success, output = await _run_applescript(script)
+        success, output = await _run_applescript(_SCRIPT_PREVIOUS)
         return "Going to previous track" if success else f"Failed: {output}"
 
     async def get_current_track(self) -> str:
         """Get info about currently playing track."""
-        script = '''
-        tell application "Music"
-            if player state is playing then
-                set track_name to name of current track
-                set artist_name to artist of current track
-                set album_name to album of current track
-                return track_name & " by " & artist_name & " from " & album_name
-            else if player state is paused then
-                set track_name to name of current track
-                set artist_name to artist of current track
-                return track_name & " by " & artist_name & " (paused)"
-            else
-                return "Nothing is playing"
-            end if
-        end tell
-        '''
-        success, output = await _run_applescript(script)
+        success, output = await _run_applescript(_SCRIPT_CURRENT_TRACK)
         return output if success else "Could not get track info"
 
     async def set_volume(self, level: int) -> str:
         """Set volume (0-100)."""
-        level = max(0, min(100, level))
-        script = f'tell application "Music" to set sound volume to {level}'
-        success, output = await _run_applescript(script)
+        level = max(0, min(100, int(level)))
+        success, output = await _run_applescript(_VOL_SCRIPTS[level])
         return f"Volume set to {level}%" if success else f"Failed: {output}"
 
     async def get_volume(self) -> str:
         """Get current volume."""
-        script = 'tell application "Music" to get sound volume'
-        success, output = await _run_applescript(script)
+        success, output = await _run_applescript(_SCRIPT_GET_VOLUME)
         if success:
             return f"Volume is at {output}%"
         return "Could not get volume"
@@ -227,7 +275,7 @@ class AppleMusicController:
 
     async def play_catalog(self, query: str, search_type: str = "track") -> tuple[bool, str, Optional[str]]:
         """Play content from the Apple Music catalog."""
-        if platform.system() != "Darwin":
+        if not _IS_DARWIN:
             return False, "Apple Music playback is only available on macOS.", "unsupported"
 
         item, reason = await self._catalog_search(query, search_type)
@@ -281,6 +329,24 @@ class AppleMusicController:
         elif search_type == "album":
             entity = "album"
 
+        key = (query.strip().lower(), entity)
+        cached = _catalog_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            _catalog_cache.move_to_end(key)
+            return cached[1]
+
+        # Concurrent lookups of the same term share one request
+        future = _catalog_inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_catalog(query, entity))
+            _catalog_inflight[key] = future
+            future.add_done_callback(lambda _: _catalog_inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _fetch_catalog(
+        self, query: str, entity: str
+    ) -> tuple[Optional[dict], Optional[str]]:
+        """Query the iTunes Search API and cache the answer unless it failed."""
         params = {
             "term": query,
             "media": "music",
@@ -289,9 +355,8 @@ class AppleMusicController:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=6.0) as client:
-                response = await client.get("https://itunes.apple.com/search", params=params)
-                response.raise_for_status()
+            response = await _get_client().get("https://itunes.apple.com/search", params=params)
+            response.raise_for_status()
         except httpx.HTTPError as exc:
             logger.warning("Apple Music catalog search failed: %s", exc)
             return None, "error"
@@ -303,9 +368,13 @@ class AppleMusicController:
             return None, "error"
 
         results = data.get("results") or []
-        if not results:
-            return None, "not_found"
-        return results[0], None
+        result = (results[0], None) if results else (None, "not_found")
+        key = (query.strip().lower(), entity)
+        _catalog_cache[key] = (time.monotonic() + _CATALOG_CACHE_TTL, result)
+        _catalog_cache.move_to_end(key)
+        if len(_catalog_cache) > _CATALOG_CACHE_SIZE:
+            _catalog_cache.popitem(last=False)
+        return result
 
     def _catalog_url(self, item: dict, search_type: str) -> Optional[str]:
         """Extract a playable Apple Music URL from a search result."""
@@ -342,13 +411,15 @@ class AppleMusicController:
 
     async def search_and_play(self, query: str, search_type: str = "track") -> str:
         """Search for and play a track, artist, or album."""
+        # Uses Music's indexed library search; "every track whose ..." makes the
+        # AppleScript evaluator test each track in the library in turn
         query = query.replace('"', '\\"')
 
         if search_type == "artist":
             script = f'''
             tell application "Music"
                 try
-                    set results to (every track whose artist contains "{query}")
+                    set results to (search library playlist 1 for "{query}" only artists)
                     if (count of results) > 0 then
                         play item 1 of results
                         return "Playing songs by {query}"
@@ -364,7 +435,7 @@ class AppleMusicController:
             script = f'''
             tell application "Music"
                 try
-                    set results to (every track whose album contains "{query}")
+                    set results to (search library playlist 1 for "{query}" only albums)
                     if (count of results) > 0 then
                         play item 1 of results
                         return "Playing album: {query}"
@@ -380,7 +451,7 @@ class AppleMusicController:
             script = f'''
             tell application "Music"
                 try
-                    set results to (every track whose name contains "{query}")
+                    set results to (search library playlist 1 for "{query}" only songs)
                     if (count of results) > 0 then
                         play item 1 of results
                         return "Playing: {query}"
@@ -398,9 +469,7 @@ class AppleMusicController:
 
     async def shuffle(self, enabled: bool = True) -> str:
         """Enable or disable shuffle."""
-        mode = "true" if enabled else "false"
-        script = f'tell application "Music" to set shuffle enabled to {mode}'
-        success, output = await _run_applescript(script)
+        success, output = await _run_applescript(_SHUFFLE_SCRIPTS[bool(enabled)])
         state = "on" if enabled else "off"
         return f"Shuffle {state}" if success else f"Failed: {output}"
 
@@ -408,24 +477,71 @@ class AppleMusicController:
         """Set repeat mode: off, one, all."""
         mode_map = {"off": "off", "one": "one", "all": "all", "song": "one", "playlist": "all"}
         repeat_mode = mode_map.get(mode.lower(), "off")
-        script = f'tell application "Music" to set song repeat to {repeat_mode}'
-        success, output = await _run_applescript(script)
+        success, output = await _run_applescript(_REPEAT_SCRIPTS[repeat_mode])
         return f"Repeat set to {repeat_mode}" if success else f"Failed: {output}"
 
 
+# YouTube Music searches keyed by (normalized query, filter, limit). Catalog results
+# barely change, so repeats within the TTL skip the HTTPS round-trip.
+_YTMUSIC_CACHE_SIZE = 256
+_YTMUSIC_CACHE_TTL = 600.0
+_ytmusic_cache: OrderedDict[tuple[str, Optional[str], int], tuple[float, list[Any]]] = (
+    OrderedDict()
+)
+_ytmusic_cache_lock = threading.Lock()
+
+# Bound concurrent ytmusicapi calls (each is a blocking HTTPS request on a worker
+# thread). asyncio.Semaphore binds to one event loop on Python 3.9, so keep one per loop.
+_YTMUSIC_CONCURRENCY = 4
+_ytmusic_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
+# Queries shorter than this are accidental invocations, not worth a network round trip
+_MIN_QUERY_LENGTH = 2
+
+
 class YouTubeMusicController:
     """Search and play YouTube Music content."""
 
     def __init__(self):
         self.yt = YTMusic() if YTMUSIC_AVAILABLE else None
 
-    def search(self, query: str, filter_type: str = None) -> str:
+    def _search(self, query: str, filter_type: Optional[str], limit: int) -> list[Any]:
+        """Run a ytmusicapi search, reusing recent results for the same query."""
+        key = (query.strip().lower(), filter_type, limit)
+        with _ytmusic_cache_lock:
+            cached = _ytmusic_cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                _ytmusic_cache.move_to_end(key)
+                return cached[1]
+
+        results = self.yt.search(query, filter=filter_type, limit=limit)
+        with _ytmusic_cache_lock:
+            _ytmusic_cache[key] = (time.monotonic() + _YTMUSIC_CACHE_TTL, results)
+            _ytmusic_cache.move_to_end(key)
+            if len(_ytmusic_cache) > _YTMUSIC_CACHE_SIZE:
+                _ytmusic_cache.popitem(last=False)
+        return results
+
+    async def _search_async(self, query: str, filter_type: Optional[str], limit: int) -> list[Any]:
+        """Run _search on a worker thread so the event loop keeps serving audio."""
+        loop = asyncio.get_running_loop()
+        semaphore = _ytmusic_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = _ytmusic_semaphores[loop] = asyncio.Semaphore(_YTMUSIC_CONCURRENCY)
+        async with semaphore:
+            return await asyncio.to_thread(self._search, query, filter_type, limit)
+
+    async def search(self, query: str, filter_type: str = None) -> str:
         """Search YouTube Music and return top results."""
         if not self.yt:
             return "YouTube Music not available (install ytmusicapi)"
+        if len(query.strip()) < _MIN_QUERY_LENGTH:
+            return "Please tell me what to search for."
 
         try:
-            results = self.yt.search(query, filter=filter_type, limit=3)
+            results = await self._search_async(query, filter_type, 3)
             if not results:
                 return f"No results for: {query}"
 
@@ -443,34 +559,40 @@ class YouTubeMusicController:
         except Exception as e:
             return f"Search failed: {e}"
 
-    def get_url(self, query: str) -> tuple[Optional[str], str]:
+    async def get_url(self, query: str) -> tuple[Optional[str], str]:
         """Get a direct YouTube Music URL for a search query."""
         if not self.yt:
             return None, "YouTube Music playback requires ytmusicapi. Run `pip install ytmusicapi`."
-
-        try:
-            filters = ["songs", "videos", None]
-            for filter_type in filters:
-                results = self.yt.search(query, filter=filter_type, limit=1)
-                if not results:
-                    continue
-                item = results[0]
-                video_id = item.get("videoId")
-                if not video_id:
-                    continue
-                title = item.get("title", "Unknown title")
-                artists = ", ".join([a["name"] for a in item.get("artists", [])])
-                description = f"{title} by {artists}" if artists else title
-                return f"https://music.youtube.com/watch?v={video_id}", description
-        except Exception as exc:
-            logger.exception("YouTube Music search failed: %s", exc)
-            return None, f"YouTube Music search failed: {exc}"
+        if len(query.strip()) < _MIN_QUERY_LENGTH:
+            return None, "Please tell me what to play."
+
+        # Query every filter at once and take the first hit in priority order, so the
+        # wait is the slowest single search rather than the sum of all three
+        filters = ("songs", "videos", None)
+        searches = await asyncio.gather(
+            *(self._search_async(query, filter_type, 1) for filter_type in filters),
+            return_exceptions=True,
+        )
+        for results in searches:
+            if isinstance(results, Exception):
+                logger.error("YouTube Music search failed: %s", results, exc_info=results)
+                return None, f"YouTube Music search failed: {results}"
+            if not results:
+                continue
+            item = results[0]
+            video_id = item.get("videoId")
+            if not video_id:
+                continue
+            title = item.get("title", "Unknown title")
+            artists = ", ".join([a["name"] for a in item.get("artists", [])])
+            description = f"{title} by {artists}" if artists else title
+            return f"https://music.youtube.com/watch?v={video_id}", description
 
         return None, f"No results for '{query}' on YouTube Music"
 
     async def play(self, query: str) -> str:
         """Search and play a track on YouTube Music."""
-        url, description = self.get_url(query)
+        url, description = await self.get_url(query)
         if not url:
             return description
 
@@ -505,15 +627,19 @@ async def music_play(query: str = "", provider: str = "apple") -> str:
             return "Please specify what to search for on YouTube Music"
         return await youtube_music.play(query)
 
-    # Apple Music - ensure app is running first
-    await _ensure_music_running()
+    # Apple Music - make sure the app is running before talking to it. The launch
+    # runs in the background so a catalog lookup can overlap it.
+    music_ready = asyncio.ensure_future(_ensure_music_running())
 
     if not query:
+        await music_ready
         return await apple_music.play()
 
     query_lower = query.lower()
 
     async def _play_with_catalog(target: str, search_type: str) -> str:
+        # The lookup doesn't need Music.app; play_catalog then reuses the cached result
+        await asyncio.gather(music_ready, apple_music._catalog_search(target, search_type))
         success, message, reason = await apple_music.play_catalog(target, search_type)
         if success:
             return message
@@ -527,20 +653,21 @@ async def music_play(query: str = "", provider: str = "apple") -> str:
 
     # Check for playlist
     if "playlist" in query_lower:
-        match = re.search(r'playlist[:\s]+(.+)', query, re.IGNORECASE)
+        match = _PLAYLIST_RE.search(query)
         if match:
+            await music_ready
             return await apple_music.play_playlist(match.group(1).strip())
 
-    # Check for artist
-    if any(word in query_lower for word in ["artist", "by", "songs by"]):
-        match = re.search(r'(?:artist|by|songs by)[:\s]+(.+)', query, re.IGNORECASE)
+    # Check for artist ("songs by" is covered by "by")
+    if "artist" in query_lower or "by" in query_lower:
+        match = _ARTIST_RE.search(query)
         if match:
             return await _play_with_catalog(match.group(1).strip(), "artist")
         return await _play_with_catalog(query, "artist")
 
     # Check for album
     if "album" in query_lower:
-        match = re.search(r'album[:\s]+(.+)', query, re.IGNORECASE)
+        match = _ALBUM_RE.search(query)
         if match:
             return await _play_with_catalog(match.group(1).strip(), "album")
 
@@ -627,8 +754,10 @@ async def music_search(query: str, provider: str = "apple") -> str:
         query: What to search for
         provider: 'apple' or 'youtube'
     """
+    if len(query.strip()) < _MIN_QUERY_LENGTH:
+        return "Please tell me what to search for."
     if provider.lower() == "youtube":
-        return youtube_music.search(query)
+        return await youtube_music.search(query)
     return f"To play '{query}', say 'play {query}'"
 
 
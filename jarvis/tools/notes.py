@@ -25,22 +25,25 @@ async def list_notes(limit: int = 10) -> str:
     """List recent notes."""
     limit = max(1, min(50, limit))
     with get_connection() as conn:
+        # Only the preview's characters leave SQLite, however long the note is
         rows = conn.execute(
-            "SELECT id, title, content, created_at FROM notes ORDER BY created_at DESC LIMIT ?",
+            """
+            SELECT id, title, substr(content, 1, 120) AS preview,
+                   length(content) > 120 AS truncated, created_at
+            FROM notes ORDER BY created_at DESC LIMIT ?
+            """,
             (limit,),
         ).fetchall()
 
     if not rows:
         return "No notes yet."
 
-    lines = []
+    lines = ["Notes:"]
     for row in rows:
-        preview = row["content"]
-        if len(preview) > 120:
-            preview = preview[:117] + "..."
+        preview = row["preview"][:117] + "..." if row["truncated"] else row["preview"]
         lines.append(f"{row['id']}: {row['title']} - {preview}")
 
-    return "Notes:\n" + "\n".join(lines)
+    return "\n".join(lines)
 
 
 @llm.function_tool
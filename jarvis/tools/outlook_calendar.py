@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import json
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -10,24 +12,36 @@ from livekit.agents import llm
 from jarvis.config import config
 from jarvis.integrations.outlook import (
     GRAPH_BASE_URL,
-    acquire_access_token,
+    acquire_access_token_async,
     default_window,
+    graph_batch,
     graph_delete,
     graph_get,
     graph_post,
 )
 
 
+@functools.lru_cache(maxsize=4)
+def _calendar_paths(calendar_id: str) -> tuple[str, str, str]:
+    """Return (events path, events URL, calendarView URL) for a calendar ID."""
+    base = f"/me/calendars/{calendar_id}" if calendar_id else "/me"
+    return (
+        f"{base}/events",
+        f"{GRAPH_BASE_URL}{base}/events",
+        f"{GRAPH_BASE_URL}{base}/calendarView",
+    )
+
+
+def _calendar_events_path() -> str:
+    return _calendar_paths(config.outlook.calendar_id)[0]
+
+
 def _calendar_events_url() -> str:
-    if config.outlook.calendar_id:
-        return f"{GRAPH_BASE_URL}/me/calendars/{config.outlook.calendar_id}/events"
-    return f"{GRAPH_BASE_URL}/me/events"
+    return _calendar_paths(config.outlook.calendar_id)[1]
 
 
 def _calendar_view_url() -> str:
-    if config.outlook.calendar_id:
-        return f"{GRAPH_BASE_URL}/me/calendars/{config.outlook.calendar_id}/calendarView"
-    return f"{GRAPH_BASE_URL}/me/calendarView"
+    return _calendar_paths(config.outlook.calendar_id)[2]
 
 
 def _parse_or_default_start_end(start_time: str, end_time: str) -> tuple[str, str]:
@@ -44,6 +58,32 @@ def _timezone_name() -> str:
     return config.calendar.timezone if config.calendar.timezone != "local" else "UTC"
 
 
+def _event_payload(
+    title: str, start_time: str, end_time: str = "", location: str = "", body: str = ""
+) -> dict:
+    if not end_time.strip():
+        try:
+            start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+        except ValueError:
+            start_dt = datetime.now(timezone.utc)
+        end_dt = start_dt + timedelta(minutes=30)
+        end_time = end_dt.isoformat(timespec="seconds").replace("+00:00", "Z")
+
+    time_zone = _timezone_name()
+    payload = {
+        "subject": title.strip(),
+        "start": {"dateTime": start_time.strip(), "timeZone": time_zone},
+        "end": {"dateTime": end_time.strip(), "timeZone": time_zone},
+    }
+
+    if location.strip():
+        payload["location"] = {"displayName": location.strip()}
+    if body.strip():
+        payload["body"] = {"contentType": "Text", "content": body.strip()}
+
+    return payload
+
+
 @llm.function_tool
 async def outlook_list_events(
     start_time: str = "",
@@ -51,7 +91,7 @@ async def outlook_list_events(
     limit: int = 10,
 ) -> str:
     """List upcoming Outlook calendar events."""
-    token, error = acquire_access_token()
+    token, error = await acquire_access_token_async()
     if not token:
         return error
 
@@ -93,29 +133,11 @@ async def outlook_create_event(
     body: str = "",
 ) -> str:
     """Create an Outlook calendar event."""
-    token, error = acquire_access_token()
+    token, error = await acquire_access_token_async()
     if not token:
         return error
 
-    if not end_time.strip():
-        try:
-            start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-        except ValueError:
-            start_dt = datetime.now(timezone.utc)
-        end_dt = start_dt + timedelta(minutes=30)
-        end_time = end_dt.isoformat(timespec="seconds").replace("+00:00", "Z")
-
-    payload = {
-        "subject": title.strip(),
-        "start": {"dateTime": start_time.strip(), "timeZone": _timezone_name()},
-        "end": {"dateTime": end_time.strip(), "timeZone": _timezone_name()},
-    }
-
-    if location.strip():
-        payload["location"] = {"displayName": location.strip()}
-    if body.strip():
-        payload["body"] = {"contentType": "Text", "content": body.strip()}
-
+    payload = _event_payload(title, start_time, end_time, location, body)
     event = await graph_post(_calendar_events_url(), token, payload)
     return f"Created Outlook event: {event.get('subject', title)}"
 
@@ -123,7 +145,7 @@ async def outlook_create_event(
 @llm.function_tool
 async def outlook_delete_event(event_id: str) -> str:
     """Delete an Outlook calendar event by ID."""
-    token, error = acquire_access_token()
+    token, error = await acquire_access_token_async()
     if not token:
         return error
 
@@ -131,6 +153,107 @@ async def outlook_delete_event(event_id: str) -> str:
     return f"Deleted Outlook event {event_id}."
 
 
+def _batch_error(response: dict) -> str:
+    error = (response.get("body") or {}).get("error") or {}
+    return error.get("message") or f"HTTP {response.get('status', '?')}"
+
+
+@llm.function_tool
+async def outlook_create_events(events_json: str) -> str:
+    """Create several Outlook calendar events in one request.
+
+    events_json is a JSON list of objects with "title" and "start_time", and
+    optionally "end_time", "location" and "body".
+    """
+    try:
+        events = json.loads(events_json)
+    except json.JSONDecodeError as exc:
+        return f"Invalid events JSON: {exc}"
+    if not isinstance(events, list) or not events:
+        return "Events must be a non-empty JSON list."
+    for index, event in enumerate(events, start=1):
+        if not isinstance(event, dict) or not event.get("title") or not event.get("start_time"):
+            return f"Event {index} needs a title and start_time."
+
+    token, error = await acquire_access_token_async()
+    if not token:
+        return error
+
+    requests = [
+        {
+            "id": str(index),
+            "method": "POST",
+            "url": _calendar_events_path(),
+            "body": _event_payload(
+                str(event["title"]),
+                str(event["start_time"]),
+                str(event.get("end_time", "")),
+                str(event.get("location", "")),
+                str(event.get("body", "")),
+            ),
+            "headers": {"Content-Type": "application/json"},
+        }
+        for index, event in enumerate(events)
+    ]
+    responses = await graph_batch(token, requests)
+
+    created = []
+    failed = []
+    for request, event in zip(requests, events):
+        response = responses.get(request["id"], {})
+        if 200 <= response.get("status", 0) < 300:
+            created.append((response.get("body") or {}).get("subject", event["title"]))
+        else:
+            failed.append(f"{event['title']} ({_batch_error(response)})")
+
+    lines = []
+    if created:
+        lines.append(f"Created {len(created)} Outlook events: " + ", ".join(created))
+    if failed:
+        lines.append("Failed to create: " + "; ".join(failed))
+    return "\n".join(lines)
+
+
+@llm.function_tool
+async def outlook_delete_events(event_ids: str) -> str:
+    """Delete several Outlook calendar events, given comma-separated IDs."""
+    ids = list(dict.fromkeys(filter(None, map(str.strip, event_ids.split(",")))))
+    if not ids:
+        return "At least one event ID is required."
+
+    token, error = await acquire_access_token_async()
+    if not token:
+        return error
+
+    requests = [
+        {"id": str(index), "method": "DELETE", "url": f"/me/events/{event_id}"}
+        for index, event_id in enumerate(ids)
+    ]
+    responses = await graph_batch(token, requests)
+
+    deleted = []
+    failed = []
+    for request, event_id in zip(requests, ids):
+        response = responses.get(request["id"], {})
+        if 200 <= response.get("status", 0) < 300:
+            deleted.append(event_id)
+        else:
+            failed.append(f"{event_id} ({_batch_error(response)})")
+
+    lines = []
+    if deleted:
+        lines.append(f"Deleted {len(deleted)} Outlook events.")
+    if failed:
+        lines.append("Failed to delete: " + "; ".join(failed))
+    return "\n".join(lines)
+
+
 def get_outlook_tools() -> list:
     """Get Outlook calendar tools."""
-    return [outlook_list_events, outlook_create_event, outlook_delete_event]
+    return [
+        outlook_list_events,
+        outlook_create_event,
+        outlook_delete_event,
+        outlook_create_events,
+        outlook_delete_events,
+    ]
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from livekit.agents import llm
 
 from jarvis.config import config
+from jarvis.jsonutil import loads as json_loads
 from jarvis.storage import get_connection
 from jarvis.tools.smart_home import set_device_state, toggle_device
 from jarvis.tools.system import open_application, run_shell_command, set_volume
@@ -26,48 +26,107 @@ def _validate_actions(actions: list[dict[str, Any]]) -> tuple[bool, str]:
     return True, ""
 
 
+async def _wait(action: dict[str, Any], confirm: bool) -> str:
+    seconds = float(action.get("seconds", 1))
+    await asyncio.sleep(max(0.0, min(300.0, seconds)))
+    return f"Waited {seconds} seconds."
+
+
+_ActionHandler = Callable[[dict[str, Any], bool], Awaitable[str]]
+
+_ACTION_HANDLERS: dict[str, _ActionHandler] = {
+    "device_on": lambda action, confirm: set_device_state(
+        entity_id=action.get("entity_id", ""), state="on"
+    ),
+    "device_off": lambda action, confirm: set_device_state(
+        entity_id=action.get("entity_id", ""), state="off"
+    ),
+    "toggle_device": lambda action, confirm: toggle_device(
+        entity_id=action.get("entity_id", "")
+    ),
+    "set_volume": lambda action, confirm: set_volume(level=int(action.get("level", 50))),
+    "open_app": lambda action, confirm: open_application(app_name=action.get("app_name", "")),
+    "shell_command": lambda action, confirm: run_shell_command(
+        command=action.get("command", ""), confirm=confirm
+    ),
+    "wait": _wait,
+}
+
+
 async def _execute_action(action: dict[str, Any], confirm: bool) -> str:
     action_type = action.get("type", "").strip().lower()
+    handler = _ACTION_HANDLERS.get(action_type)
+    if handler is None:
+        return f"Unknown action type: {action_type}"
+    return await handler(action, confirm)
 
-    if action_type in {"device_on", "device_off"}:
-        entity_id = action.get("entity_id", "")
-        state = "on" if action_type == "device_on" else "off"
-        return await set_device_state(entity_id=entity_id, state=state)
-    if action_type == "toggle_device":
-        return await toggle_device(entity_id=action.get("entity_id", ""))
-    if action_type == "set_volume":
-        return await set_volume(level=int(action.get("level", 50)))
-    if action_type == "open_app":
-        return await open_application(app_name=action.get("app_name", ""))
-    if action_type == "shell_command":
-        return await run_shell_command(
-            command=action.get("command", ""),
-            confirm=confirm,
-        )
-    if action_type == "wait":
-        seconds = float(action.get("seconds", 1))
-        await asyncio.sleep(max(0.0, min(300.0, seconds)))
-        return f"Waited {seconds} seconds."
 
-    return f"Unknown action type: {action_type}"
+# Actions that run alone unless marked otherwise: waits are explicit pauses, and shell
+# commands often depend on the one before them
+_BARRIER_ACTIONS = frozenset({"wait", "shell_command"})
+
+
+def _action_groups(actions: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """Split actions into runs that can execute concurrently.
+
+    "wait" and "shell_command" actions, and any action with "sequential": true, are
+    barriers: each runs alone, after everything before it and before anything after
+    it. A shell command may opt in to concurrency with "sequential": false. Two
+    actions on the same entity_id never share a group, so they keep their order.
+    """
+    groups: list[list[dict[str, Any]]] = []
+    current: list[dict[str, Any]] = []
+    entities: set[str] = set()
+    for action in actions:
+        action_type = str(action.get("type", "")).strip().lower()
+        sequential = bool(action.get("sequential", action_type in _BARRIER_ACTIONS))
+        entity_id = str(action.get("entity_id") or "") or None
+        if current and (sequential or entity_id in entities):
+            groups.append(current)
+            current = []
+            entities = set()
+        if sequential:
+            groups.append([action])
+            continue
+        current.append(action)
+        if entity_id is not None:
+            entities.add(entity_id)
+    if current:
+        groups.append(current)
+    return groups
+
+
+async def _run_action(action: dict[str, Any], confirm: bool) -> str:
+    """Execute one action, reporting a failure instead of raising it."""
+    try:
+        return await _execute_action(action, confirm)
+    except Exception as exc:
+        return f"Action {action.get('type', '?')} failed: {exc}"
 
 
 @llm.function_tool
 async def add_routine(name: str, actions_json: str, description: str = "") -> str:
-    """Create or update a routine with a JSON list of actions."""
+    """Create or update a routine with a JSON list of actions.
+
+    Consecutive device and app actions run concurrently. "wait" and "shell_command"
+    actions, or any marked "sequential": true, run on their own between the actions
+    around them, and actions on the same entity_id keep their order.
+    """
     name = name.strip()
     if not name:
         return "Routine name is required."
 
     try:
-        actions = json.loads(actions_json)
-    except json.JSONDecodeError as exc:
+        actions = json_loads(actions_json)
+    except ValueError as exc:
         return f"Invalid JSON: {exc}"
 
     is_valid, error = _validate_actions(actions)
     if not is_valid:
         return error
 
+    # Store the validated document as given rather than re-serializing it
+    actions_json = actions_json.strip()
     with get_connection() as conn:
         existing = conn.execute(
             "SELECT id FROM routines WHERE name = ? ORDER BY created_at DESC LIMIT 1",
@@ -80,7 +139,7 @@ async def add_routine(name: str, actions_json: str, description: str = "") -> st
                 SET description = ?, actions_json = ?, created_at = CURRENT_TIMESTAMP
                 WHERE id = ?
                 """,
-                (description.strip() or None, json.dumps(actions), existing["id"]),
+                (description.strip() or None, actions_json, existing["id"]),
             )
         else:
             conn.execute(
@@ -88,7 +147,7 @@ async def add_routine(name: str, actions_json: str, description: str = "") -> st
                 INSERT INTO routines (name, description, actions_json)
                 VALUES (?, ?, ?)
                 """,
-                (name, description.strip() or None, json.dumps(actions)),
+                (name, description.strip() or None, actions_json),
             )
         conn.commit()
 
@@ -147,8 +206,8 @@ async def run_routine(name: str, confirm: bool = False) -> str:
         return "Confirmation required to run routines. Re-run with confirm=true."
 
     try:
-        actions = json.loads(row["actions_json"])
-    except json.JSONDecodeError:
+        actions = json_loads(row["actions_json"])
+    except ValueError:
         return "Routine actions are corrupted."
 
     is_valid, error = _validate_actions(actions)
@@ -156,8 +215,10 @@ async def run_routine(name: str, confirm: bool = False) -> str:
         return error
 
     results = []
-    for action in actions:
-        results.append(await _execute_action(action, confirm))
+    for group in _action_groups(actions):
+        results.extend(
+            await asyncio.gather(*(_run_action(action, confirm) for action in group))
+        )
 
     return "Routine complete:\n" + "\n".join(results)
 
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import re
 import shlex
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 
 from jarvis.config import config
 
@@ -28,13 +31,22 @@ DANGEROUS_PATTERNS = [
     "chmod -R 777",
 ]
 
+# One alternation over all patterns, so a command is scanned once by the regex engine
+# instead of once per pattern. Patterns are compared lowercased, like the command.
+_DANGEROUS_BY_LOWER = {pattern.lower(): pattern for pattern in DANGEROUS_PATTERNS}
+_DANGEROUS_RE = re.compile("|".join(map(re.escape, _DANGEROUS_BY_LOWER)))
+
+
+# (allowed command list, its lowercased prefixes); rebuilt when the list is replaced
+_allowed_prefixes_cache: Optional[tuple[list[str], tuple[str, ...]]] = None
+
 
 def _is_relative_to(path: Path, parent: Path) -> bool:
-    try:
-        path.relative_to(parent)
-        return True
-    except ValueError:
-        return False
+    # Both sides are resolve()d, so a separator-aware string prefix test is exact and
+    # avoids relative_to's exception on every miss. normcase matches Windows semantics.
+    path_str = os.path.normcase(str(path))
+    parent_str = os.path.normcase(str(parent))
+    return path_str == parent_str or path_str.startswith(parent_str.rstrip(os.sep) + os.sep)
 
 
 def get_allowed_commands() -> list[str]:
@@ -44,15 +56,35 @@ def get_allowed_commands() -> list[str]:
     return DEFAULT_ALLOWED_COMMANDS
 
 
+@functools.lru_cache(maxsize=8)
+def _resolve_paths(paths: tuple[str, ...]) -> tuple[Path, ...]:
+    # resolve() stats every path component, so each distinct path set is resolved once
+    return tuple(Path(p).expanduser().resolve() for p in paths)
+
+
 def get_allowed_paths() -> list[Path]:
     """Return allowed file path prefixes."""
-    allowed = []
     if config.safety.allowed_paths:
-        allowed.extend(Path(p).expanduser().resolve() for p in config.safety.allowed_paths)
+        paths = tuple(map(str, config.safety.allowed_paths))
     else:
-        allowed.append(Path.cwd().resolve())
-        allowed.append(config.storage.data_dir.expanduser().resolve())
-    return allowed
+        paths = (os.getcwd(), str(config.storage.data_dir))
+    return list(_resolve_paths(paths))
+
+
+def invalidate_allowed_paths() -> None:
+    """Drop cached path resolutions and command prefixes after a config change."""
+    global _allowed_prefixes_cache
+    _resolve_paths.cache_clear()
+    _allowed_prefixes_cache = None
+
+
+def _allowed_prefixes() -> tuple[str, ...]:
+    global _allowed_prefixes_cache
+    commands = get_allowed_commands()
+    cached = _allowed_prefixes_cache
+    if cached is None or cached[0] is not commands:
+        cached = _allowed_prefixes_cache = (commands, tuple(p.lower() for p in commands))
+    return cached[1]
 
 
 def check_command_safety(command: str, confirm: bool) -> Tuple[bool, str]:
@@ -62,12 +94,13 @@ def check_command_safety(command: str, confirm: bool) -> Tuple[bool, str]:
         return False, "Command is empty."
 
     lowered = normalized.lower()
-    for pattern in DANGEROUS_PATTERNS:
-        if pattern in lowered:
-            return False, f"Command blocked for safety: contains '{pattern}'"
+    match = _DANGEROUS_RE.search(lowered)
+    if match:
+        pattern = _DANGEROUS_BY_LOWER[match.group()]
+        return False, f"Command blocked for safety: contains '{pattern}'"
 
-    allowed_prefixes = get_allowed_commands()
-    if any(lowered.startswith(prefix.lower()) for prefix in allowed_prefixes):
+    # str.startswith tests the whole tuple in C
+    if lowered.startswith(_allowed_prefixes()):
         return True, "Command allowed"
 
     if not config.safety.require_confirmation:
@@ -8,51 +8,70 @@ Provides:
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-import os
-from pathlib import Path
+import shutil
 from typing import Tuple
 
 from livekit.agents import llm
 
 from jarvis.config import config
 from jarvis.audit import append_event
+from jarvis.tools.base import kill_process, read_limited
 from jarvis.tools.safety import check_command_safety, check_path_safety
 from jarvis.tools.system import run_shell_command
 
 logger = logging.getLogger(__name__)
 
+_MAX_OUTPUT_CHARS = 6000
 
-async def _run_exec(cmd: list[str], timeout_s: float) -> Tuple[str, int]:
+
+async def _run_exec(
+    cmd: list[str], timeout_s: float, max_chars: int = _MAX_OUTPUT_CHARS
+) -> Tuple[str, int]:
     try:
         process = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
         )
-        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout_s)
-        out = stdout.decode() if stdout else ""
-        err = stderr.decode() if stderr else ""
-        combined = (out + ("\n" + err if err else "")).strip()
-        return combined, process.returncode or 0
-    except asyncio.TimeoutError:
-        return f"Timed out after {timeout_s} seconds.", -1
     except FileNotFoundError:
         return "Executable not found.", -1
     except Exception as exc:
         return f"Error: {exc}", -1
 
+    try:
+        # Stream instead of communicate(): a chatty job is stopped once the output we
+        # would keep is full, rather than buffered in memory and then truncated.
+        # UTF-8 needs at most 4 bytes per character.
+        data, truncated = await asyncio.wait_for(
+            read_limited(process.stdout, max_chars * 4), timeout=timeout_s
+        )
+        if truncated:
+            await kill_process(process)
+            output = data.decode("utf-8", errors="replace")[:max_chars]
+            return f"{output}\n... [output limit reached; command stopped]", -1
+        await asyncio.wait_for(process.wait(), timeout=timeout_s)
+    except asyncio.TimeoutError:
+        await kill_process(process)
+        return f"Timed out after {timeout_s} seconds.", -1
+    except Exception as exc:
+        await kill_process(process)
+        return f"Error: {exc}", -1
+    output = _truncate(data.decode("utf-8", errors="replace").strip(), max_chars)
+    return output, process.returncode or 0
 
-def _truncate(text: str, max_chars: int = 6000) -> str:
+
+def _truncate(text: str, max_chars: int = _MAX_OUTPUT_CHARS) -> str:
     if len(text) <= max_chars:
         return text
     return text[:max_chars] + "\n... [truncated]"
 
 
+@functools.lru_cache(maxsize=1)
 def _docker_available() -> bool:
-    return any(
-        (Path(p) / "docker").exists() for p in os.getenv("PATH", "").split(os.pathsep) if p
-    )
+    # PATH lookups are constant for the process; install Docker, then restart Jarvis
+    return shutil.which("docker") is not None
 
 
 @llm.function_tool
@@ -144,7 +163,7 @@ async def run_sandboxed_command(
     )
 
     output, code = await _run_exec(docker_cmd, timeout_s=timeout_s)
-    output = _truncate(output or "(no output)")
+    output = output or "(no output)"
     if code == 0:
         return output
     return f"Command failed (exit {code}):\n{output}"
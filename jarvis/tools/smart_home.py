@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import importlib.util
 import logging
+import re
 from typing import Optional
 
 import httpx
@@ -12,18 +14,39 @@ from jarvis.config import config
 
 logger = logging.getLogger(__name__)
 
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 _http_client: Optional[httpx.AsyncClient] = None
-
-
-def _get_client() -> httpx.AsyncClient:
-    global _http_client
-    if _http_client is None:
-        _http_client = httpx.AsyncClient(timeout=10.0, follow_redirects=True)
+# Token baked into _http_client's default headers; a new token gets a new client
+_http_client_token: Optional[str] = None
+
+
+async def _get_client() -> httpx.AsyncClient:
+    global _http_client, _http_client_token
+    token = config.home_assistant.token
+    if _http_client is None or _http_client.is_closed or _http_client_token != token:
+        previous = _http_client
+        # HTTP/2 multiplexes a routine's concurrent calls over one connection
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            follow_redirects=True,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        _http_client_token = token
+        if previous is not None and not previous.is_closed:
+            # Token changed: release the old client's pooled connections. The swap
+            # happens first so concurrent callers never pick up the closing client.
+            await previous.aclose()
     return _http_client
 
 
-def _get_headers() -> dict[str, str]:
-    return {"Authorization": f"Bearer {config.home_assistant.token}"}
+# Renders "entity_id: state" lines for one domain inside Home Assistant, so only the
+# matching entities cross the wire instead of every entity's full state object
+_DOMAIN_RE = re.compile(r"[a-z_][a-z0-9_]*")
+_DOMAIN_TEMPLATE = (
+    "{%% for s in (states.%s | list)[:%d] %%}{{ s.entity_id }}: {{ s.state }}\n{%% endfor %%}"
+)
 
 
 def _ensure_configured() -> Optional[str]:
@@ -41,12 +64,9 @@ async def get_device_state(entity_id: str) -> str:
     if error:
         return error
 
-    client = _get_client()
+    client = await _get_client()
     try:
-        response = await client.get(
-            f"{config.home_assistant.url}/api/states/{entity_id}",
-            headers=_get_headers(),
-        )
+        response = await client.get(f"{config.home_assistant.url}/api/states/{entity_id}")
         response.raise_for_status()
         data = response.json()
         return f"{entity_id} is {data.get('state')}."
@@ -69,11 +89,10 @@ async def set_device_state(entity_id: str, state: str) -> str:
     domain = entity_id.split(".", 1)[0]
     service = "turn_on" if normalized == "on" else "turn_off"
 
-    client = _get_client()
+    client = await _get_client()
     try:
         response = await client.post(
             f"{config.home_assistant.url}/api/services/{domain}/{service}",
-            headers=_get_headers(),
             json={"entity_id": entity_id},
         )
         response.raise_for_status()
@@ -90,11 +109,10 @@ async def toggle_device(entity_id: str) -> str:
     if error:
         return error
 
-    client = _get_client()
+    client = await _get_client()
     try:
         response = await client.post(
             f"{config.home_assistant.url}/api/services/homeassistant/toggle",
-            headers=_get_headers(),
             json={"entity_id": entity_id},
         )
         response.raise_for_status()
@@ -114,12 +132,22 @@ async def list_devices(domain: str = "", limit: int = 20) -> str:
     limit = max(1, min(50, limit))
     domain = domain.strip().lower()
 
-    client = _get_client()
+    client = await _get_client()
+    if domain and _DOMAIN_RE.fullmatch(domain):
+        try:
+            response = await client.post(
+                f"{config.home_assistant.url}/api/template",
+                json={"template": _DOMAIN_TEMPLATE % (domain, limit)},
+            )
+            response.raise_for_status()
+            rendered = response.text.strip()
+            return f"Devices:\n{rendered}" if rendered else "No devices found."
+        except Exception as exc:
+            # Template rendering can be disabled or restricted; fetch all states instead
+            logger.warning("Home Assistant template list failed, falling back: %s", exc)
+
     try:
-        response = await client.get(
-            f"{config.home_assistant.url}/api/states",
-            headers=_get_headers(),
-        )
+        response = await client.get(f"{config.home_assistant.url}/api/states")
         response.raise_for_status()
         data = response.json()
 
@@ -12,12 +12,15 @@ import asyncio
 import logging
 import platform
 from datetime import datetime
-from typing import List, Tuple
+from typing import Final, List, Tuple
+from zoneinfo import ZoneInfo
 
 from livekit.agents import llm
 
 logger = logging.getLogger(__name__)
 
+_SYSTEM: Final[str] = platform.system()
+
 
 async def _run_command(cmd: List[str], timeout: float = 30.0) -> Tuple[str, int]:
     """Run a shell command and return output and return code."""
@@ -50,10 +53,7 @@ async def get_current_time(timezone: str = "local") -> str:
             now = datetime.now()
             return f"The current time is {now.strftime('%I:%M %p on %A, %B %d, %Y')}"
         else:
-            import pytz
-
-            tz = pytz.timezone(timezone)
-            now = datetime.now(tz)
+            now = datetime.now(ZoneInfo(timezone))
             return f"The time in {timezone} is {now.strftime('%I:%M %p on %A, %B %d, %Y')}"
     except Exception as e:
         return f"Could not get time: {str(e)}"
@@ -66,16 +66,14 @@ async def open_application(app_name: str) -> str:
     Args:
         app_name: Name of the application to open (e.g., 'Safari', 'Terminal', 'Spotify')
     """
-    system = platform.system()
-
-    if system == "Darwin":  # macOS
+    if _SYSTEM == "Darwin":  # macOS
         cmd = ["open", "-a", app_name]
-    elif system == "Windows":
+    elif _SYSTEM == "Windows":
         cmd = ["start", "", app_name]
-    elif system == "Linux":
+    elif _SYSTEM == "Linux":
         cmd = [app_name.lower()]
     else:
-        return f"Unsupported operating system: {system}"
+        return f"Unsupported operating system: {_SYSTEM}"
 
     output, code = await _run_command(cmd)
 
@@ -130,20 +128,19 @@ async def run_shell_command(command: str, confirm: bool = False) -> str:
 @llm.function_tool
 async def get_system_info() -> str:
     """Get basic system information."""
-    system = platform.system()
     release = platform.release()
     machine = platform.machine()
     python_version = platform.python_version()
 
     # Get uptime on macOS/Linux
     uptime = "unknown"
-    if system in ("Darwin", "Linux"):
+    if _SYSTEM in ("Darwin", "Linux"):
         output, code = await _run_command(["uptime"])
         if code == 0:
             uptime = output
 
     return (
-        f"System: {system} {release}\n"
+        f"System: {_SYSTEM} {release}\n"
         f"Architecture: {machine}\n"
         f"Python: {python_version}\n"
         f"Uptime: {uptime}"
@@ -158,14 +155,12 @@ async def set_volume(level: int) -> str:
         level: Volume level from 0 to 100
     """
     level = max(0, min(100, level))
-    system = platform.system()
-
-    if system == "Darwin":
+    if _SYSTEM == "Darwin":
         cmd = ["osascript", "-e", f"set volume output volume {level}"]
-    elif system == "Linux":
+    elif _SYSTEM == "Linux":
         cmd = ["amixer", "set", "Master", f"{level}%"]
     else:
-        return f"Volume control not supported on {system}"
+        return f"Volume control not supported on {_SYSTEM}"
 
     output, code = await _run_command(cmd)
 
@@ -178,9 +173,7 @@ async def set_volume(level: int) -> str:
 @llm.function_tool
 async def toggle_dark_mode() -> str:
     """Toggle dark mode on macOS."""
-    system = platform.system()
-
-    if system != "Darwin":
+    if _SYSTEM != "Darwin":
         return "Dark mode toggle is only supported on macOS"
 
     script = '''
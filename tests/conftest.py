@@ -27,6 +27,7 @@ def isolate_test_db(tmp_path: Path):
 
         with patch.object(storage_module, "get_db_path", test_get_db_path):
             yield test_db_dir
+        storage_module.close_connections()
 
 
 @pytest.fixture
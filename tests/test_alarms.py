@@ -232,6 +232,85 @@ class TestTimers:
         cancel_result = await cancel_timer(label="pasta")
         assert "cancelled" in cancel_result.lower()
 
+    @pytest.mark.asyncio
+    async def test_cancel_timer_by_duplicate_label(self):
+        """Test that duplicate labels cancel the most recent timer first."""
+        from jarvis.tools.alarms import cancel_timer, list_timers, set_timer
+
+        first = await set_timer("30 seconds", label="tea")
+        second = await set_timer("60 seconds", label="Tea")
+        first_id = first.split("Timer ID: ")[1].strip()
+        second_id = second.split("Timer ID: ")[1].strip()
+
+        cancel_result = await cancel_timer(label="tea")
+        assert second_id in cancel_result
+        assert first_id in await list_timers()
+
+        cancel_result = await cancel_timer(label="TEA")
+        assert first_id in cancel_result
+        assert "tea" not in (await list_timers()).lower()
+
+    @pytest.mark.asyncio
+    async def test_timers_fire_in_deadline_order(self):
+        """Test that timers fire in order and cancelled timers stay silent."""
+        import asyncio
+
+        from jarvis.tools import alarms
+
+        fired = []
+
+        async def callback(message: str) -> None:
+            fired.append(message)
+
+        alarms.set_timer_callback(callback)
+        try:
+            await alarms.set_timer("2 seconds", label="second")
+            await alarms.set_timer("1 second", label="first")
+            await alarms.set_timer("1 second", label="cancelled")
+            await alarms.cancel_timer(label="cancelled")
+
+            for _ in range(300):
+                if len(fired) == 2:
+                    break
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.05)
+        finally:
+            alarms.set_timer_callback(None)
+
+        assert fired == ["Timer for first finished!", "Timer for second finished!"]
+        assert not alarms._ACTIVE_TIMERS
+        assert alarms._timer_runner.done()
+
+    @pytest.mark.asyncio
+    async def test_slow_timer_callback_does_not_delay_others(self):
+        """Test that a hung notification doesn't hold back later timers."""
+        import asyncio
+
+        from jarvis.tools import alarms
+
+        fired = []
+        release = asyncio.Event()
+
+        async def callback(message: str) -> None:
+            fired.append(message)
+            if "slow" in message:
+                await release.wait()
+
+        alarms.set_timer_callback(callback)
+        try:
+            await alarms.set_timer("1 second", label="slow")
+            await alarms.set_timer("2 seconds", label="next")
+            for _ in range(300):
+                if len(fired) == 2:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            release.set()
+            await asyncio.sleep(0)
+            alarms.set_timer_callback(None)
+
+        assert fired == ["Timer for slow finished!", "Timer for next finished!"]
+
     @pytest.mark.asyncio
     async def test_cancel_timer_not_found(self):
         """Test cancelling a non-existent timer."""
@@ -308,6 +387,14 @@ class TestHelperFunctions:
         result = _format_iso(dt)
         assert "2025-01-15T10:30:00Z" == result
 
+    def test_format_iso_converts_to_utc(self):
+        """Test ISO formatting of a non-UTC datetime."""
+        from datetime import datetime, timedelta, timezone
+        from jarvis.tools.alarms import _format_iso
+
+        dt = datetime(2025, 1, 15, 10, 30, 0, tzinfo=timezone(timedelta(hours=-5)))
+        assert _format_iso(dt) == "2025-01-15T15:30:00Z"
+
 
 @pytest.mark.asyncio
 async def test_get_alarm_tools():
@@ -323,3 +410,56 @@ async def test_get_alarm_tools():
     assert "set_timer" in tool_names
     assert "cancel_timer" in tool_names
     assert "list_timers" in tool_names
+
+
+class TestAlarmScheduler:
+    """Tests for the background alarm scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_scheduler_marks_due_alarm_triggered(self):
+        """Test that due alarms fire and record an ISO UTC triggered_at."""
+        import asyncio
+        import re
+
+        from jarvis.storage import get_connection
+        from jarvis.tools.alarms import add_alarm, start_alarm_scheduler, stop_alarm_scheduler
+
+        fired = []
+
+        async def callback(message: str) -> None:
+            fired.append(message)
+
+        await add_alarm("Wake up", "2020-01-01T07:00:00Z", message="Rise and shine")
+        start_alarm_scheduler(callback)
+        try:
+            for _ in range(100):
+                if fired:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            stop_alarm_scheduler()
+
+        assert fired == ["Alarm: Rise and shine"]
+        with get_connection() as conn:
+            row = conn.execute("SELECT status, triggered_at FROM alarms").fetchone()
+        assert row["status"] == "triggered"
+        assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z", row["triggered_at"])
+
+    def test_legacy_triggered_at_migrated(self):
+        """Test that CURRENT_TIMESTAMP-style triggered_at values are rewritten."""
+        from jarvis.storage import close_connections, get_connection
+
+        with get_connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO alarms (title, fire_at, status, triggered_at)
+                VALUES ('Old', '2024-05-01T08:00:00Z', 'triggered', '2024-05-01 08:00:03')
+                """
+            )
+            conn.execute("PRAGMA user_version = 0")
+            conn.commit()
+        close_connections()
+
+        with get_connection() as conn:
+            row = conn.execute("SELECT triggered_at FROM alarms").fetchone()
+        assert row["triggered_at"] == "2024-05-01T08:00:03Z"
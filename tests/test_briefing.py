@@ -0,0 +1,79 @@
+"""Tests for daily briefing tools."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+
+async def _slow_weather(city: str) -> str:
+    await asyncio.sleep(0.05)
+    return f"Weather in {city}: sunny"
+
+
+async def _outlook_events() -> list[str]:
+    return ["Standup (09:00 - 09:15)"]
+
+
+@pytest.fixture
+def patched_sources():
+    """Replace network-backed briefing sources with local fakes."""
+    import jarvis.tools.briefing as briefing
+
+    with patch.object(briefing, "get_weather", _slow_weather), \
+            patch.object(briefing, "_fetch_outlook_events", _outlook_events):
+        yield briefing
+
+
+@pytest.mark.asyncio
+async def test_daily_brief_keeps_section_order(patched_sources):
+    """Test that sections keep their order even when fetched concurrently."""
+    from jarvis.tools.tasks import add_task
+
+    await add_task("Review pull request", priority="high")
+
+    result = await patched_sources.daily_brief(city="Malibu")
+    lines = result.split("\n")
+
+    assert lines[0] == "Weather in Malibu: sunny"
+    assert lines[1] == "Tasks: Review pull request [high]"
+    assert lines[2] == "Outlook: Standup (09:00 - 09:15)"
+
+
+@pytest.mark.asyncio
+async def test_daily_brief_empty_tasks(patched_sources):
+    """Test the empty-task text and that empty calendars are omitted."""
+    result = await patched_sources.daily_brief(city="Malibu", include_outlook=False)
+
+    assert "Tasks: none due." in result
+    assert "Local calendar" not in result
+
+
+@pytest.mark.asyncio
+async def test_daily_brief_source_failure(patched_sources):
+    """Test that a failing source is reported by section name."""
+
+    def _broken_local(include_tasks: bool, include_events: bool):
+        raise RuntimeError("database is locked")
+
+    with patch.object(patched_sources, "_fetch_local", _broken_local):
+        result = await patched_sources.daily_brief(city="Malibu")
+
+    assert "Weather in Malibu: sunny" in result
+    assert "Tasks: unavailable." in result
+    assert "Local calendar: unavailable." in result
+    assert "Outlook: Standup (09:00 - 09:15)" in result
+
+
+@pytest.mark.asyncio
+async def test_daily_brief_propagates_cancellation(patched_sources):
+    """Test that a cancelled source cancels the briefing."""
+
+    async def _cancelled_outlook() -> list[str]:
+        raise asyncio.CancelledError()
+
+    with patch.object(patched_sources, "_fetch_outlook_events", _cancelled_outlook):
+        with pytest.raises(asyncio.CancelledError):
+            await patched_sources.daily_brief(city="Malibu")
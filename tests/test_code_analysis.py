@@ -59,6 +59,28 @@ from typing import Optional, List
         assert "pathlib:Path" in result.imports
 
 
+    def test_analyze_methods_and_guarded_imports(self):
+        """Test that class bodies and top-level blocks are scanned, function bodies not."""
+        from jarvis.tools.code_analysis import _analyze_python_code
+
+        code = """
+try:
+    import msal
+except ImportError:
+    msal = None
+
+class Service:
+    async def start(self):
+        import json
+
+        def helper():
+            pass
+"""
+        result = _analyze_python_code(code)
+        assert result.classes == ["Service"]
+        assert result.functions == ["start"]
+        assert result.imports == ["msal"]
+
 class TestAnalyzeNonPythonCode:
     """Tests for non-Python code analysis."""
 
@@ -91,6 +113,24 @@ class MyComponent {
         assert "MyComponent" in result["classes"]
 
 
+    def test_analyze_imports_and_arrow_functions(self):
+        """Test that every pattern kind is picked up in a single pass."""
+        from jarvis.tools.code_analysis import _analyze_non_python_code
+
+        code = """
+import React from 'react'
+from app.models import User
+  add = (a, b) => a + b
+def ruby_style(x)
+function
+notAFunction() {}
+"""
+        result = _analyze_non_python_code(code)
+        assert result["imports"] == ["React", "app.models"]
+        assert result["functions"] == ["add", "ruby_style"]
+        assert result["classes"] == []
+
+
 @pytest.mark.asyncio
 async def test_analyze_code_python_file(tmp_path):
     """Test analyzing a Python file."""
@@ -110,6 +150,33 @@ class Greeter:
     assert "Greeter" in result
 
 
+@pytest.mark.asyncio
+async def test_analyze_code_reuses_cached_result(tmp_path, monkeypatch):
+    """Test that unchanged content is not re-parsed."""
+    from jarvis.tools import code_analysis
+
+    calls = []
+    real = code_analysis._analyze_python_code
+
+    def counting(source):
+        calls.append(source)
+        return real(source)
+
+    monkeypatch.setattr(code_analysis, "_analyze_python_code", counting)
+    file_path = tmp_path / "cached_module_test.py"
+    file_path.write_text("def cached_once():\n    pass\n")
+
+    first = await code_analysis.analyze_code(str(file_path), confirm=True)
+    second = await code_analysis.analyze_code(str(file_path), confirm=True)
+    assert first == second
+    assert len(calls) == 1
+
+    file_path.write_text("def changed():\n    pass\n")
+    result = await code_analysis.analyze_code(str(file_path), confirm=True)
+    assert "changed" in result
+    assert len(calls) == 2
+
+
 @pytest.mark.asyncio
 async def test_analyze_code_not_found(tmp_path):
     """Test analyzing non-existent file."""
@@ -147,6 +214,39 @@ async def test_get_project_structure(tmp_path):
     assert "README.md" in result
 
 
+@pytest.mark.asyncio
+async def test_get_project_structure_layout(tmp_path):
+    """Test tree connectors, nesting and directory suffixes."""
+    from jarvis.tools.code_analysis import get_project_structure
+
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "mod.py").write_text("mod")
+    (tmp_path / "src" / "app.py").write_text("app")
+    (tmp_path / "setup.py").write_text("setup")
+
+    result = await get_project_structure(str(tmp_path), confirm=True)
+    assert result.splitlines()[1:] == [
+        "├── setup.py",
+        "└── src/",
+        "    ├── app.py",
+        "    └── pkg/",
+        "        └── mod.py",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_project_structure_limit(tmp_path):
+    """Test that only the first limit files are rendered."""
+    from jarvis.tools.code_analysis import get_project_structure
+
+    for i in range(80):
+        (tmp_path / f"mod_{i:02d}.py").write_text("x")
+
+    result = await get_project_structure(str(tmp_path), limit=50, confirm=True)
+    assert "(showing first 50 files)" in result.splitlines()[0]
+    assert len(result.splitlines()) == 51
+
+
 @pytest.mark.asyncio
 async def test_get_project_structure_empty(tmp_path):
     """Test getting structure of empty directory."""
@@ -165,6 +265,61 @@ async def test_get_project_structure_invalid(tmp_path):
     assert "invalid" in result.lower()
 
 
+def test_list_repo_files_respects_gitignore(tmp_path):
+    """Test git-backed listing includes untracked files and skips ignored ones."""
+    import subprocess
+
+    from jarvis.tools.code_analysis import _list_repo_files, _repo_files_cache
+
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    (tmp_path / ".gitignore").write_text("*.log\n")
+    (tmp_path / "main.py").write_text("main")
+    (tmp_path / "my notes.md").write_text("notes")
+    (tmp_path / "debug.log").write_text("noise")
+    subprocess.run(["git", "add", "main.py"], cwd=tmp_path, check=True)
+
+    names = sorted(path.name for path in _list_repo_files(tmp_path))
+    assert names == [".gitignore", "main.py", "my notes.md"]
+
+    (tmp_path / "main.py").unlink()
+    _repo_files_cache.clear()
+    names = sorted(path.name for path in _list_repo_files(tmp_path))
+    assert names == [".gitignore", "my notes.md"]
+
+
+def test_list_repo_files_cached_until_index_changes(tmp_path, monkeypatch):
+    """Test that git listings are reused until the index is rewritten."""
+    import os
+    import subprocess
+
+    from jarvis.tools import code_analysis
+
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    (tmp_path / "a.py").write_text("a")
+    subprocess.run(["git", "add", "a.py"], cwd=tmp_path, check=True)
+
+    calls = []
+    real = code_analysis._run_git
+
+    def counting(args, cwd):
+        calls.append(args)
+        return real(args, cwd)
+
+    monkeypatch.setattr(code_analysis, "_run_git", counting)
+    first = code_analysis._list_repo_files(tmp_path)
+    assert code_analysis._list_repo_files(tmp_path) == first
+    assert len(calls) == 1
+
+    (tmp_path / "b.py").write_text("b")
+    subprocess.run(["git", "add", "b.py"], cwd=tmp_path, check=True)
+    index = tmp_path / ".git" / "index"
+    stat = index.stat()
+    os.utime(index, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    names = sorted(path.name for path in code_analysis._list_repo_files(tmp_path))
+    assert names == ["a.py", "b.py"]
+    assert len(calls) == 2
+
+
 @pytest.mark.asyncio
 async def test_count_lines(tmp_path):
     """Test counting lines of code."""
@@ -206,6 +361,19 @@ async def test_find_todos(tmp_path):
     assert "file4.py" not in result
 
 
+@pytest.mark.asyncio
+async def test_find_todos_line_numbers(tmp_path):
+    """Test that findings report 1-based line numbers, once per line."""
+    from jarvis.tools.code_analysis import find_todos
+
+    (tmp_path / "mod.py").write_text("a\n# todo: one\nb\r\nc\n# FIXME and HACK\n")
+
+    result = await find_todos(str(tmp_path), confirm=True)
+    assert "mod.py:2: # todo: one" in result
+    assert "mod.py:5: # FIXME and HACK" in result
+    assert result.count("mod.py:5") == 1
+
+
 @pytest.mark.asyncio
 async def test_find_todos_none(tmp_path):
     """Test finding TODOs when none exist."""
@@ -230,6 +398,38 @@ async def test_find_todos_limit(tmp_path):
     assert len(todo_lines) == 5
 
 
+@pytest.mark.asyncio
+async def test_find_todos_limit_across_chunks(tmp_path):
+    """Test that the limit holds when files are scanned in several chunks."""
+    from jarvis.tools.code_analysis import find_todos
+
+    for i in range(150):
+        (tmp_path / f"mod_{i:03d}.py").write_text(f"# TODO: item {i}\ncode")
+
+    result = await find_todos(str(tmp_path), limit=100, confirm=True)
+    todo_lines = [line for line in result.split("\n") if "TODO" in line]
+    assert len(todo_lines) == 100
+
+
+@pytest.mark.asyncio
+async def test_count_lines_totals(tmp_path):
+    """Test that per-extension totals are merged across files."""
+    from jarvis.tools.code_analysis import count_lines
+
+    for i in range(100):
+        (tmp_path / f"mod_{i:03d}.py").write_text("a\nb")
+    (tmp_path / "app.js").write_text("x")
+    (tmp_path / "notes.md").write_text("one\ntwo\n")
+    (tmp_path / "empty.txt").write_text("")
+
+    result = await count_lines(str(tmp_path), confirm=True)
+    assert "Total lines: 203" in result
+    assert ".md: 2" in result
+    assert ".txt: 0" in result
+    assert ".py: 200" in result
+    assert ".js: 1" in result
+
+
 @pytest.mark.asyncio
 async def test_diff_files(tmp_path):
     """Test diffing two files."""
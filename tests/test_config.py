@@ -47,3 +47,13 @@ def test_config_from_env():
         assert config.livekit.url == "wss://test.livekit.cloud"
         assert config.stt.deepgram_api_key == "test_deepgram"
         assert config.llm.anthropic_api_key == "test_anthropic"
+
+
+def test_config_use_uvloop_flag():
+    """Test that uvloop is opt-in via JARVIS_USE_UVLOOP."""
+    from jarvis.config import JarvisConfig
+
+    with patch.dict(os.environ, {}, clear=True):
+        assert JarvisConfig().use_uvloop is False
+    with patch.dict(os.environ, {"JARVIS_USE_UVLOOP": "true"}, clear=True):
+        assert JarvisConfig().use_uvloop is True
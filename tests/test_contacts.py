@@ -0,0 +1,60 @@
+"""Tests for contact tools."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_find_contact_by_word_prefix():
+    """Test that contacts are found by the start of any name word."""
+    from jarvis.tools.contacts import add_contact, find_contact
+
+    await add_contact("Pepper Potts", phone="555-0100")
+    await add_contact("Happy Hogan")
+
+    result = await find_contact("pot")
+    assert "Pepper Potts - 555-0100" in result
+    assert "Happy" not in result
+
+
+@pytest.mark.asyncio
+async def test_find_contact_substring_fallback():
+    """Test that mid-word queries still match via substring search."""
+    from jarvis.tools.contacts import add_contact, find_contact
+
+    await add_contact("James Rhodes")
+
+    result = await find_contact("hode")
+    assert "James Rhodes" in result
+
+
+@pytest.mark.asyncio
+async def test_find_contact_quotes_and_no_match():
+    """Test that FTS syntax characters in a query are treated literally."""
+    from jarvis.tools.contacts import add_contact, find_contact
+
+    await add_contact("Tony Stark")
+
+    assert "no matching" in (await find_contact('"AND OR*')).lower()
+
+
+def test_contacts_fts_tracks_updates_and_deletes():
+    """Test that triggers keep the FTS index in sync with the contacts table."""
+    from jarvis.storage import get_connection
+
+    with get_connection() as conn:
+        conn.execute("INSERT INTO contacts (name) VALUES ('Natasha Romanoff')")
+        conn.execute("UPDATE contacts SET name = 'Natalia Romanova'")
+        conn.commit()
+        assert not conn.execute(
+            "SELECT rowid FROM contacts_fts WHERE contacts_fts MATCH 'natasha'"
+        ).fetchall()
+        assert conn.execute(
+            "SELECT rowid FROM contacts_fts WHERE contacts_fts MATCH 'romanova'"
+        ).fetchall()
+        conn.execute("DELETE FROM contacts")
+        conn.commit()
+        assert not conn.execute(
+            "SELECT rowid FROM contacts_fts WHERE contacts_fts MATCH 'romanova'"
+        ).fetchall()
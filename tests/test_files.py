@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
 
@@ -113,6 +115,19 @@ async def test_read_file_is_directory(tmp_path):
     assert "directory" in result.lower()
 
 
+@pytest.mark.asyncio
+async def test_read_file_exact_limit(tmp_path):
+    """Test that a file of exactly max_chars characters is not marked truncated."""
+    from jarvis.tools.files import read_file
+
+    file_path = tmp_path / "exact.txt"
+    file_path.write_text("é" * 10, encoding="utf-8")
+
+    assert await read_file(str(file_path), max_chars=10, confirm=True) == "é" * 10
+    result = await read_file(str(file_path), max_chars=9, confirm=True)
+    assert result == "é" * 9 + "\n... [truncated]"
+
+
 @pytest.mark.asyncio
 async def test_write_file(tmp_path):
     """Test writing a file."""
@@ -166,6 +181,47 @@ async def test_search_files(tmp_path):
     assert "file3.txt" not in result
 
 
+@pytest.mark.asyncio
+async def test_search_files_nested(tmp_path):
+    """Test that search descends into subdirectories."""
+    from jarvis.tools.files import search_files
+
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    (nested / "deep.txt").write_text("needle")
+    (tmp_path / "top.txt").write_text("hay")
+
+    result = await search_files("needle", str(tmp_path), confirm=True)
+    assert "deep.txt" in result
+    assert "top.txt" not in result
+
+
+@pytest.mark.asyncio
+async def test_search_files_large_and_binary(tmp_path):
+    """Test that matches past the first block are found and binary files skipped."""
+    from jarvis.tools.files import search_files
+
+    (tmp_path / "large.txt").write_text("x" * 10000 + "needle")
+    (tmp_path / "blob.bin").write_bytes(b"\0\1\2needle")
+
+    result = await search_files("needle", str(tmp_path), confirm=True)
+    assert "large.txt" in result
+    assert "blob.bin" not in result
+
+
+def test_iter_files_skips_named_entries(tmp_path):
+    """Test that the scandir walker yields files only and honours skip."""
+    from jarvis.tools.base import iter_files
+
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "HEAD").write_text("ref")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_text("main")
+
+    names = sorted(Path(p).name for p in iter_files(str(tmp_path), skip={".git"}))
+    assert names == ["main.py"]
+
+
 @pytest.mark.asyncio
 async def test_search_files_limit(tmp_path):
     """Test that search_files respects limit."""
@@ -0,0 +1,126 @@
+"""Tests for GitHub tools."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def github_transport():
+    """Route the shared GitHub client through a mock transport."""
+    from jarvis.tools import github
+
+    requests: list[httpx.Request] = []
+    responses: list[httpx.Response] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with patch.object(github, "_http_client", client), \
+            patch.object(github.config.github, "token", "token"), \
+            patch.object(github.config.github, "etag_cache", True):
+        yield requests, responses
+
+
+@pytest.mark.asyncio
+async def test_get_revalidates_with_etag(github_transport):
+    """Test that a 304 reply is served from the ETag cache."""
+    from jarvis.tools.github import _get
+
+    requests, responses = github_transport
+    url = "https://api.github.com/repos/octo/repo"
+    responses.append(httpx.Response(200, json={"full_name": "octo/repo"}, headers={"ETag": '"v1"'}))
+    responses.append(httpx.Response(304))
+
+    assert await _get(url, "token") == {"full_name": "octo/repo"}
+    assert await _get(url, "token") == {"full_name": "octo/repo"}
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_etag_cache_pruned_to_newest_rows():
+    """Test that storing responses evicts the oldest beyond the row limit."""
+    from jarvis.storage import get_connection
+    from jarvis.tools import github
+
+    with patch.object(github, "_ETAG_CACHE_MAX_ROWS", 2):
+        for name in ("a", "b", "c"):
+            github._store_etag(f"https://api.github.com/{name}", f'"{name}"', "{}")
+
+    with get_connection() as conn:
+        urls = [row[0] for row in conn.execute("SELECT url FROM github_etags ORDER BY url")]
+    assert urls == ["https://api.github.com/b", "https://api.github.com/c"]
+
+
+@pytest.mark.asyncio
+async def test_get_cache_keyed_by_params(github_transport):
+    """Test that different query params do not share an ETag."""
+    from jarvis.tools.github import _get
+
+    requests, responses = github_transport
+    url = "https://api.github.com/user/repos"
+    responses.append(httpx.Response(200, json=[1], headers={"ETag": '"a"'}))
+    responses.append(httpx.Response(200, json=[2], headers={"ETag": '"b"'}))
+
+    assert await _get(url, "token", params={"per_page": "1"}) == [1]
+    assert await _get(url, "token", params={"per_page": "2"}) == [2]
+    assert "If-None-Match" not in requests[1].headers
+
+
+@pytest.mark.asyncio
+async def test_read_file_decodes_prefix(github_transport):
+    """Test that large files are truncated by characters after a partial decode."""
+    import base64
+
+    from jarvis.tools.github import github_read_file
+
+    _, responses = github_transport
+    body = "é" * 50 + "x" * 5000
+    encoded = base64.encodebytes(body.encode("utf-8")).decode("ascii")
+    for _ in range(2):
+        responses.append(
+            httpx.Response(200, json={"type": "file", "encoding": "base64", "content": encoded})
+        )
+
+    result = await github_read_file("octo/repo", "big.txt", max_chars=60, confirm=True)
+    assert result == "é" * 50 + "x" * 10 + "\n... [truncated]"
+
+    result = await github_read_file("octo/repo", "big.txt", max_chars=6000, confirm=True)
+    assert result == body
+
+
+@pytest.mark.asyncio
+async def test_list_repos_uses_graphql(github_transport):
+    """Test that repos are listed from the trimmed GraphQL query."""
+    from jarvis.tools.github import github_list_repos
+
+    requests, responses = github_transport
+    nodes = [{"nameWithOwner": "octo/repo", "isPrivate": True, "stargazerCount": 3}]
+    responses.append(
+        httpx.Response(200, json={"data": {"viewer": {"repositories": {"nodes": nodes}}}})
+    )
+
+    result = await github_list_repos(limit=5)
+    assert result == "Repos:\nocto/repo (private) ⭐ 3"
+    assert requests[0].url.path == "/graphql"
+
+
+@pytest.mark.asyncio
+async def test_list_repos_falls_back_to_rest(github_transport):
+    """Test that GraphQL errors fall back to the REST listing."""
+    from jarvis.tools.github import github_list_repos
+
+    requests, responses = github_transport
+    responses.append(httpx.Response(200, json={"errors": [{"message": "scope missing"}]}))
+    responses.append(
+        httpx.Response(200, json=[{"full_name": "octo/a", "private": False, "stargazers_count": 1}])
+    )
+
+    result = await github_list_repos(limit=5)
+    assert result == "Repos:\nocto/a (public) ⭐ 1"
+    assert requests[1].url.path == "/user/repos"
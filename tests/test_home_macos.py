@@ -0,0 +1,251 @@
+"""Tests for macOS HomeKit/Shortcuts home tools."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_run_shortcuts_batch_single_script():
+    """Test that several shortcuts run from one AppleScript with per-item status."""
+    from jarvis.tools import home_macos
+
+    scripts = []
+
+    async def fake_applescript(script, timeout=5.0):
+        scripts.append(script)
+        return True, "ok\nerror: not found"
+
+    with patch.object(home_macos, "_run_applescript", fake_applescript):
+        results = await home_macos._run_shortcuts_batch(["Lock Front Door", 'Lock "Back" Door'])
+
+    assert len(scripts) == 1
+    assert 'run shortcut "Lock Front Door"' in scripts[0]
+    assert 'run shortcut "Lock \\"Back\\" Door"' in scripts[0]
+    assert results == [(True, "ok"), (False, "error: not found")]
+    assert 'set end of results to "error: " & my oneLine(errMsg)' in scripts[0]
+
+
+@pytest.mark.asyncio
+async def test_run_shortcuts_batch_mismatched_statuses():
+    """Test that a status count that doesn't match the shortcuts reports none as ok."""
+    from jarvis.tools import home_macos
+
+    async def fake_applescript(script, timeout=5.0):
+        return True, "error: door jammed\nplease retry\nok"
+
+    with patch.object(home_macos, "_run_applescript", fake_applescript):
+        results = await home_macos._run_shortcuts_batch(["Lock Front Door", "Lock Back Door"])
+
+    assert results == [(False, "error: unknown result")] * 2
+
+
+@pytest.mark.asyncio
+async def test_home_lock_all_falls_back_to_batch():
+    """Test that locking all doors falls back to one batched run of each door."""
+    from jarvis.tools import home_macos
+
+    async def fake_shortcut(name, input_text=""):
+        return False, "missing"
+
+    async def fake_batch(names):
+        assert names == ["Lock Front Door", "Lock Back Door"]
+        return [(True, "ok"), (True, "ok")]
+
+    with patch.object(home_macos, "_IS_DARWIN", True), \
+            patch.object(home_macos, "_run_shortcut", fake_shortcut), \
+            patch.object(home_macos, "_run_shortcuts_batch", fake_batch):
+        assert await home_macos.home_lock("lock", "all") == "All doors locked"
+
+
+@pytest.mark.asyncio
+async def test_run_shortcuts_batch_falls_back_to_concurrent_cli():
+    """Test that a failed batch script runs each shortcut concurrently via the CLI."""
+    import asyncio
+
+    from jarvis.tools import home_macos
+
+    running = []
+    peak = []
+
+    async def failing_applescript(script, timeout=5.0):
+        return False, "Not authorized to send Apple events"
+
+    async def fake_shortcut(name, input_text=""):
+        running.append(name)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(name)
+        return True, name
+
+    with patch.object(home_macos, "_run_applescript", failing_applescript), \
+            patch.object(home_macos, "_run_shortcut", fake_shortcut):
+        results = await home_macos._run_shortcuts_batch(["Lock Front Door", "Lock Back Door"])
+
+    assert results == [(True, "Lock Front Door"), (True, "Lock Back Door")]
+    assert max(peak) == 2
+
+
+@pytest.mark.asyncio
+async def test_home_lights_dim_level():
+    """Test that the dim level is parsed from the action."""
+    from jarvis.tools import home_macos
+
+    calls = []
+
+    async def fake_shortcut(name, input_text=""):
+        calls.append((name, input_text))
+        return name.startswith("Set "), ""
+
+    with patch.object(home_macos, "_IS_DARWIN", True), \
+            patch.object(home_macos, "_run_shortcut", fake_shortcut):
+        result = await home_macos.home_lights("dim 40%", "office")
+
+    assert result == "Set office lights to 40%"
+    assert calls[-1] == ("Set Office Lights", "40%")
+
+
+@pytest.mark.asyncio
+async def test_run_shortcut_passes_input_on_stdin():
+    """Test that shortcut input goes to stdin without a shell."""
+    from jarvis.tools import home_macos
+
+    calls = {}
+
+    class FakeProcess:
+        returncode = 0
+
+        async def communicate(self, data=None):
+            calls["stdin"] = data
+            return b"done", b""
+
+    async def fake_exec(*args, **kwargs):
+        calls["args"] = args
+        return FakeProcess()
+
+    async def unknown_shortcuts():
+        return None
+
+    with patch.object(home_macos, "_IS_DARWIN", True), \
+            patch.object(home_macos, "_load_available_shortcuts", unknown_shortcuts), \
+            patch.object(home_macos.asyncio, "create_subprocess_exec", fake_exec), \
+            patch.object(home_macos.asyncio, "create_subprocess_shell") as shell:
+        result = await home_macos._run_shortcut("Set Temperature", '72 "cool"; rm -rf ~')
+
+    assert result == (True, "done")
+    assert calls["args"] == ("shortcuts", "run", "Set Temperature")
+    assert calls["stdin"] == b'72 "cool"; rm -rf ~\n'
+    shell.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_home_lights_exact_mapping_runs_once():
+    """Test that an exact phrase maps straight to its shortcut."""
+    from jarvis.tools import home_macos
+
+    calls = []
+
+    async def fake_shortcut(name, input_text=""):
+        calls.append(name)
+        return True, ""
+
+    with patch.object(home_macos, "_IS_DARWIN", True), \
+            patch.object(home_macos, "_run_shortcut", fake_shortcut):
+        result = await home_macos.home_lights("turn off lights", "")
+        assert result == "Lights turned turn off lights"
+        assert await home_macos.home_lights("off", "") == "Lights turned off"
+
+    assert calls == ["Lights off", "Lights off"]
+
+
+@pytest.mark.asyncio
+async def test_run_shortcut_dedup_shares_inflight_run():
+    """Test that identical idempotent runs in flight share one subprocess."""
+    import asyncio
+
+    from jarvis.tools import home_macos
+
+    calls = []
+
+    async def fake_exec(name, input_text):
+        calls.append((name, input_text))
+        await asyncio.sleep(0.05)
+        return True, "ok"
+
+    async def unknown_shortcuts():
+        return None
+
+    with patch.object(home_macos, "_IS_DARWIN", True), \
+            patch.object(home_macos, "_load_available_shortcuts", unknown_shortcuts), \
+            patch.object(home_macos, "_exec_shortcut", fake_exec):
+        results = await asyncio.gather(
+            *(home_macos._run_shortcut("Home Status", dedup=True) for _ in range(3))
+        )
+        assert results == [(True, "ok")] * 3
+        assert calls == [("Home Status", "")]
+        assert not home_macos._inflight_shortcuts
+
+        await asyncio.gather(
+            home_macos._run_shortcut("Lights on"), home_macos._run_shortcut("Lights on")
+        )
+        assert len(calls) == 3
+
+
+@pytest.fixture
+def shortcuts_listing():
+    """Answer `shortcuts list` with a fixed set of names and count the listings."""
+    from jarvis.tools import home_macos
+
+    listings = []
+
+    async def fake_run_command(cmd, timeout=10.0):
+        listings.append(cmd)
+        return True, "Home Status\nLock Front Door\n"
+
+    home_macos._available_shortcuts = None
+    with patch.object(home_macos, "_IS_DARWIN", True), \
+            patch.object(home_macos, "_run_command", fake_run_command):
+        yield listings
+    home_macos._available_shortcuts = None
+
+
+@pytest.mark.asyncio
+async def test_run_shortcut_skips_unknown_names(shortcuts_listing):
+    """Test that shortcuts missing from `shortcuts list` fail without a run."""
+    from jarvis.tools import home_macos
+
+    runs = []
+
+    async def fake_exec(name, input_text):
+        runs.append(name)
+        return True, ""
+
+    with patch.object(home_macos, "_exec_shortcut", fake_exec):
+        assert await home_macos._run_shortcut("Set Scene Movie Time") == (
+            False, "Shortcut not found: Set Scene Movie Time"
+        )
+        assert await home_macos._run_shortcut("Home Status") == (True, "")
+
+    assert runs == ["Home Status"]
+    assert shortcuts_listing == [["shortcuts", "list"]]
+
+
+@pytest.mark.asyncio
+async def test_run_shortcuts_batch_skips_unknown_names(shortcuts_listing):
+    """Test that a batch only scripts the shortcuts that exist."""
+    from jarvis.tools import home_macos
+
+    scripts = []
+
+    async def fake_applescript(script, timeout=5.0):
+        scripts.append(script)
+        return True, "ok"
+
+    with patch.object(home_macos, "_run_applescript", fake_applescript):
+        results = await home_macos._run_shortcuts_batch(["Lock Front Door", "Lock Back Door"])
+
+    assert results == [(True, "ok"), (False, "Shortcut not found: Lock Back Door")]
+    assert len(scripts) == 1
+    assert "Lock Back Door" not in scripts[0]
@@ -0,0 +1,238 @@
+"""Tests for macOS tools."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def commands():
+    """Record spawned commands; pgrep reports every app as running."""
+    from jarvis.tools import macos
+
+    calls = []
+
+    async def fake_run_command(cmd, timeout=10.0):
+        calls.append(cmd)
+        return ("123", 0) if cmd[0] == "pgrep" else ("", 0)
+
+    macos._app_running_cache.clear()
+    with patch.object(macos, "_run_command", fake_run_command):
+        yield calls
+    macos._app_running_cache.clear()
+
+
+def _probes(calls):
+    return [cmd for cmd in calls if cmd[0] == "pgrep"]
+
+
+@pytest.mark.asyncio
+async def test_is_app_running_cached(commands):
+    """Test that repeated probes within the TTL reuse the first answer."""
+    from jarvis.tools.macos import _is_app_running
+
+    assert await _is_app_running("Music")
+    assert await _is_app_running("Music")
+    assert _probes(commands) == [["pgrep", "-x", "Music"]]
+
+    assert await _is_app_running("Spotify")
+    assert len(_probes(commands)) == 2
+
+
+@pytest.mark.asyncio
+async def test_is_app_running_expires(commands):
+    """Test that cached probes expire after the TTL."""
+    from jarvis.tools import macos
+
+    await macos._is_app_running("Music")
+    with patch.object(macos.time, "monotonic", lambda: 10**9):
+        await macos._is_app_running("Music")
+    assert len(_probes(commands)) == 2
+
+
+@pytest.mark.asyncio
+async def test_is_app_running_falls_back_to_system_events():
+    """Test that System Events is asked only when pgrep itself fails."""
+    from jarvis.tools import macos
+
+    calls = []
+
+    async def fake_run_command(cmd, timeout=10.0):
+        calls.append(cmd[0])
+        if cmd[0] == "pgrep":
+            return "Error: No such file or directory", -1
+        return "true", 0
+
+    macos._app_running_cache.clear()
+    with patch.object(macos, "_run_command", fake_run_command):
+        assert await macos._is_app_running("Music")
+    macos._app_running_cache.clear()
+    assert calls == ["pgrep", "osascript"]
+
+
+@pytest.mark.asyncio
+async def test_open_app_invalidates_cache(commands):
+    """Test that launching an app drops its cached running state."""
+    from jarvis.tools import macos
+
+    await macos._is_app_running("Music")
+    await macos._open_app("Music")
+    await macos._is_app_running("Music")
+    assert len(_probes(commands)) == 2
+
+
+@pytest.mark.asyncio
+async def test_music_play_single_osascript(commands):
+    """Test that play on a running Music app is one fused AppleScript call."""
+    from jarvis.tools import macos
+
+    with patch.object(macos, "_IS_DARWIN", True):
+        result = await macos._music_command("play", "music")
+
+    assert result == "Play command sent to Music"
+    assert [cmd[0] for cmd in commands] == ["pgrep", "osascript"]
+    assert 'tell application "Music" to activate' in commands[-1][-1]
+    assert "keystroke space" in commands[-1][-1]
+
+
+@pytest.mark.asyncio
+async def test_now_playing_skips_apps_not_running():
+    """Test that now_playing never launches an app just to query it."""
+    from jarvis.tools import macos
+
+    commands = []
+
+    async def fake_run_command(cmd, timeout=10.0):
+        commands.append(cmd)
+        if cmd[0] == "pgrep":
+            return ("42", 0) if cmd[-1] == "Spotify" else ("", 1)
+        return "Song — Artist", 0
+
+    macos._app_running_cache.clear()
+    with patch.object(macos, "_IS_DARWIN", True), \
+            patch.object(macos, "_run_command", fake_run_command):
+        result = await macos.now_playing()
+    macos._app_running_cache.clear()
+
+    assert result == "Spotify: Song — Artist"
+    assert not any(cmd[0] == "open" for cmd in commands)
+    assert not any('tell application "Music" to if' in cmd[-1] for cmd in commands)
+
+
+def test_applescript_date_single_assignment():
+    """Test that dates are built with one locale-independent field assignment."""
+    from datetime import datetime
+
+    from jarvis.tools import macos
+
+    dt = datetime(2025, 2, 5, 9, 30, 15).astimezone()
+    script = macos._applescript_date("startDate", dt)
+    assert script.splitlines() == [
+        "set startDate to (current date)",
+        "set {day of startDate, year of startDate, month of startDate, "
+        "day of startDate, time of startDate} to {1, 2025, February, 5, 34215}",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_apple_calendars_parses_output():
+    """Test that calendar names are trimmed and blanks dropped."""
+    from jarvis.tools import macos
+
+    async def fake_osascript(script, timeout=10.0):
+        return "Home, Work ,, Family", 0
+
+    with patch.object(macos, "_IS_DARWIN", True), \
+            patch.object(macos, "_osascript", fake_osascript):
+        result = await macos.list_apple_calendars()
+    assert result == "Calendars:\nHome\nWork\nFamily"
+
+
+@pytest.mark.asyncio
+async def test_run_command_replaces_invalid_utf8():
+    """Test that undecodable command output does not raise."""
+    import sys
+
+    from jarvis.tools.macos import _run_command
+
+    cmd = [sys.executable, "-c", "import sys; sys.stdout.buffer.write(b'ok\\xff ')"]
+    assert await _run_command(cmd) == ("ok�", 0)
+
+
+@pytest.mark.asyncio
+async def test_run_command_kills_on_timeout():
+    """Test that a timed-out child is killed and reaped."""
+    import sys
+
+    from jarvis.tools import macos
+
+    spawned = []
+    real_exec = macos.asyncio.create_subprocess_exec
+
+    async def recording_exec(*args, **kwargs):
+        process = await real_exec(*args, **kwargs)
+        spawned.append(process)
+        return process
+
+    with patch.object(macos.asyncio, "create_subprocess_exec", recording_exec):
+        cmd = [sys.executable, "-c", "import time; time.sleep(30)"]
+        assert await macos._run_command(cmd, timeout=0.2) == ("Command timed out", -1)
+    assert spawned[0].returncode is not None
+
+
+def test_parse_datetime_uses_offset_for_each_date():
+    """Test that naive and aware inputs resolve to local time for that date."""
+    from datetime import datetime, timezone
+
+    from jarvis.tools.macos import _parse_datetime
+
+    naive = _parse_datetime("2025-07-01T09:00")
+    assert naive == datetime(2025, 7, 1, 9, 0).astimezone()
+    assert naive.hour == 9
+
+    aware = _parse_datetime("2025-01-05T09:00Z")
+    assert aware == datetime(2025, 1, 5, 9, 0, tzinfo=timezone.utc)
+    assert aware.utcoffset() == aware.astimezone().utcoffset()
+    assert _parse_datetime("not a date") is None
+
+
+@pytest.mark.asyncio
+async def test_music_command_polls_for_launch():
+    """Test that a cold start waits only until the app shows up as running."""
+    import time
+
+    from jarvis.tools import macos
+
+    commands = []
+
+    async def fake_run_command(cmd, timeout=10.0):
+        commands.append(cmd)
+        if cmd[0] == "pgrep":
+            return ("42", 0) if len(_probes(commands)) > 3 else ("", 1)
+        return "", 0
+
+    macos._app_running_cache.clear()
+    started = time.monotonic()
+    with patch.object(macos, "_IS_DARWIN", True), \
+            patch.object(macos, "_run_command", fake_run_command):
+        result = await macos._music_command("play", "music")
+    elapsed = time.monotonic() - started
+    macos._app_running_cache.clear()
+
+    assert result == "Play command sent to Music"
+    assert ["open", "-a", "Music"] in commands
+    assert len(_probes(commands)) == 4
+    assert elapsed < 1.0
+
+
+def test_macos_tool_lists_are_shared():
+    """Test that the tool getters return the same prebuilt tuples."""
+    from jarvis.tools.home_macos import get_home_macos_tools
+    from jarvis.tools.macos import get_macos_tools
+
+    assert get_macos_tools() is get_macos_tools()
+    assert len(get_macos_tools()) == 12
+    assert get_home_macos_tools() is get_home_macos_tools()
+    assert len(get_home_macos_tools()) == 10
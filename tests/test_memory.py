@@ -73,6 +73,70 @@ async def test_recall_memory_with_tags():
     assert "IDE" not in result
 
 
+@pytest.mark.asyncio
+async def test_recall_memory_tags_match_exactly():
+    """Test that tag filters match whole tags, not substrings."""
+    from jarvis.tools.memory import remember, recall_memory
+
+    await remember("Standup at nine", tags="Work, meetings")
+    await remember("Homework due Friday", tags="homework")
+
+    result = await recall_memory(tags="work")
+    assert "Standup" in result
+    assert "Homework" not in result
+
+    result = await recall_memory(tags="homework, meetings")
+    assert "Standup" in result
+    assert "Homework" in result
+
+
+def test_memory_tags_backfilled_by_migration():
+    """Test that existing comma-separated tags are moved into memory_tags."""
+    from jarvis.storage import close_connections, get_connection
+
+    with get_connection() as conn:
+        conn.execute("INSERT INTO memory (content, tags) VALUES ('Old', 'a, B,a')")
+        conn.execute("PRAGMA user_version = 1")
+        conn.commit()
+    close_connections()
+
+    with get_connection() as conn:
+        rows = conn.execute("SELECT tag FROM memory_tags ORDER BY tag").fetchall()
+    assert [row["tag"] for row in rows] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_recall_memory_prefix():
+    """Test that prefix recall only matches at the start of a memory."""
+    from jarvis.storage import get_connection
+    from jarvis.tools.memory import _SQL_RECALL, recall_memory, remember
+
+    await remember("Python is great")
+    await remember("I like python")
+
+    result = await recall_memory(query="pyth", prefix=True)
+    assert "Python is great" in result
+    assert "I like python" not in result
+
+    with get_connection() as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN " + _SQL_RECALL["prefix", False], ("pyth%", 5)
+        ).fetchall()
+    assert "idx_memory_content_prefix" in " ".join(row["detail"] for row in plan)
+
+
+def test_recall_memory_ordered_by_rank_index():
+    """Test that unfiltered recall reads in index order instead of sorting."""
+    from jarvis.storage import get_connection
+    from jarvis.tools.memory import _SQL_RECALL
+
+    with get_connection() as conn:
+        plan = conn.execute("EXPLAIN QUERY PLAN " + _SQL_RECALL["all", False], (5,)).fetchall()
+    details = " ".join(row["detail"] for row in plan)
+    assert "idx_memory_rank" in details
+    assert "TEMP B-TREE" not in details
+
+
 @pytest.mark.asyncio
 async def test_recall_memory_limit():
     """Test recall memory respects limit."""
@@ -87,6 +151,42 @@ async def test_recall_memory_limit():
     assert len(lines) <= 4  # Header + 3 items
 
 
+@pytest.mark.asyncio
+async def test_recall_memory_substring_via_fts():
+    """Test that full-text recall keeps LIKE's case-insensitive substring matching."""
+    from jarvis.tools.memory import recall_memory, remember
+
+    await remember("User likes Python programming")
+    await remember("User dislikes Java")
+
+    result = await recall_memory(query="YTHON PROG")
+    assert "Python" in result
+    assert "Java" not in result
+
+    # Too short for trigrams: served by LIKE
+    result = await recall_memory(query="ja")
+    assert "Java" in result
+    assert "Python" not in result
+
+    result = await recall_memory(query='say "hi"')
+    assert "no matching" in result.lower()
+
+
+def test_memory_fts_tracks_deletes():
+    """Test that the memory FTS index follows deletes."""
+    from jarvis.storage import fts_phrase_query, get_connection
+
+    with get_connection() as conn:
+        conn.execute("INSERT INTO memory (content) VALUES ('walk the dog')")
+        conn.execute("DELETE FROM memory")
+        conn.commit()
+        rows = conn.execute(
+            "SELECT rowid FROM memory_fts WHERE memory_fts MATCH ?",
+            (fts_phrase_query("the dog"),),
+        ).fetchall()
+    assert rows == []
+
+
 @pytest.mark.asyncio
 async def test_forget_memory():
     """Test deleting a memory by ID."""
@@ -126,15 +226,24 @@ async def test_forget_memory_by_tag():
     await remember("Work memory 2", tags="work")
     await remember("Personal memory", tags="personal")
 
+    await remember("Homework memory", tags="homework")
+
     result = await forget_memory_by_tag("work")
     assert "deleted" in result.lower()
     assert "2" in result  # Should delete 2 memories
 
-    # Verify only personal remains
+    # Verify only personal and homework remain
     recall_result = await recall_memory()
     assert "Personal" in recall_result
+    assert "Homework" in recall_result
     assert "Work" not in recall_result
 
+    from jarvis.storage import get_connection
+
+    with get_connection() as conn:
+        tags = conn.execute("SELECT tag FROM memory_tags ORDER BY tag").fetchall()
+    assert [row["tag"] for row in tags] == ["homework", "personal"]
+
 
 @pytest.mark.asyncio
 async def test_forget_memory_by_tag_empty():
@@ -156,6 +265,41 @@ async def test_forget_memory_before():
     result = await forget_memory_before(30)
     assert "no memories" in result.lower() or "0" in result
 
+    from jarvis.storage import get_connection
+
+    with get_connection() as conn:
+        conn.execute(
+            "INSERT INTO memory (content, created_at) "
+            "VALUES ('Old memory', datetime('now', '-31 days'))"
+        )
+        conn.commit()
+
+    result = await forget_memory_before(30)
+    assert "deleted 1" in result.lower()
+
+
+@pytest.mark.asyncio
+async def test_forget_memory_before_in_chunks():
+    """Test that large purges are deleted chunk by chunk."""
+    from unittest.mock import patch
+
+    from jarvis.storage import get_connection
+    from jarvis.tools import memory
+
+    with get_connection() as conn:
+        conn.executemany(
+            "INSERT INTO memory (content, created_at) VALUES (?, datetime('now', '-40 days'))",
+            [(f"Old {i}",) for i in range(7)],
+        )
+        conn.execute("INSERT INTO memory (content) VALUES ('New')")
+        conn.commit()
+
+    with patch.object(memory, "_DELETE_CHUNK", 3):
+        result = await memory.forget_memory_before(30)
+
+    assert result == "Deleted 7 memories older than 30 days."
+    assert "total memories: 1" in (await memory.memory_stats()).lower()
+
 
 @pytest.mark.asyncio
 async def test_memory_stats_empty():
@@ -177,7 +321,31 @@ async def test_memory_stats():
 
     result = await memory_stats()
     assert "total memories: 3" in result.lower()
-    assert "work" in result.lower()
+    assert "work: 2, personal: 1" in result.lower()
+
+
+@pytest.mark.asyncio
+async def test_memory_stats_counters_follow_deletes():
+    """Test that the maintained counters track deletes and seeding."""
+    from jarvis.storage import close_connections, get_connection
+    from jarvis.tools.memory import forget_memory_by_tag, memory_stats, remember
+
+    await remember("Item 1", tags="work, urgent")
+    await remember("Item 2", tags="work")
+    await forget_memory_by_tag("urgent")
+
+    result = await memory_stats()
+    assert "total memories: 1" in result.lower()
+    assert "top tags: work: 1" in result.lower()
+    assert "urgent" not in result.lower()
+
+    # Reseeding from scratch gives the same counts
+    with get_connection() as conn:
+        conn.execute("DELETE FROM memory_counters")
+        conn.execute("PRAGMA user_version = 2")
+        conn.commit()
+    close_connections()
+    assert await memory_stats() == result
 
 
 @pytest.mark.asyncio
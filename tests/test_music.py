@@ -0,0 +1,306 @@
+"""Tests for music tools."""
+
+from __future__ import annotations
+
+import pytest
+
+
+class FakeYTMusic:
+    """Minimal stand-in for ytmusicapi.YTMusic that counts searches."""
+
+    def __init__(self, results=None):
+        self.calls = []
+        self.results = results or {}
+
+    def search(self, query, filter=None, limit=20):
+        self.calls.append((query, filter, limit))
+        return self.results.get(filter, [])
+
+
+@pytest.fixture
+def youtube():
+    """A YouTube Music controller backed by FakeYTMusic with an empty cache."""
+    from jarvis.tools import music
+
+    controller = music.YouTubeMusicController()
+    controller.yt = FakeYTMusic(
+        {"songs": [{"title": "Song", "videoId": "abc", "artists": [{"name": "Band"}]}]}
+    )
+    music._ytmusic_cache.clear()
+    yield controller
+    music._ytmusic_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_youtube_search_cached(youtube):
+    """Test that repeated queries reuse the cached ytmusicapi results."""
+    expected = ("https://music.youtube.com/watch?v=abc", "Song by Band")
+    assert await youtube.get_url("Song") == expected
+    assert await youtube.get_url("  song ") == expected
+    assert sorted(youtube.yt.calls, key=str) == sorted(
+        [("Song", "songs", 1), ("Song", "videos", 1), ("Song", None, 1)], key=str
+    )
+
+    await youtube.search("Song", "songs")
+    assert len(youtube.yt.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_youtube_search_cache_expires(youtube):
+    """Test that cached searches are repeated once the TTL has passed."""
+    from unittest.mock import patch
+
+    from jarvis.tools import music
+
+    await youtube.get_url("Song")
+    with patch.object(music.time, "monotonic", lambda: 10**9):
+        await youtube.get_url("Song")
+    assert len(youtube.yt.calls) == 6
+
+
+@pytest.mark.asyncio
+async def test_youtube_get_url_searches_filters_concurrently(youtube):
+    """Test that filter searches overlap and the first filter in priority order wins."""
+    import threading
+
+    barrier = threading.Barrier(3, timeout=2)
+    search = youtube.yt.search
+
+    def blocking_search(query, filter=None, limit=20):
+        barrier.wait()
+        return search(query, filter=filter, limit=limit)
+
+    youtube.yt.search = blocking_search
+    youtube.yt.results["videos"] = [{"title": "Video", "videoId": "xyz"}]
+    assert await youtube.get_url("Song") == (
+        "https://music.youtube.com/watch?v=abc", "Song by Band"
+    )
+
+
+@pytest.mark.asyncio
+async def test_youtube_get_url_reports_failures(youtube):
+    """Test that a failed ytmusicapi call is reported instead of raised."""
+    def failing_search(query, filter=None, limit=20):
+        raise RuntimeError("offline")
+
+    youtube.yt.search = failing_search
+    assert await youtube.get_url("Song") == (None, "YouTube Music search failed: offline")
+
+
+@pytest.mark.asyncio
+async def test_short_queries_skip_search(youtube):
+    """Test that empty or one-character queries never reach ytmusicapi."""
+    from jarvis.tools import music
+
+    assert await youtube.search(" a ") == "Please tell me what to search for."
+    assert await youtube.get_url("") == (None, "Please tell me what to play.")
+    assert await music.music_search(" ", provider="youtube") == (
+        "Please tell me what to search for."
+    )
+    assert youtube.yt.calls == []
+
+
+@pytest.fixture
+def itunes_transport():
+    """Route the shared iTunes client through a mock transport."""
+    from unittest.mock import patch
+
+    import httpx
+
+    from jarvis.tools import music
+
+    requests: list[httpx.Request] = []
+    responses: list[httpx.Response] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    music._catalog_cache.clear()
+    with patch.object(music, "_http_client", client):
+        yield requests, responses
+    music._catalog_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_catalog_search_cached_and_coalesced(itunes_transport):
+    """Test that identical catalog lookups share one request and its cached answer."""
+    import asyncio
+
+    import httpx
+
+    from jarvis.tools.music import apple_music
+
+    requests, responses = itunes_transport
+    responses.append(httpx.Response(200, json={"results": [{"trackName": "Yellow"}]}))
+
+    results = await asyncio.gather(
+        apple_music._catalog_search("Yellow", "track"),
+        apple_music._catalog_search("yellow ", "track"),
+    )
+    assert results == [({"trackName": "Yellow"}, None)] * 2
+    assert await apple_music._catalog_search("Yellow", "track") == ({"trackName": "Yellow"}, None)
+    assert len(requests) == 1
+    assert requests[0].url.params["entity"] == "musicTrack"
+
+
+@pytest.mark.asyncio
+async def test_catalog_search_errors_not_cached(itunes_transport):
+    """Test that failed lookups are retried on the next call."""
+    import httpx
+
+    from jarvis.tools.music import apple_music
+
+    requests, responses = itunes_transport
+    responses.append(httpx.Response(503))
+    responses.append(httpx.Response(200, json={"results": []}))
+
+    assert await apple_music._catalog_search("Coldplay", "artist") == (None, "error")
+    assert await apple_music._catalog_search("Coldplay", "artist") == (None, "not_found")
+    assert await apple_music._catalog_search("Coldplay", "artist") == (None, "not_found")
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_music_play_routes_query_kinds():
+    """Test that playlist, artist and album phrasing pick the right search."""
+    from unittest.mock import patch
+
+    from jarvis.tools import music
+
+    calls = []
+
+    async def fake_ensure():
+        return True
+
+    async def fake_playlist(name):
+        calls.append(("playlist", name))
+        return f"Playing playlist: {name}"
+
+    async def fake_catalog(query, search_type="track"):
+        calls.append((search_type, query))
+        return True, f"Playing {query}", None
+
+    async def fake_search(query, search_type):
+        return {}, None
+
+    with patch.object(music, "_ensure_music_running", fake_ensure), \
+            patch.object(music.apple_music, "play_playlist", fake_playlist), \
+            patch.object(music.apple_music, "_catalog_search", fake_search), \
+            patch.object(music.apple_music, "play_catalog", fake_catalog):
+        await music.music_play("my playlist: Chill")
+        await music.music_play("songs by Daft Punk")
+        await music.music_play("Album: Discovery")
+        await music.music_play("One More Time")
+
+    assert calls == [
+        ("playlist", "Chill"),
+        ("artist", "Daft Punk"),
+        ("album", "Discovery"),
+        ("track", "One More Time"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ensure_music_running_probes_with_pgrep():
+    """Test that a running Music app is detected without starting osascript."""
+    from unittest.mock import patch
+
+    from jarvis.tools import music
+
+    commands = []
+
+    async def fake_run_command(cmd, timeout, input_data=None):
+        commands.append(cmd)
+        return 0, "123"
+
+    async def no_applescript(script, timeout=15.0):
+        raise AssertionError("osascript should not be used for the probe")
+
+    with patch.object(music, "run_command", fake_run_command), \
+            patch.object(music, "_run_applescript", no_applescript):
+        assert await music._ensure_music_running()
+    assert commands == [["pgrep", "-x", "Music"]]
+
+
+@pytest.mark.asyncio
+async def test_music_play_overlaps_launch_and_lookup():
+    """Test that the catalog lookup runs while Music.app is still launching."""
+    import asyncio
+    import time
+    from unittest.mock import patch
+
+    from jarvis.tools import music
+
+    events = []
+
+    async def slow_ensure():
+        events.append("launch")
+        await asyncio.sleep(0.2)
+        events.append("launched")
+        return True
+
+    async def slow_search(query, search_type):
+        events.append("search")
+        await asyncio.sleep(0.2)
+        return {"trackName": query}, None
+
+    async def fake_catalog(query, search_type="track"):
+        events.append("play")
+        return True, f"Playing {query}", None
+
+    started = time.monotonic()
+    with patch.object(music, "_ensure_music_running", slow_ensure), \
+            patch.object(music.apple_music, "_catalog_search", slow_search), \
+            patch.object(music.apple_music, "play_catalog", fake_catalog):
+        assert await music.music_play("Yellow") == "Playing Yellow"
+
+    assert time.monotonic() - started < 0.35
+    assert events[:2] == ["launch", "search"]
+    assert events[-1] == "play"
+
+
+@pytest.mark.asyncio
+async def test_search_and_play_uses_library_search():
+    """Test that local fallback searches use Music's indexed library search."""
+    from unittest.mock import patch
+
+    from jarvis.tools import music
+
+    scripts = []
+
+    async def fake_applescript(script, timeout=15.0):
+        scripts.append(script)
+        return True, "Playing"
+
+    with patch.object(music, "_run_applescript", fake_applescript):
+        for search_type, kind in (("artist", "artists"), ("album", "albums"), ("track", "songs")):
+            await music.apple_music.search_and_play('Say "Hi"', search_type)
+            assert f'search library playlist 1 for "Say \\"Hi\\"" only {kind}' in scripts[-1]
+            assert "every track whose" not in scripts[-1]
+
+
+@pytest.mark.asyncio
+async def test_transport_commands_use_prebuilt_scripts():
+    """Test that volume, shuffle and repeat pick their precomputed AppleScript."""
+    from unittest.mock import patch
+
+    from jarvis.tools import music
+
+    scripts: list[str] = []
+
+    async def fake_applescript(script, timeout=15.0):
+        scripts.append(script)
+        return True, ""
+
+    with patch.object(music, "_run_applescript", fake_applescript):
+        assert await music.apple_music.set_volume(150) == "Volume set to 100%"
+        assert await music.apple_music.shuffle(False) == "Shuffle off"
+        assert await music.apple_music.repeat("song") == "Repeat set to one"
+
+    assert scripts == [
+        'tell application "Music" to set sound volume to 100',
+        'tell application "Music" to set shuffle enabled to false',
+        'tell application "Music" to set song repeat to one',
+    ]
@@ -133,3 +133,17 @@ async def test_get_note_tools():
     assert "add_note" in tool_names
     assert "list_notes" in tool_names
     assert "delete_note" in tool_names
+
+
+@pytest.mark.asyncio
+async def test_list_notes_truncates_preview():
+    """Test that long notes are previewed as 117 characters plus an ellipsis."""
+    from jarvis.tools.notes import add_note, list_notes
+
+    await add_note("Long", "x" * 121)
+    await add_note("Exact", "y" * 120)
+
+    result = await list_notes()
+    assert f"Long - {'x' * 117}..." in result
+    assert f"Exact - {'y' * 120}" in result
+    assert "y..." not in result
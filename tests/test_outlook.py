@@ -0,0 +1,201 @@
+"""Tests for Outlook integration helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+
+class FakeClientApp:
+    """Minimal stand-in for msal.PublicClientApplication."""
+
+    def __init__(self, expires_in=3600):
+        self.calls = 0
+        self.expires_in = expires_in
+        self.token_cache = None
+
+    def get_accounts(self):
+        return [{"username": "tony@stark.com"}]
+
+    def acquire_token_silent(self, scopes, account):
+        self.calls += 1
+        time.sleep(0.05)
+        result = {"access_token": f"token-{self.calls}"}
+        if self.expires_in is not None:
+            result["expires_in"] = self.expires_in
+        return result
+
+
+@pytest.fixture
+def fake_app():
+    """Patch MSAL so token acquisition hits a counting fake."""
+    import jarvis.integrations.outlook as outlook
+
+    app = FakeClientApp()
+    outlook._token_cache.clear()
+    with patch.object(outlook, "msal", object()), \
+            patch.object(outlook.config.outlook, "client_id", "client-id"), \
+            patch.object(outlook, "_get_client_app", lambda: app), \
+            patch.object(outlook, "_save_cache", lambda cache: None):
+        yield app
+    outlook._token_cache.clear()
+
+
+def test_acquire_access_token_cache_hit(fake_app):
+    """Test that a valid token is served from the cache."""
+    from jarvis.integrations.outlook import acquire_access_token
+
+    assert acquire_access_token() == ("token-1", "")
+    assert acquire_access_token() == ("token-1", "")
+    assert fake_app.calls == 1
+
+
+def test_acquire_access_token_refreshes_within_margin(fake_app):
+    """Test that tokens expiring within the refresh margin are re-acquired."""
+    from jarvis.integrations.outlook import acquire_access_token
+
+    fake_app.expires_in = 30
+    assert acquire_access_token() == ("token-1", "")
+    assert acquire_access_token() == ("token-2", "")
+    assert fake_app.calls == 2
+
+
+def test_acquire_access_token_without_expires_in(fake_app):
+    """Test that a result without expires_in is never cached."""
+    from jarvis.integrations.outlook import acquire_access_token
+
+    fake_app.expires_in = None
+    acquire_access_token()
+    acquire_access_token()
+    assert fake_app.calls == 2
+
+
+def test_invalidate_access_token(fake_app):
+    """Test that invalidating a token forces re-acquisition."""
+    from jarvis.integrations.outlook import acquire_access_token, invalidate_access_token
+
+    token, _ = acquire_access_token()
+    invalidate_access_token("some-other-token")
+    assert acquire_access_token() == (token, "")
+
+    invalidate_access_token(token)
+    assert acquire_access_token() == ("token-2", "")
+
+
+@pytest.mark.asyncio
+async def test_acquire_access_token_async_single_flight(fake_app):
+    """Test that concurrent callers share one token acquisition."""
+    from jarvis.integrations.outlook import acquire_access_token_async
+
+    results = await asyncio.gather(*(acquire_access_token_async() for _ in range(5)))
+    assert all(result == ("token-1", "") for result in results)
+    assert fake_app.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_graph_get_unauthorized_invalidates_token(fake_app):
+    """Test that a 401 from Graph drops the cached token."""
+    import httpx
+
+    from jarvis.integrations import outlook
+
+    token, _ = outlook.acquire_access_token()
+    transport = httpx.MockTransport(lambda request: httpx.Response(401, json={}))
+
+    with patch.object(outlook, "_http_client", httpx.AsyncClient(transport=transport)):
+        with pytest.raises(httpx.HTTPStatusError):
+            await outlook.graph_get(f"{outlook.GRAPH_BASE_URL}/me/events", token)
+
+    assert outlook.acquire_access_token() == ("token-2", "")
+
+
+@pytest.mark.asyncio
+async def test_graph_batch_chunks_requests():
+    """Test that $batch splits sub-requests into chunks of 20 and merges by id."""
+    import json
+
+    import httpx
+
+    from jarvis.integrations import outlook
+
+    sizes = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1.0/$batch"
+        chunk = json.loads(request.content)["requests"]
+        sizes.append(len(chunk))
+        return httpx.Response(
+            200, json={"responses": [{"id": item["id"], "status": 204} for item in chunk]}
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    requests = [{"id": str(i), "method": "DELETE", "url": f"/me/events/{i}"} for i in range(45)]
+    with patch.object(outlook, "_http_client", client):
+        responses = await outlook.graph_batch("token", requests)
+
+    assert sorted(sizes) == [5, 20, 20]
+    assert set(responses) == {str(i) for i in range(45)}
+
+
+@pytest.mark.asyncio
+async def test_outlook_create_events_reports_each_result():
+    """Test that bulk creation sends one batch and reports per-event outcomes."""
+    import json
+
+    from jarvis.tools import outlook_calendar
+
+    sent = []
+
+    async def fake_batch(token, requests):
+        sent.append(requests)
+        return {
+            "0": {"id": "0", "status": 201, "body": {"subject": "Standup"}},
+            "1": {"id": "1", "status": 400, "body": {"error": {"message": "Bad start"}}},
+        }
+
+    events = [
+        {"title": "Standup", "start_time": "2030-01-01T09:00:00Z"},
+        {"title": "Review", "start_time": "soon"},
+    ]
+    async def fake_token():
+        return "token", ""
+
+    with patch.object(outlook_calendar, "acquire_access_token_async", fake_token), \
+            patch.object(outlook_calendar, "graph_batch", fake_batch):
+        result = await outlook_calendar.outlook_create_events(json.dumps(events))
+
+    assert len(sent) == 1
+    assert sent[0][0]["method"] == "POST"
+    assert sent[0][0]["body"]["end"]["dateTime"] == "2030-01-01T09:30:00Z"
+    assert "Created 1 Outlook events: Standup" in result
+    assert "Failed to create: Review (Bad start)" in result
+
+
+@pytest.mark.asyncio
+async def test_outlook_tools_share_cached_token(fake_app):
+    """Test that Outlook tools reuse one cached token instead of calling MSAL each time."""
+    from jarvis.tools import outlook_calendar
+
+    async def fake_delete(url, token):
+        assert token == "token-1"
+
+    with patch.object(outlook_calendar, "graph_delete", fake_delete):
+        await outlook_calendar.outlook_delete_event("a")
+        await outlook_calendar.outlook_delete_event("b")
+
+    assert fake_app.calls == 1
+
+
+def test_calendar_urls_follow_calendar_id():
+    """Test that cached Graph URLs still track the configured calendar."""
+    from jarvis.tools import outlook_calendar
+
+    base = outlook_calendar.GRAPH_BASE_URL
+    assert outlook_calendar._calendar_view_url() == f"{base}/me/calendarView"
+    with patch.object(outlook_calendar.config.outlook, "calendar_id", "work"):
+        assert outlook_calendar._calendar_events_path() == "/me/calendars/work/events"
+        assert outlook_calendar._calendar_events_url() == f"{base}/me/calendars/work/events"
+    assert outlook_calendar._calendar_events_path() == "/me/events"
@@ -0,0 +1,135 @@
+"""Tests for routine automation tools."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_add_and_list_routines():
+    """Test saving a routine and listing it."""
+    from jarvis.tools.routines import add_routine, list_routines
+
+    actions = [{"type": "device_on", "entity_id": "light.office"}]
+    assert await add_routine("Morning", json.dumps(actions), "Lights on") == (
+        "Routine saved: Morning"
+    )
+
+    result = await list_routines()
+    assert "Morning - Lights on" in result
+
+
+@pytest.mark.asyncio
+async def test_add_routine_rejects_invalid_actions():
+    """Test that malformed action lists are refused."""
+    from jarvis.tools.routines import add_routine
+
+    assert (await add_routine("Bad", "{")).startswith("Invalid JSON")
+    assert await add_routine("Bad", "[]") == "Actions must be a non-empty list."
+    assert await add_routine("Bad", '[{"entity_id": "x"}]') == (
+        "Each action must include a 'type' field."
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_routine_runs_groups_concurrently():
+    """Test that actions between barriers overlap and results keep their order."""
+    import asyncio
+    from unittest.mock import patch
+
+    from jarvis.tools import routines
+
+    events = []
+
+    async def fake_execute(action, confirm):
+        events.append(("start", action["name"]))
+        await asyncio.sleep(0.01 if action["name"] == "a" else 0)
+        events.append(("end", action["name"]))
+        return action["name"]
+
+    actions = [
+        {"type": "open_app", "name": "a"},
+        {"type": "open_app", "name": "b"},
+        {"type": "open_app", "name": "c", "sequential": True},
+        {"type": "open_app", "name": "d"},
+    ]
+    await routines.add_routine("Batch", json.dumps(actions))
+    with patch.object(routines, "_execute_action", fake_execute):
+        result = await routines.run_routine("Batch", confirm=True)
+
+    assert result == "Routine complete:\na\nb\nc\nd"
+    # a and b overlap; c starts only after both finished, and d only after c
+    assert events[:2] == [("start", "a"), ("start", "b")]
+    assert events.index(("start", "c")) > events.index(("end", "a"))
+    assert events.index(("start", "d")) > events.index(("end", "c"))
+
+
+@pytest.mark.asyncio
+async def test_add_routine_stores_actions_verbatim():
+    """Test that validated actions are stored as given, not re-serialized."""
+    from jarvis.storage import get_connection
+    from jarvis.tools.routines import add_routine
+
+    actions_json = ' [ {"type": "wait", "seconds": 0} ] '
+    await add_routine("Pause", actions_json)
+
+    with get_connection() as conn:
+        row = conn.execute("SELECT actions_json FROM routines WHERE name = 'Pause'").fetchone()
+    assert row["actions_json"] == actions_json.strip()
+
+
+@pytest.mark.asyncio
+async def test_execute_action_dispatches_by_type():
+    """Test that actions reach their handler and unknown types are reported."""
+    from unittest.mock import patch
+
+    from jarvis.tools import routines
+
+    calls = []
+
+    async def fake_set_device_state(entity_id, state):
+        calls.append((entity_id, state))
+        return f"Set {entity_id} to {state}."
+
+    with patch.object(routines, "set_device_state", fake_set_device_state):
+        result = await routines._execute_action(
+            {"type": " Device_Off ", "entity_id": "light.desk"}, confirm=False
+        )
+    assert result == "Set light.desk to off."
+    assert calls == [("light.desk", "off")]
+    assert await routines._execute_action({"type": "dance"}, confirm=False) == (
+        "Unknown action type: dance"
+    )
+
+
+def test_action_groups_keep_dependent_actions_ordered():
+    """Test that shell commands and repeated entities are not run concurrently."""
+    from jarvis.tools.routines import _action_groups
+
+    actions = [
+        {"type": "device_on", "entity_id": "light.a"},
+        {"type": "device_on", "entity_id": "light.b"},
+        {"type": "toggle_device", "entity_id": "light.a"},
+        {"type": "shell_command", "command": "mkdir out"},
+        {"type": "shell_command", "command": "ls out"},
+        {"type": "shell_command", "command": "date", "sequential": False},
+        {"type": "open_app", "app_name": "Notes"},
+    ]
+    groups = _action_groups(actions)
+    assert [len(group) for group in groups] == [2, 1, 1, 1, 2]
+    assert groups[1] == [actions[2]]
+
+
+@pytest.mark.asyncio
+async def test_run_routine_reports_failing_actions():
+    """Test that one failing action is reported without aborting the others."""
+    from jarvis.tools import routines
+
+    actions = [{"type": "set_volume", "level": "loud"}, {"type": "wait", "seconds": 0}]
+    await routines.add_routine("Party", json.dumps(actions))
+    result = await routines.run_routine("Party", confirm=True)
+
+    assert "Action set_volume failed: invalid literal" in result
+    assert result.endswith("Waited 0.0 seconds.")
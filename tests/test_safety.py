@@ -0,0 +1,72 @@
+"""Tests for tool safety checks."""
+
+from __future__ import annotations
+
+
+def test_check_command_safety_blocks_dangerous_patterns():
+    """Test that dangerous patterns are caught regardless of case."""
+    from jarvis.tools.safety import check_command_safety
+
+    assert check_command_safety("SUDO reboot", confirm=True) == (
+        False, "Command blocked for safety: contains 'sudo'"
+    )
+    assert check_command_safety("chmod -R 777 /", confirm=True) == (
+        False, "Command blocked for safety: contains 'chmod -R 777'"
+    )
+    assert check_command_safety("ls -la", confirm=False) == (True, "Command allowed")
+
+
+def test_check_command_safety_allowed_prefixes_follow_config():
+    """Test that allowlist prefixes match case-insensitively and track config changes."""
+    from unittest.mock import patch
+
+    from jarvis.tools import safety
+
+    with patch.object(safety.config.safety, "require_confirmation", True), \
+            patch.object(safety.config.safety, "allowed_commands", ["Git Status"]):
+        assert safety.check_command_safety("git status -s", confirm=False) == (
+            True, "Command allowed"
+        )
+        assert not safety.check_command_safety("ls", confirm=False)[0]
+    assert safety.check_command_safety("LS", confirm=False) == (True, "Command allowed")
+
+
+def test_is_relative_to_respects_path_boundaries():
+    """Test that only the directory itself and paths below it count as inside."""
+    from pathlib import Path
+
+    from jarvis.tools.safety import _is_relative_to
+
+    parent = Path("/srv/data")
+    assert _is_relative_to(Path("/srv/data"), parent)
+    assert _is_relative_to(Path("/srv/data/a/b.txt"), parent)
+    assert not _is_relative_to(Path("/srv/database"), parent)
+    assert not _is_relative_to(Path("/srv"), parent)
+    assert _is_relative_to(Path("/etc/passwd"), Path("/"))
+
+
+def test_get_allowed_paths_resolved_once(tmp_path):
+    """Test that allowed paths are resolved once per configuration."""
+    from pathlib import Path
+    from unittest.mock import patch
+
+    from jarvis.tools import safety
+
+    calls = []
+    real_resolve = Path.resolve
+
+    def counting_resolve(self, *args, **kwargs):
+        calls.append(self)
+        return real_resolve(self, *args, **kwargs)
+
+    expected = [tmp_path.resolve()]
+    safety.invalidate_allowed_paths()
+    with patch.object(safety.config.safety, "allowed_paths", [str(tmp_path)]), \
+            patch.object(Path, "resolve", counting_resolve):
+        assert safety.get_allowed_paths() == expected
+        assert safety.get_allowed_paths() == expected
+        assert len(calls) == 1
+
+        safety.invalidate_allowed_paths()
+        safety.get_allowed_paths()
+        assert len(calls) == 2
@@ -0,0 +1,29 @@
+"""Tests for sandboxed command helpers."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_run_exec_stops_chatty_commands():
+    """Test that output past the limit stops the command instead of being buffered."""
+    from jarvis.tools.sandbox import _run_exec
+
+    script = "import sys, time\nwhile True:\n    sys.stdout.write('x' * 4096)\n"
+    output, code = await _run_exec([sys.executable, "-c", script], timeout_s=10, max_chars=100)
+    assert output == "x" * 100 + "\n... [output limit reached; command stopped]"
+    assert code == -1
+
+
+@pytest.mark.asyncio
+async def test_run_exec_merges_stderr():
+    """Test that stderr is captured alongside stdout with the exit code."""
+    from jarvis.tools.sandbox import _run_exec
+
+    script = "import sys\nprint('out')\nsys.stderr.write('err')\nsys.exit(3)\n"
+    output, code = await _run_exec([sys.executable, "-c", script], timeout_s=10)
+    assert output.split() == ["out", "err"]
+    assert code == 3
@@ -0,0 +1,70 @@
+"""Tests for Home Assistant tools."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def home_assistant():
+    """Point the Home Assistant tools at a fake server and a fresh client."""
+    from jarvis.tools import smart_home
+
+    with patch.object(smart_home.config.home_assistant, "url", "http://ha.local"), \
+            patch.object(smart_home.config.home_assistant, "token", "secret"), \
+            patch.object(smart_home, "_http_client", None):
+        yield smart_home
+
+
+@pytest.mark.asyncio
+async def test_client_sends_token_by_default(home_assistant):
+    """Test that the shared client carries the bearer token and is rebuilt when it changes."""
+    client = await home_assistant._get_client()
+    assert client.headers["Authorization"] == "Bearer secret"
+    assert await home_assistant._get_client() is client
+
+    with patch.object(home_assistant.config.home_assistant, "token", "rotated"):
+        rotated = await home_assistant._get_client()
+    assert rotated is not client
+    assert client.is_closed
+    assert rotated.headers["Authorization"] == "Bearer rotated"
+
+
+@pytest.mark.asyncio
+async def test_list_devices_filters_domain_in_home_assistant(home_assistant):
+    """Test that a domain filter is rendered server-side and falls back on failure."""
+    import json
+
+    import httpx
+
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/api/template":
+            template = json.loads(request.content)["template"]
+            if "states.light" in template:
+                assert "[:5]" in template
+                return httpx.Response(200, text="light.desk: on\n")
+            return httpx.Response(403)
+        return httpx.Response(
+            200, json=[{"entity_id": "switch.fan", "state": "off"}, {"entity_id": "light.x"}]
+        )
+
+    transport = httpx.MockTransport(handler)
+    real_client = httpx.AsyncClient
+    with patch.object(
+        home_assistant.httpx,
+        "AsyncClient",
+        lambda **kw: real_client(transport=transport, headers=kw["headers"]),
+    ):
+        assert await home_assistant.list_devices("light", limit=5) == (
+            "Devices:\nlight.desk: on"
+        )
+        assert await home_assistant.list_devices("switch") == "Devices:\nswitch.fan: off"
+
+    assert [request.url.path for request in requests] == [
+        "/api/template", "/api/template", "/api/states"
+    ]
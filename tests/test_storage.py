@@ -0,0 +1,64 @@
+"""Tests for local storage helpers."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+
+def test_schema_initialized_once_per_database():
+    """Test that only the first connection to a database runs the DDL pass."""
+    from jarvis import storage
+
+    calls = []
+    real_init_db = storage._init_db
+
+    def counting_init_db(conn):
+        calls.append(conn)
+        real_init_db(conn)
+
+    with patch.object(storage, "_init_db", counting_init_db):
+        with storage.get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        with storage.get_connection() as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            conn.execute("INSERT INTO notes (title, content) VALUES ('a', 'b')")
+
+    assert len(calls) == 1
+
+
+def test_connection_reused_per_thread():
+    """Test that a thread reuses its connection and other threads get their own."""
+    import threading
+
+    from jarvis import storage
+
+    first = storage.get_connection()
+    assert storage.get_connection() is first
+
+    others = []
+    thread = threading.Thread(target=lambda: others.append(storage.get_connection()))
+    thread.start()
+    thread.join()
+    assert others[0] is not first
+
+    storage.close_connections()
+    assert storage.get_connection() is not first
+
+
+def test_latest_by_key_queries_use_indexes():
+    """Test that routine lookups and task listings seek an index instead of sorting."""
+    from jarvis import storage
+
+    queries = [
+        ("SELECT id FROM routines WHERE name = ? ORDER BY created_at DESC LIMIT 1", ("x",)),
+        (
+            "SELECT id FROM tasks WHERE status = ? ORDER BY created_at DESC LIMIT ?",
+            ("open", 10),
+        ),
+    ]
+    with storage.get_connection() as conn:
+        for sql, params in queries:
+            plan = conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+            details = " ".join(row["detail"] for row in plan)
+            assert "INDEX idx_" in details
+            assert "TEMP B-TREE" not in details